@@ -0,0 +1,144 @@
+/**
+ * Load shared header, footer, and head content into pages.
+ * Sets current menu item based on location.pathname.
+ * Script must be loaded from inc/layout.js (path is derived from script src).
+ * Pages built by scripts/build_site.py already contain the three includes
+ * (containers marked data-prerendered, no #layout-head placeholder); for
+ * those nothing is fetched and only the menu, search and clock are set up.
+ */
+(function() {
+	var script = document.currentScript;
+	if (!script) return;
+	var base = script.src.replace(/\/[^/]*$/, '');
+	var headerEl = document.getElementById('layout-header');
+	var footerEl = document.getElementById('layout-footer');
+
+	// Determine base path for resources based on current page location
+	function getResourceBase() {
+		var path = location.pathname;
+		if (path.indexOf('/pages/') !== -1) {
+			return '../';
+		}
+		return '';
+	}
+
+	function norm(p) {
+		p = (p || '').toLowerCase().replace(/\/?index\.html$/i, '') || '/';
+		return p === '' ? '/' : p;
+	}
+
+	function setCurrentNav(container) {
+		if (!container) return;
+		var path = norm(location.pathname);
+		container.querySelectorAll('.menu a[href]').forEach(function(a) {
+			var href = a.getAttribute('href');
+			if (href.indexOf('://') !== -1) return;
+			var linkPath = norm(href);
+			var isCurrent = (path === linkPath) || (path === '/' && (linkPath === '/' || linkPath === ''));
+			// dataset-pages.html?name=xxx still counts as "datasets" section
+			if (!isCurrent && path.indexOf('dataset-pages.html') !== -1 && linkPath.indexOf('datasets') !== -1) isCurrent = true;
+			var li = a.closest('li');
+			if (li) {
+				if (isCurrent) {
+					li.classList.add('current-menu-item');
+					a.setAttribute('aria-current', 'page');
+				} else {
+					li.classList.remove('current-menu-item');
+					a.removeAttribute('aria-current');
+				}
+			}
+		});
+	}
+
+	function updateTopbarDateTime() {
+		var dateEl = document.getElementById('bloglo-date');
+		var timeEl = document.getElementById('bloglo-time');
+		if (!dateEl || !timeEl) return;
+		var d = new Date();
+		var pad = function(n) { return (n < 10 ? '0' : '') + n; };
+		dateEl.textContent = d.getFullYear() + '-' + pad(d.getMonth() + 1) + '-' + pad(d.getDate());
+		timeEl.textContent = pad(d.getHours()) + ':' + pad(d.getMinutes()) + ':' + pad(d.getSeconds());
+	}
+
+	// The search script and its index are only fetched once someone uses the search box.
+	function setupSearch(container) {
+		var input = container.querySelector('#site-search');
+		if (!input) return;
+		function loadSearch() {
+			input.removeEventListener('focus', loadSearch);
+			if (window.CityMindSearch) return;
+			var s = document.createElement('script');
+			s.src = base + '/search.js';
+			document.head.appendChild(s);
+		}
+		input.addEventListener('focus', loadSearch);
+	}
+
+	function isPrerendered(el) {
+		return !!el && el.hasAttribute('data-prerendered');
+	}
+
+	function setup(into) {
+		setCurrentNav(into);
+		if (into === headerEl) {
+			setupSearch(into);
+			updateTopbarDateTime();
+			setInterval(updateTopbarDateTime, 1000);
+		}
+	}
+
+	function inject(html, into) {
+		if (!into) return;
+		var wrap = document.createElement('div');
+		wrap.innerHTML = html.trim();
+		while (wrap.firstChild) into.appendChild(wrap.firstChild);
+		setup(into);
+	}
+
+	function injectHead(html) {
+		var head = document.head;
+		var resourceBase = getResourceBase();
+		var processedHtml = html.replace(/\{\{BASE\}\}/g, resourceBase);
+		var wrap = document.createElement('div');
+		wrap.innerHTML = processedHtml.trim();
+		while (wrap.firstChild) {
+			head.appendChild(wrap.firstChild);
+		}
+	}
+
+	function loadHead() {
+		var headPlaceholder = document.getElementById('layout-head');
+		if (!headPlaceholder) return Promise.resolve();
+		return fetch(base + '/head-common.html')
+			.then(function(r) { return r.ok ? r.text() : Promise.reject(); })
+			.then(function(html) {
+				injectHead(html);
+				if (headPlaceholder.parentNode) {
+					headPlaceholder.parentNode.removeChild(headPlaceholder);
+				}
+			})
+			.catch(function() { console.error('Failed to load head-common.html'); });
+	}
+
+	function load() {
+		if (isPrerendered(headerEl)) setup(headerEl);
+		if (isPrerendered(footerEl)) setup(footerEl);
+		var fetchHeader = headerEl && !isPrerendered(headerEl);
+		var fetchFooter = footerEl && !isPrerendered(footerEl);
+		if (!fetchHeader && !fetchFooter && !document.getElementById('layout-head')) return;
+		Promise.all([
+			fetchHeader ? fetch(base + '/header.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
+			fetchFooter ? fetch(base + '/footer.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
+			loadHead()
+		]).then(function(results) {
+			if (fetchHeader && results[0]) inject(results[0], headerEl);
+			if (fetchFooter && results[1]) inject(results[1], footerEl);
+		}).catch(function() {
+			if (fetchHeader) headerEl.innerHTML = '<p class="layout-load-error">Failed to load header.</p>';
+			if (fetchFooter) footerEl.innerHTML = '<p class="layout-load-error">Failed to load footer.</p>';
+		});
+	}
+
+	if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', load);
+	else load();
+})();
@@ -2,6 +2,9 @@
  * Load shared header, footer, and head content into pages.
  * Sets current menu item based on location.pathname.
  * Script must be loaded from inc/layout.js (path is derived from script src).
+ * Pages built by scripts/build_site.py already contain the three includes
+ * (containers marked data-prerendered, no #layout-head placeholder); for
+ * those nothing is fetched and only the menu, search and clock are set up.
  */
 (function() {
 	var script = document.currentScript;
@@ -57,18 +60,41 @@
 		timeEl.textContent = pad(d.getHours()) + ':' + pad(d.getMinutes()) + ':' + pad(d.getSeconds());
 	}
 
-	function inject(html, into) {
-		if (!into) return;
-		var wrap = document.createElement('div');
-		wrap.innerHTML = html.trim();
-		while (wrap.firstChild) into.appendChild(wrap.firstChild);
+	// The search script and its index are only fetched once someone uses the search box.
+	function setupSearch(container) {
+		var input = container.querySelector('#site-search');
+		if (!input) return;
+		function loadSearch() {
+			input.removeEventListener('focus', loadSearch);
+			if (window.CityMindSearch) return;
+			var s = document.createElement('script');
+			s.src = base + '/search.js';
+			document.head.appendChild(s);
+		}
+		input.addEventListener('focus', loadSearch);
+	}
+
+	function isPrerendered(el) {
+		return !!el && el.hasAttribute('data-prerendered');
+	}
+
+	function setup(into) {
 		setCurrentNav(into);
 		if (into === headerEl) {
+			setupSearch(into);
 			updateTopbarDateTime();
 			setInterval(updateTopbarDateTime, 1000);
 		}
 	}
 
+	function inject(html, into) {
+		if (!into) return;
+		var wrap = document.createElement('div');
+		wrap.innerHTML = html.trim();
+		while (wrap.firstChild) into.appendChild(wrap.firstChild);
+		setup(into);
+	}
+
 	function injectHead(html) {
 		var head = document.head;
 		var resourceBase = getResourceBase();
@@ -95,16 +121,21 @@
 	}
 
 	function load() {
+		if (isPrerendered(headerEl)) setup(headerEl);
+		if (isPrerendered(footerEl)) setup(footerEl);
+		var fetchHeader = headerEl && !isPrerendered(headerEl);
+		var fetchFooter = footerEl && !isPrerendered(footerEl);
+		if (!fetchHeader && !fetchFooter && !document.getElementById('layout-head')) return;
 		Promise.all([
-			headerEl ? fetch(base + '/header.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
-			footerEl ? fetch(base + '/footer.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
+			fetchHeader ? fetch(base + '/header.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
+			fetchFooter ? fetch(base + '/footer.html').then(function(r) { return r.ok ? r.text() : Promise.reject(); }) : Promise.resolve(''),
 			loadHead()
 		]).then(function(results) {
-			if (headerEl && results[0]) inject(results[0], headerEl);
-			if (footerEl && results[1]) inject(results[1], footerEl);
+			if (fetchHeader && results[0]) inject(results[0], headerEl);
+			if (fetchFooter && results[1]) inject(results[1], footerEl);
 		}).catch(function() {
-			if (headerEl) headerEl.innerHTML = '<p class="layout-load-error">Failed to load header.</p>';
-			if (footerEl) footerEl.innerHTML = '<p class="layout-load-error">Failed to load footer.</p>';
+			if (fetchHeader) headerEl.innerHTML = '<p class="layout-load-error">Failed to load header.</p>';
+			if (fetchFooter) footerEl.innerHTML = '<p class="layout-load-error">Failed to load footer.</p>';
 		});
 	}
 
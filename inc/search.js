@@ -0,0 +1,144 @@
+/**
+ * Site search over data/search-index.json (built by scripts/build_search_index.py).
+ * Loaded by inc/layout.js the first time the header search box gets focus.
+ * Every query token matches the index terms it prefixes; results must match
+ * all tokens and are ranked by the fields they matched in.
+ */
+(function() {
+	var INDEX_URL = '/data/search-index.json';
+	var LIMIT = 12;
+	// Posting field bits (see FIELD_BITS in the indexer) -> weight
+	var WEIGHTS = { 1: 8, 2: 4, 4: 2, 8: 1 };
+	var TYPE_LABELS = { publication: 'Publication', person: 'People', dataset: 'Dataset' };
+	// Not indexed (STOPWORDS in the indexer), so only used as a prefix of a word being typed.
+	var STOPWORDS = 'a an and are as at be by for from in is it its of on or that the this to we with'.split(' ');
+	var pending = null;
+
+	function load() {
+		if (!pending) {
+			pending = fetch(INDEX_URL)
+				.then(function(r) { return r.ok ? r.json() : Promise.reject(); })
+				.catch(function(e) { pending = null; throw e; });
+		}
+		return pending;
+	}
+
+	// Same normalization as tokenize() in the indexer: accent-folded, lowercase [a-z0-9] runs.
+	function tokenize(q) {
+		var text = String(q || '').normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+		return (text.match(/[a-z0-9]+/g) || []).filter(function(t, i, all) { return all.indexOf(t) === i; });
+	}
+
+	function lowerBound(terms, t) {
+		var lo = 0, hi = terms.length;
+		while (lo < hi) {
+			var mid = (lo + hi) >> 1;
+			if (terms[mid] < t) lo = mid + 1; else hi = mid;
+		}
+		return lo;
+	}
+
+	function weight(bits) {
+		var w = 0;
+		for (var b in WEIGHTS) if (bits & b) w += WEIGHTS[b];
+		return w;
+	}
+
+	// doc id -> best score among the terms that token prefixes (exact matches count double)
+	function matchToken(index, token) {
+		var hits = {};
+		for (var i = lowerBound(index.terms, token); i < index.terms.length && index.terms[i].lastIndexOf(token, 0) === 0; i++) {
+			var exact = index.terms[i].length === token.length ? 2 : 1;
+			var postings = index.postings[i];
+			for (var j = 0; j < postings.length; j++) {
+				var doc = postings[j] >> 4;
+				var s = weight(postings[j] & 15) * exact;
+				if (!(hits[doc] >= s)) hits[doc] = s;
+			}
+		}
+		return hits;
+	}
+
+	// doc id -> summed score over the docs that match every token
+	function rank(index, tokens) {
+		var scores = null;
+		for (var i = 0; i < tokens.length; i++) {
+			var hits = matchToken(index, tokens[i]);
+			if (scores === null) {
+				scores = hits;
+				continue;
+			}
+			var both = {};
+			for (var doc in scores) if (doc in hits) both[doc] = scores[doc] + hits[doc];
+			scores = both;
+		}
+		return scores || {};
+	}
+
+	function search(index, q, limit) {
+		var tokens = tokenize(q);
+		var words = tokens.filter(function(t) { return t.length > 1 && STOPWORDS.indexOf(t) === -1; });
+		var last = tokens[tokens.length - 1];
+		var scores = {};
+		// A trailing stopword or single letter may be the start of a word still being typed.
+		if (last && words.indexOf(last) === -1) scores = rank(index, words.concat([last]));
+		if (!Object.keys(scores).length) scores = rank(index, words);
+		return Object.keys(scores)
+			.sort(function(a, b) { return scores[b] - scores[a] || a - b; })
+			.slice(0, limit || LIMIT)
+			.map(function(doc) {
+				var d = index.docs[doc];
+				return { type: d[0], title: d[1], url: d[2], snippet: d[3], score: scores[doc] };
+			});
+	}
+
+	function esc(s) {
+		return String(s || '').replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+	}
+
+	function render(list, results, q) {
+		if (!q.trim()) {
+			list.hidden = true;
+			list.innerHTML = '';
+			return;
+		}
+		list.innerHTML = results.length ? results.map(function(r) {
+			var external = r.url.indexOf('://') !== -1 ? ' target="_blank" rel="noopener"' : '';
+			return '<li role="option" style="border-bottom:1px solid rgba(190,190,190,.3)"><a href="' + esc(r.url) + '"' + external + ' style="display:block;padding:0.8rem 1.2rem;text-decoration:none">' +
+				'<strong style="display:block;font-size:1.4rem">' + esc(r.title) + '</strong>' +
+				'<span style="display:block;font-size:1.2rem;color:#66717f">' + esc(TYPE_LABELS[r.type] || r.type) + (r.snippet ? ' · ' + esc(r.snippet) : '') + '</span></a></li>';
+		}).join('') : '<li style="padding:0.8rem 1.2rem;font-size:1.3rem;color:#66717f">No results</li>';
+		list.hidden = false;
+	}
+
+	function init() {
+		var input = document.getElementById('site-search');
+		var list = document.getElementById('site-search-results');
+		if (!input || !list || input.hasAttribute('data-search-ready')) return;
+		input.setAttribute('data-search-ready', '');
+		function update() {
+			var q = input.value;
+			load().then(function(index) {
+				if (input.value === q) render(list, search(index, q), q);
+			}).catch(function() {});
+		}
+		input.addEventListener('input', update);
+		input.addEventListener('focus', update);
+		input.addEventListener('keydown', function(e) {
+			if (e.key === 'Escape') { input.value = ''; render(list, [], ''); }
+			if (e.key === 'Enter') {
+				var first = list.querySelector('a');
+				if (first) first.click();
+			}
+		});
+		document.addEventListener('click', function(e) {
+			if (!input.parentNode.contains(e.target)) list.hidden = true;
+		});
+		load().catch(function() {});
+		if (input.value) update();
+	}
+
+	window.CityMindSearch = { load: load, search: search, tokenize: tokenize };
+	if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', init);
+	else init();
+})();
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Index of which files under imgs/ are referenced from where. Run from project root.
+
+One walk over the tree collects the assets (files under imgs/, except the
+generated imgs/derived/) and streams every text file (HTML, YAML, CSS, JS,
+JSON, Markdown) line by line looking for imgs/ references in any of the
+forms the site uses: /imgs/..., ../imgs/... and imgs/..., percent-encoded or
+not. All of them resolve to the same file under imgs/.
+
+The index is saved to .asset-index.json together with each scanned file's
+size and mtime, so the next run only re-reads files that changed. Other
+scripts can import AssetIndex; from the command line:
+
+    python scripts/asset_index.py                    # refresh, print a summary
+    python scripts/asset_index.py unused             # assets nothing references
+    python scripts/asset_index.py missing            # references to absent files
+    python scripts/asset_index.py referenced-by imgs/people/team.jpg
+    python scripts/asset_index.py refs pages/photos.html
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from urllib.parse import unquote
+
+ROOT = Path(__file__).resolve().parent.parent
+INDEX_FILE = ROOT / '.asset-index.json'
+VERSION = 2
+TEXT_EXTS = ('.html', '.htm', '.yaml', '.yml', '.css', '.js', '.json', '.md')
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+# Not scanned for references: vendored plugin code, generated derivatives,
+# test inputs (scripts/fixtures/) and build/ (the deploy manifest).
+SKIP_PREFIXES = ('wp-content/plugins/', 'imgs/derived/', 'scripts/fixtures/', 'build/')
+# Build manifests are not scanned as text (they \u-escape non-ASCII names);
+# every imgs/ path they list counts as referenced, since the build reads the
+# sources and the pages load the outputs.
+BUILD_MANIFESTS = ('asset-manifest.json', 'css/manifest.json')
+# An imgs/ path not preceded by a word character, dot, dash or slash (so
+# https://host/imgs/... on another site does not count), with any leading
+# ../, ./ or / prefix. Names may contain parentheses, e.g. HKUST(GZ).
+REF = re.compile(r'''(?<![\w./-])(?:\.\./|\./|/)*imgs/([^"'\s<>\\?#,]+)''')
+TEMPLATE_CHARS = set('*{}$')
+
+
+def strip_unbalanced(name):
+    """Cut a name at its first unmatched ')', i.e. the end of a CSS url(...)."""
+    depth = 0
+    for i, ch in enumerate(name):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            if not depth:
+                return name[:i]
+            depth -= 1
+    return name
+
+
+def scan_file(path):
+    """Return {asset: [line numbers]} for the imgs/ references in one text file."""
+    refs = {}
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for lineno, line in enumerate(f, 1):
+            if 'imgs/' not in line:
+                continue
+            for m in REF.finditer(line):
+                name = unquote(strip_unbalanced(m.group(1)).rstrip('.;:'))
+                if not name or TEMPLATE_CHARS & set(name):
+                    continue
+                refs.setdefault(f'imgs/{name}', []).append(lineno)
+    return refs
+
+
+def manifest_paths(data):
+    """Every imgs/ path among the keys and values of a parsed build manifest."""
+    if isinstance(data, dict):
+        return {p for k, v in data.items() for p in manifest_paths(k) | manifest_paths(v)}
+    if isinstance(data, list):
+        return {p for v in data for p in manifest_paths(v)}
+    return {data} if isinstance(data, str) and data.startswith('imgs/') else set()
+
+
+def scan_manifest(path):
+    """Return {asset: [line numbers]} for the imgs/ paths a build manifest lists."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        paths = manifest_paths(json.loads(text))
+    except ValueError:
+        return {}
+    lines = text.splitlines()
+    return {p: [next((n for n, line in enumerate(lines, 1) if json.dumps(p) in line), 1)] for p in sorted(paths)}
+
+
+class AssetIndex:
+    """Assets under imgs/ and the text files that reference them."""
+
+    def __init__(self, assets=(), files=None):
+        self.assets = set(assets)
+        # referrer -> {'size', 'mtime_ns', 'refs': {asset: [line numbers]}}
+        self.files = files or {}
+        self._referrers = None
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if data.get('version') != VERSION:
+            return cls()
+        return cls(data.get('assets', []), data.get('files', {}))
+
+    @classmethod
+    def build(cls, previous=None):
+        """Walk ROOT once; reuse previous results for files whose size and mtime are unchanged."""
+        previous = previous or cls()
+        assets, files = set(), {}
+        for dirpath, dirnames, filenames in os.walk(ROOT):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                rel = path.relative_to(ROOT).as_posix()
+                if rel.startswith('imgs/') and not rel.startswith('imgs/derived/'):
+                    assets.add(rel)
+                # Dotfiles are caches (this index, the build manifests).
+                if name.startswith('.') or not name.lower().endswith(TEXT_EXTS) or rel.startswith(SKIP_PREFIXES):
+                    continue
+                st = path.stat()
+                old = previous.files.get(rel)
+                if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+                    files[rel] = old
+                else:
+                    refs = scan_manifest(path) if rel in BUILD_MANIFESTS else scan_file(path)
+                    files[rel] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'refs': refs}
+        return cls(assets, files)
+
+    @classmethod
+    def refresh(cls, path=INDEX_FILE):
+        """Load the saved index, bring it up to date and save it again."""
+        index = cls.build(cls.load(path))
+        index.save(path)
+        return index
+
+    def save(self, path=INDEX_FILE):
+        data = {'version': VERSION, 'assets': sorted(self.assets), 'files': dict(sorted(self.files.items()))}
+        tmp = Path(path).with_name(Path(path).name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        tmp.replace(path)
+
+    @property
+    def referrers(self):
+        """asset -> {referrer: [line numbers]}"""
+        if self._referrers is None:
+            self._referrers = {}
+            for rel, entry in self.files.items():
+                for asset, lines in entry['refs'].items():
+                    self._referrers.setdefault(asset, {})[rel] = lines
+        return self._referrers
+
+    def referenced_by(self, asset):
+        return self.referrers.get(asset, {})
+
+    def references_in(self, rel):
+        return self.files.get(rel, {}).get('refs', {})
+
+    def unused(self):
+        return sorted(a for a in self.assets if a not in self.referrers)
+
+    def missing(self):
+        """{asset: {referrer: [line numbers]}} for references to files that do not exist."""
+        return {a: r for a, r in sorted(self.referrers.items()) if a not in self.assets and not a.startswith('imgs/derived/')}
+
+
+def print_locations(locations, indent='  ', file=None):
+    for rel, lines in sorted(locations.items()):
+        print(f'{indent}{rel}:{",".join(map(str, lines))}', file=file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('command', nargs='?', default='build', choices=['build', 'unused', 'missing', 'referenced-by', 'refs'])
+    parser.add_argument('paths', nargs='*', help='assets for referenced-by, referring files for refs')
+    args = parser.parse_args()
+
+    index = AssetIndex.refresh()
+    if args.command == 'build':
+        print(f'{len(index.assets)} assets, {len(index.files)} text files scanned, '
+              f'{len(index.unused())} unused, {len(index.missing())} missing -> {INDEX_FILE.name}')
+    elif args.command == 'unused':
+        for asset in index.unused():
+            print(asset)
+    elif args.command == 'missing':
+        missing = index.missing()
+        for asset, locations in missing.items():
+            print(asset)
+            print_locations(locations)
+        if missing:
+            sys.exit(1)
+    elif args.command == 'referenced-by':
+        for asset in args.paths:
+            print(asset)
+            print_locations(index.referenced_by(asset))
+    elif args.command == 'refs':
+        for rel in args.paths:
+            print(rel)
+            for asset, lines in sorted(index.references_in(rel).items()):
+                print(f'  {asset}:{",".join(map(str, lines))}{"" if asset in index.assets else "  (missing)"}')
+
+
+if __name__ == '__main__':
+    main()
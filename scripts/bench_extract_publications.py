@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming publications extractor against the BeautifulSoup one.
+Run from project root.
+Requires: pip install beautifulsoup4 pyyaml (lxml optional)
+
+Both extractors run on the given page and on a synthetic copy with every
+year tab repeated --scale times (titles made unique so nothing is
+deduplicated away). Each run must produce the same records, and the
+reference (legacy) run must find some, or the benchmark exits 1.
+Best-of---repeat wall times are printed, e.g.
+
+    python scripts/bench_extract_publications.py
+    python scripts/bench_extract_publications.py saved-publications.html --scale 10
+
+The default input is scripts/fixtures/publications.html: the publications
+tabs of the static page from before the pages were pre-rendered, cut down
+to 25 papers. The current pages/publications.html is rendered from
+publications.yaml and has no paper blocks to extract. Pages whose year
+tabs hold no paper blocks but whose category tabs do get those blocks
+moved into the year tabs first. That preparation is not timed.
+"""
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from extract_publications import ROOT, MAIN_TABS_ID, etree, extract
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    print("Run: pip install beautifulsoup4", file=sys.stderr)
+    sys.exit(1)
+
+
+def tabs(soup):
+    """(year tab contents, category tab contents) of the publications tabs."""
+    main_tabs = soup.find(id=MAIN_TABS_ID)
+    all_tab = main_tabs.find(attrs={'data-pub-filter': 'all'})
+    years = all_tab.select('.wp-block-themeisle-blocks-tabs__content > .wp-block-themeisle-blocks-tabs-item > .wp-block-themeisle-blocks-tabs-item__content')
+    cats = [t.find(class_='wp-block-themeisle-blocks-tabs-item__content')
+            for t in main_tabs.find_all(attrs={'data-pub-filter': True}) if t.get('data-pub-filter') != 'all']
+    return years, cats
+
+
+def with_year_blocks(html):
+    """html with the category tabs' paper blocks moved into the (empty) year tabs, one category per year."""
+    soup = BeautifulSoup(html, 'html.parser')
+    years, cats = tabs(soup)
+    for year, cat in zip(years, cats):
+        for child in list(cat.children):
+            year.append(child.extract())
+    return str(soup)
+
+
+def scaled(html, factor):
+    """html with each year tab's content repeated factor times, titles suffixed with the copy number."""
+    soup = BeautifulSoup(html, 'html.parser')
+    years, _ = tabs(soup)
+    for year in years:
+        children = list(year.children)
+        for k in range(2, factor + 1):
+            for child in children:
+                clone = copy.copy(child)
+                if hasattr(clone, 'select'):
+                    for strong in clone.select('.title strong'):
+                        strong.append(f' [{k}]')
+                year.append(clone)
+    return str(soup)
+
+
+def best_of(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('html', nargs='?', type=Path, default=ROOT / 'scripts' / 'fixtures' / 'publications.html')
+    parser.add_argument('--scale', type=int, default=10, help='size of the synthetic page, in copies of each year tab (default: 10)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    html = args.html.read_text(encoding='utf-8')
+    parsers = ['legacy', 'html.parser'] + (['lxml'] if etree is not None else [])
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / 'publications.html'
+        base.write_text(html, encoding='utf-8')
+        if not extract(base, 'legacy'):
+            base.write_text(with_year_blocks(html), encoding='utf-8')
+        big = Path(tmp) / f'publications-x{args.scale}.html'
+        big.write_text(scaled(base.read_text(encoding='utf-8'), args.scale), encoding='utf-8')
+
+        print(f'{"input":<22} {"parser":<12} {"records":>8} {"seconds":>9} {"speedup":>8}')
+        for label, path in (('input', base), (f'synthetic x{args.scale}', big)):
+            label = f'{label} ({path.stat().st_size / 1024:.0f} KB)'
+            reference = legacy_time = None
+            for name in parsers:
+                elapsed, records = best_of(lambda: extract(path, name), args.repeat)
+                if reference is None:
+                    reference, legacy_time = records, elapsed
+                    if not records:
+                        print(f'{label}: the {name} parser found no publications, nothing to compare', file=sys.stderr)
+                        sys.exit(1)
+                same = records == reference
+                failed |= not same
+                print(f'{label:<22} {name:<12} {len(records):>8} {elapsed:>9.3f} {legacy_time / elapsed:>7.1f}x'
+                      + ('' if same else '  RECORDS DIFFER'))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Measure what each page costs to load, offline, and fail when it regresses past the budget.
+Run from project root.
+Requires: pip install pyyaml (node on PATH optional, for JS parse times)
+
+The repository is served by a local HTTP server (127.0.0.1, random port)
+and index.html plus every pages/*.html is fetched through it, followed by
+the subresources a browser would request on load:
+
+  - stylesheets (incl. rel=preload), scripts, icons and images; <noscript>
+    content is skipped, and for a srcset the widest candidate up to
+    VIEWPORT_WIDTH is taken (the browser picks one);
+  - configs/*.yaml the page's inline scripts fetch, unless build_site.py
+    pre-rendered the region that config feeds.
+
+Nothing is fetched from other hosts. A resource on another host is read
+from its vendored copy, scripts/fixtures/<host>/<path> (e.g. the pinned
+cdnjs libraries), and measured like a local file, scripts compiled
+included; one without a copy counts as a request of 0 bytes and is listed
+as unsized. Per page this records
+
+    requests, bytes, gzip_bytes      everything above; gzip -6 for text types
+    blocking_requests/_bytes         stylesheets and sync scripts in <head>
+    js_bytes, js_parse_ms            node's vm.Script compile time, best of --repeat
+    yaml_bytes, yaml_nodes           node count as the parse cost estimate
+    image_bytes, largest_images      the five largest images
+
+Measurements are compared with perf-baseline.json using perf-budget.json:
+
+    {"version": 1,
+     "regression": {"bytes": "+5%", "requests": "+0", ...},   # allowed growth over the baseline
+     "limits": {"*": {"blocking_bytes": 65536}, "pages/people.html": {...}}}   # hard caps
+
+and the script exits 1 when a page is over either. js_parse_ms is only
+checked when the budget names it (timings vary between machines).
+
+    python scripts/bench_site.py                # measure and compare with the baseline
+    python scripts/bench_site.py --update       # measure and write the baseline
+    python scripts/bench_site.py --json out.json
+"""
+import argparse
+import functools
+import gzip
+import json
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote, urljoin, urlsplit
+
+from build_site import PAGES
+
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = ROOT / 'perf-baseline.json'
+BUDGET = ROOT / 'perf-budget.json'
+VERSION = 1
+PAGE_GLOBS = ('index.html', 'pages/*.html')
+VIEWPORT_WIDTH = 1280
+LARGEST_IMAGES = 5
+# Vendored copies of resources on other hosts, which are never fetched: <host>/<path>.
+VENDORED = ROOT / 'scripts' / 'fixtures'
+VENDORED_TYPES = {'.js': 'application/javascript', '.css': 'text/css'}
+TEXT_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml', 'application/yaml')
+ICON_RELS = {'icon', 'shortcut'}
+
+CONFIG_URL = re.compile(r'''['"](?:\.\./|/)?configs/([\w-]+\.yaml)['"]''')
+NODE_COMPILE = r'''
+const vm = require('vm');
+let input = '';
+process.stdin.on('data', d => { input += d; }).on('end', () => {
+  const { sources, repeat } = JSON.parse(input);
+  const out = sources.map(src => {
+    let best = null;
+    for (let k = 0; k < repeat; k++) {
+      const start = process.hrtime.bigint();
+      try { new vm.Script('//' + k + '\n' + src); } catch (e) { return null; }
+      const ms = Number(process.hrtime.bigint() - start) / 1e6;
+      best = best === null ? ms : Math.min(best, ms);
+    }
+    return best;
+  });
+  process.stdout.write(JSON.stringify(out));
+});
+'''
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class Resources(HTMLParser):
+    """Subresources a page requests on load, in document order: (kind, url, blocking)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = []
+        self.inline_scripts = []
+        self.in_head = True
+        self.noscript = 0
+        self.script = None
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == 'body':
+            self.in_head = False
+        if tag == 'noscript':
+            self.noscript += 1
+        if self.noscript:
+            return
+        if tag == 'link' and a.get('href'):
+            rels = set((a.get('rel') or '').lower().split())
+            if 'stylesheet' in rels:
+                media = (a.get('media') or 'all').lower()
+                self.found.append(('css', a['href'], self.in_head and media in ('all', 'screen', '')))
+            elif 'preload' in rels:
+                self.found.append(({'style': 'css', 'script': 'js', 'image': 'img'}.get(a.get('as'), a.get('as') or 'other'), a['href'], False))
+            elif rels & ICON_RELS:
+                self.found.append(('img', a['href'], False))
+        elif tag == 'script':
+            if a.get('src'):
+                sync = 'async' not in a and 'defer' not in a and a.get('type') != 'module'
+                self.found.append(('js', a['src'], self.in_head and sync))
+            elif a.get('type') in (None, '', 'text/javascript', 'module'):
+                self.script = []
+        elif tag == 'img':
+            url = pick_candidate(a.get('srcset')) or a.get('src')
+            if url and not url.startswith('data:'):
+                self.found.append(('img', url, False))
+        elif tag == 'source' and a.get('srcset') and a.get('type') in (None, 'image/avif', 'image/webp'):
+            # The first supported <source> wins over the <img> that follows it.
+            self.found.append(('picture', pick_candidate(a['srcset']), False))
+
+    def handle_endtag(self, tag):
+        if tag == 'noscript' and self.noscript:
+            self.noscript -= 1
+        elif tag == 'head':
+            self.in_head = False
+        elif tag == 'script' and self.script is not None:
+            self.inline_scripts.append(''.join(self.script))
+            self.script = None
+        elif tag == 'picture':
+            # Keep the first <source>, drop the rest and the fallback <img>.
+            chosen = None
+            for i in range(len(self.found) - 1, -1, -1):
+                if self.found[i][0] not in ('picture', 'img'):
+                    break
+                if self.found[i][0] == 'picture':
+                    chosen = i
+            if chosen is not None:
+                self.found[chosen:] = [('img', self.found[chosen][1], False)]
+
+    def handle_data(self, data):
+        if self.script is not None:
+            self.script.append(data)
+
+
+def pick_candidate(srcset):
+    """The widest srcset candidate up to VIEWPORT_WIDTH (else the narrowest), or None."""
+    if not srcset:
+        return None
+    candidates = []
+    for part in srcset.split(','):
+        bits = part.split()
+        if not bits:
+            continue
+        width = int(bits[1][:-1]) if len(bits) > 1 and bits[1].endswith('w') and bits[1][:-1].isdigit() else 0
+        candidates.append((width, bits[0]))
+    fitting = [c for c in candidates if c[0] <= VIEWPORT_WIDTH]
+    return (max(fitting) if fitting else min(candidates))[1] if candidates else None
+
+
+def page_files():
+    seen = []
+    for pattern in PAGE_GLOBS:
+        for path in sorted(ROOT.glob(pattern)):
+            rel = path.relative_to(ROOT).as_posix()
+            if rel not in seen:
+                seen.append(rel)
+    return seen
+
+
+def prerendered_configs(rel, html):
+    """Configs whose region build_site.py rendered into the page (so its script does not fetch them)."""
+    return {config for name, config, _ in PAGES.get(rel, []) if f'<!-- build:{name} -->' in html}
+
+
+def yaml_nodes(text):
+    def count(node):
+        if isinstance(node, yaml.MappingNode):
+            return 1 + sum(count(k) + count(v) for k, v in node.value)
+        if isinstance(node, yaml.SequenceNode):
+            return 1 + sum(count(v) for v in node.value)
+        return 1
+    node = yaml.compose(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    return count(node) if node is not None else 0
+
+
+class Fetcher:
+    """GETs from the local server, each URL once per run."""
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.cache = {}
+
+    def get(self, url):
+        """(status, content type, body) of a local URL."""
+        if url not in self.cache:
+            parts = urlsplit(url)
+            # Paths may hold non-ASCII file names (imgs/common/学校图-核心区1.jpg).
+            request = f'{parts.scheme}://{parts.netloc}{quote(unquote(parts.path))}'
+            try:
+                with urllib.request.urlopen(request, timeout=30) as r:
+                    self.cache[url] = (r.status, r.headers.get_content_type(), r.read())
+            except urllib.error.HTTPError as e:
+                self.cache[url] = (e.code, '', b'')
+        return self.cache[url]
+
+
+def gzip_size(ctype, body):
+    return len(gzip.compress(body, 6, mtime=0)) if ctype.startswith(TEXT_TYPES) else len(body)
+
+
+def vendored(url):
+    """Body of the vendored copy of an external URL, or None if there is none."""
+    parts = urlsplit(url)
+    path = VENDORED / parts.netloc / unquote(parts.path).lstrip('/')
+    return path.read_bytes() if parts.netloc and path.is_file() else None
+
+
+def measure_page(fetcher, rel):
+    """Metrics of one page, plus its JS sources (for compile timing) under '_js'."""
+    page_url = f'{fetcher.origin}/{rel}'
+    status, ctype, body = fetcher.get(page_url)
+    if status != 200:
+        raise RuntimeError(f'{rel}: HTTP {status}')
+    html = body.decode('utf-8')
+    parser = Resources()
+    parser.feed(html)
+    found = [(kind, url, blocking) for kind, url, blocking in parser.found]
+    skipped = prerendered_configs(rel, html)
+    for script in parser.inline_scripts:
+        for name in CONFIG_URL.findall(script):
+            if name not in skipped and ('yaml', f'/configs/{name}', False) not in found:
+                found.append(('yaml', f'/configs/{name}', False))
+
+    m = {
+        'requests': 1, 'bytes': len(body), 'gzip_bytes': gzip_size(ctype, body),
+        'blocking_requests': 0, 'blocking_bytes': 0, 'js_bytes': 0, 'js_parse_ms': None,
+        'yaml_bytes': 0, 'yaml_nodes': 0, 'image_bytes': 0, 'largest_images': [],
+        'blocking': [], 'missing': [], 'unsized': [],
+    }
+    js = list(parser.inline_scripts)
+    images = []
+    seen = set()
+    for kind, url, blocking in found:
+        absolute = urljoin(page_url, url)
+        if absolute in seen:
+            continue
+        seen.add(absolute)
+        m['requests'] += 1
+        if not absolute.startswith(fetcher.origin + '/'):
+            data = vendored(absolute)
+            if data is None:
+                m['unsized'].append(absolute)
+            size = len(data or b'')
+            m['bytes'] += size
+            m['gzip_bytes'] += gzip_size(VENDORED_TYPES.get(Path(urlsplit(absolute).path).suffix, ''), data or b'')
+        else:
+            status, ctype, data = fetcher.get(absolute.split('#')[0])
+            if status != 200:
+                m['missing'].append(f'{urlsplit(absolute).path} ({status})')
+                continue
+            size = len(data)
+            m['bytes'] += size
+            m['gzip_bytes'] += gzip_size(ctype, data)
+        shown = urlsplit(absolute).path if absolute.startswith(fetcher.origin) else absolute
+        if blocking:
+            m['blocking_requests'] += 1
+            m['blocking_bytes'] += size
+            m['blocking'].append(shown)
+        if kind == 'js':
+            m['js_bytes'] += size
+            if data is not None:
+                js.append(data.decode('utf-8', 'replace'))
+        elif kind == 'yaml':
+            m['yaml_bytes'] += size
+            m['yaml_nodes'] += yaml_nodes(data.decode('utf-8'))
+        elif kind == 'img':
+            m['image_bytes'] += size
+            images.append((size, shown))
+    m['largest_images'] = [[url, size] for size, url in sorted(images, reverse=True)[:LARGEST_IMAGES]]
+    m['_js'] = js
+    return m
+
+
+def compile_times(sources, repeat):
+    """Best-of-repeat vm.Script compile time (ms) per source, or None when node is not available."""
+    node = shutil.which('node')
+    if node is None or not sources:
+        return None
+    proc = subprocess.run([node, '-e', NODE_COMPILE], input=json.dumps({'sources': sources, 'repeat': repeat}),
+                          capture_output=True, text=True, encoding='utf-8')
+    if proc.returncode != 0:
+        print(f'node failed, no JS parse times: {proc.stderr.strip()[:200]}', file=sys.stderr)
+        return None
+    return json.loads(proc.stdout)
+
+
+def measure(repeat):
+    handler = functools.partial(QuietHandler, directory=str(ROOT))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        fetcher = Fetcher(f'http://127.0.0.1:{server.server_address[1]}')
+        pages = {rel: measure_page(fetcher, rel) for rel in page_files()}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    sources = sorted({src for m in pages.values() for src in m['_js']})
+    times = compile_times(sources, repeat)
+    for m in pages.values():
+        js = m.pop('_js')
+        if times is not None:
+            by_source = dict(zip(sources, times))
+            m['js_parse_ms'] = round(sum(by_source[src] or 0 for src in js), 2)
+    return pages
+
+
+def load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if data.get('version') == VERSION else None
+
+
+def allowed(base, rule):
+    """Ceiling for a metric given its baseline and a "+N" / "+N%" growth rule."""
+    rule = str(rule).strip().lstrip('+')
+    if rule.endswith('%'):
+        return base * (1 + float(rule[:-1]) / 100)
+    return base + float(rule)
+
+
+def violations(rel, m, baseline, budget):
+    """Budget failures of one page: [message]."""
+    out = []
+    limits = dict(budget.get('limits', {}).get('*', {}))
+    limits.update(budget.get('limits', {}).get(rel, {}))
+    for metric, cap in sorted(limits.items()):
+        if m.get(metric) is not None and m[metric] > cap:
+            out.append(f'{metric} {m[metric]} over the limit of {cap}')
+    base = (baseline or {}).get('pages', {}).get(rel)
+    if base:
+        for metric, rule in sorted(budget.get('regression', {}).items()):
+            if m.get(metric) is None or base.get(metric) is None:
+                continue
+            ceiling = allowed(base[metric], rule)
+            if m[metric] > ceiling:
+                out.append(f'{metric} {m[metric]} vs baseline {base[metric]} (allowed {rule})')
+    return out
+
+
+def kb(n):
+    return f'{n / 1024:.1f}'
+
+
+def report(pages, baseline):
+    base = (baseline or {}).get('pages', {})
+    print(f'{"page":<26} {"req":>4} {"KB":>8} {"gz KB":>7} {"block":>6} {"blk KB":>7} {"JS KB":>7} {"parse ms":>9} {"YAML KB":>8} {"img KB":>7}  delta KB')
+    for rel, m in pages.items():
+        delta = f'{(m["bytes"] - base[rel]["bytes"]) / 1024:+.1f}' if rel in base else 'new'
+        parse = '-' if m['js_parse_ms'] is None else f'{m["js_parse_ms"]:.1f}'
+        print(f'{rel:<26} {m["requests"]:>4} {kb(m["bytes"]):>8} {kb(m["gzip_bytes"]):>7} {m["blocking_requests"]:>6} '
+              f'{kb(m["blocking_bytes"]):>7} {kb(m["js_bytes"]):>7} {parse:>9} {kb(m["yaml_bytes"]):>8} {kb(m["image_bytes"]):>7}  {delta}')
+    for rel, m in pages.items():
+        for url in m['missing']:
+            print(f'{rel}: missing {url}', file=sys.stderr)
+    unsized = sorted({url for m in pages.values() for url in m['unsized']})
+    if unsized:
+        print(f'Unsized external resources, not vendored under {VENDORED.relative_to(ROOT).as_posix()}/ (counted as requests only): {", ".join(unsized)}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--update', action='store_true', help=f'write the measurements to {BASELINE.name}')
+    parser.add_argument('--json', type=Path, help='also write the measurements to this file')
+    parser.add_argument('--repeat', type=int, default=5, help='compile runs per script, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    pages = measure(args.repeat)
+    baseline = load_json(BASELINE)
+    report(pages, baseline)
+    data = {'version': VERSION, 'pages': pages}
+    if args.json:
+        args.json.write_text(json.dumps(data, indent=1) + '\n', encoding='utf-8')
+    if args.update:
+        with open(BASELINE, 'w', encoding='utf-8', newline='') as f:
+            f.write(json.dumps(data, indent=1) + '\n')
+        print(f'Wrote {BASELINE.name}')
+        return
+
+    budget = load_json(BUDGET) or {}
+    failed = False
+    for rel, m in pages.items():
+        for message in violations(rel, m, baseline, budget):
+            print(f'Over budget: {rel}: {message}')
+            failed = True
+    if baseline is None:
+        print(f'No {BASELINE.name} yet; run with --update to record one.')
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Content-hashed build manifest shared by the scripts in this directory.
+
+The manifest is a JSON file that remembers, per output, the sha256 of every
+input it was built from (config files, images, the generating script) and of
+the output itself. An output is fresh when it still has the recorded hash and
+none of its inputs changed. File hashes are memoised by (size, mtime) so an
+unchanged tree is checked with stat() calls only.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+VERSION = 1
+
+
+def sha256_file(path, chunk_size=1 << 16):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class BuildCache:
+    """Manifest of input hashes and dependency edges, keyed by root-relative paths."""
+
+    def __init__(self, path, root):
+        self.path = Path(path)
+        self.root = Path(root)
+        self.files = {}
+        self.outputs = {}
+        if self.path.is_file():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == VERSION:
+                self.files = data.get('files', {})
+                self.outputs = data.get('outputs', {})
+
+    def rel(self, path):
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.root)
+        return path.as_posix()
+
+    def hash(self, path):
+        """sha256 of a root-relative path, or None if it does not exist."""
+        rel = self.rel(path)
+        try:
+            st = (self.root / rel).stat()
+        except OSError:
+            self.files.pop(rel, None)
+            return None
+        entry = self.files.get(rel)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            return entry['sha256']
+        digest = sha256_file(self.root / rel)
+        self.files[rel] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def check(self, output, inputs=()):
+        """Return (fresh, reason) for output given its known inputs.
+
+        Inputs recorded by the previous build (e.g. images discovered while
+        rendering) are checked as well as the ones passed in.
+        """
+        output = self.rel(output)
+        entry = self.outputs.get(output)
+        if entry is None:
+            return False, 'no cache entry'
+        current = self.hash(output)
+        if current is None:
+            return False, 'output missing'
+        if current != entry['sha256']:
+            return False, 'output modified since last build'
+        recorded = entry['inputs']
+        added = sorted(set(map(self.rel, inputs)) - set(recorded))
+        if added:
+            return False, f'new input {added[0]}'
+        for rel, digest in sorted(recorded.items()):
+            now = self.hash(rel)
+            if now != digest:
+                return False, f'{rel} {"removed" if now is None else "changed"}'
+        return True, 'inputs unchanged'
+
+    def record(self, output, inputs):
+        self.outputs[self.rel(output)] = {
+            'sha256': self.hash(output),
+            'inputs': {self.rel(p): self.hash(p) for p in sorted(set(map(self.rel, inputs)))},
+        }
+
+    def forget(self, output):
+        self.outputs.pop(self.rel(output), None)
+
+    def save(self):
+        data = {'version': VERSION, 'files': dict(sorted(self.files.items())), 'outputs': dict(sorted(self.outputs.items()))}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+            f.write('\n')
+        tmp.replace(self.path)
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Split the shared stylesheets into per-page critical CSS and a pruned, deferred bundle.
+Run from project root, after scripts/build_site.py and scripts/fingerprint_assets.py.
+Requires: pip install lxml
+
+Every page links the same theme stylesheets through inc/head-common.html
+(bloglo style.css/style.min.css, Font Awesome all.min.css, blogmate
+style.css, the dynamic and widget styles): about 400 KB of render-blocking
+CSS, most of it for blocks, widgets and icons the site never shows. For each
+page in build_site.PAGES this script parses the built page and keeps only
+the rules with a selector that can match it:
+
+  - each compound selector (the parts between combinators) must match some
+    element; pseudo-classes, pseudo-elements and :not()/:is() arguments are
+    ignored, so :hover/:focus/::before rules of used elements are kept;
+  - classes, ids and attributes named in the page's scripts (inline and
+    local src) count as present, since the scripts toggle them;
+  - @media/@supports blocks keep their used rules, @font-face and
+    @keyframes are kept when a kept rule names the font or animation.
+
+The bundled stylesheets are split into runs: links with no <style> or
+other stylesheet between them in inc/head-common.html (the Essential Blocks
+and custom-background <style>s, for instance, sit between the theme
+stylesheets and otter-widgets-css). The used rules of each run, in their
+original order, are written to css/<page>-<n>.<hash>.css (url()s rebased,
+hash as in fingerprint_assets.py). The rules whose compounds all match an
+element above the fold -- the page's first --fold elements in document
+order, no layout engine involved -- are written to
+css/<page>-<n>.critical.css, with url()s as {{BASE}}-relative paths.
+css/manifest.json lists both per run, plus the ids of the <link> tags they
+replace; a run none of whose rules the page uses gets no files, only its
+link ids under "unused":
+
+    {"version": 3, "pages": {"index.html": [{"bundle": "css/index-1.0123456789.css",
+        "critical": "css/index-1.critical.css", "replaces": ["parent-style-css", ...]}, ...]},
+     "unused": {"pages/people.html": ["otter-widgets-css"]}}
+
+build_site.py then inlines each run's critical CSS as <style
+id="critical-css-<n>"> in place of the run's first stylesheet and loads its
+bundle with <link rel="preload" as="style" onload=...> at the same spot
+(plus a <noscript> fallback); the links of unused runs are removed. Every
+rule thus stays in its original position relative to the inline styles
+around it. This script refreshes the layout
+regions itself, so the pages are up to date when it finishes. Bytes saved
+are printed per page.
+
+    python scripts/build_css.py           # write bundles, critical CSS, manifest and pages
+    python scripts/build_css.py --check   # exit 1 if anything would change
+"""
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import PurePosixPath
+
+import build_site
+from build_site import LAYOUT_HEAD, PAGES, ROOT, read_text
+from fingerprint_assets import CSS_URL, HASH_LEN, TAG_ATTR, resolve, sha256_hex, split_url
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    print("Run: pip install lxml", file=sys.stderr)
+    sys.exit(1)
+
+OUT_DIR = 'css'
+MANIFEST = build_site.CSS_MANIFEST
+VERSION = build_site.CSS_MANIFEST_VERSION
+FOLD_ELEMENTS = 150
+# At-rules whose block holds rules (pruned recursively) rather than declarations.
+GROUP_RULES = ('@media', '@supports', '@document', '@-moz-document', '@layer', '@container')
+
+STYLESHEET = re.compile(r'<link\b[^>]*\brel="stylesheet"[^>]*>')
+HEAD_STYLE = re.compile(r'<style\b[^>]*>|<link\b[^>]*\brel="stylesheet"[^>]*>')
+SCRIPT = re.compile(r'<script\b([^>]*)>(.*?)</script>', re.S | re.I)
+WORD = re.compile(r'[A-Za-z_][\w-]*')
+COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+LICENSE = re.compile(r'\s*(/\*!.*?\*/)', re.S)
+IDENT = r'(?:\\[0-9a-fA-F]{1,6}\s?|\\.|[\w-]|[^\x00-\x7f])+'
+COMPOUND_PART = re.compile(
+    rf'(?P<tag>\*|{IDENT})|#(?P<id>{IDENT})|\.(?P<cls>{IDENT})|\[(?P<attr>[^\]]*)\]'
+    rf'|::?(?P<pseudo>{IDENT})(?:\((?:[^()]|\([^()]*\))*\))?|(?P<other>.)', re.S)
+ATTR = re.compile(r'''\s*(?:[\w-]*\|)?([\w-]+)\s*(?:([~|^$*]?=)\s*("[^"]*"|'[^']*'|[^\s\]]+)\s*([iIsS])?)?\s*$''')
+ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6})\s?|\\(.)', re.S)
+FONT_FAMILY = re.compile(r'font-family\s*:\s*([^;}]+)', re.I)
+FONT_VALUE = re.compile(r'(?<![\w-])font(?:-family)?\s*:\s*([^;}]+)', re.I)
+ANIMATION = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)', re.I)
+CUSTOM_PROPERTY = re.compile(r'(?<![\w-])--[\w-]+\s*:\s*([^;}]+)')
+
+
+def unescape(ident):
+    return ESCAPE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), ident)
+
+
+def skip_string(css, i):
+    """Index just past the string literal starting at css[i]."""
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == '\\' else 1
+    return i + 1
+
+
+def split_top(text, seps):
+    """Split text at the characters in seps that are outside strings, () and []."""
+    parts, depth, start, i = [], 0, 0, 0
+    while i < len(text):
+        c = text[i]
+        if c in '"\'':
+            i = skip_string(text, i)
+            continue
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == '\\':
+            i += 1
+        elif depth == 0 and c in seps:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def parse(css, i=0):
+    """Nodes of css from i to the end of the enclosing block, and the index after it.
+
+    A node is ('rule', selectors, declarations), ('group', prelude, [nodes]),
+    ('block', prelude, body) for other at-rules with a block, or
+    ('statement', text, None) for @charset/@import and the like.
+    """
+    nodes, start = [], i
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            i = skip_string(css, i)
+            continue
+        if c == ';':
+            if css[start:i].strip():
+                nodes.append(('statement', css[start:i].strip(), None))
+            start = i = i + 1
+        elif c == '}':
+            return nodes, i + 1
+        elif c == '{':
+            prelude = css[start:i].strip()
+            if prelude.lower().startswith(GROUP_RULES):
+                children, i = parse(css, i + 1)
+                nodes.append(('group', prelude, children))
+            else:
+                body_start, depth = i + 1, 1
+                while depth:
+                    i += 1
+                    if i >= len(css):
+                        break
+                    if css[i] in '"\'':
+                        i = skip_string(css, i) - 1
+                    elif css[i] == '{':
+                        depth += 1
+                    elif css[i] == '}':
+                        depth -= 1
+                nodes.append(('block' if prelude.startswith('@') else 'rule', prelude, css[body_start:i].strip()))
+                i += 1
+            start = i
+        else:
+            i += 1
+    return nodes, i
+
+
+def serialize(nodes, sep='\n'):
+    out = []
+    for kind, prelude, body in nodes:
+        if kind == 'statement':
+            out.append(prelude + ';')
+        elif kind == 'group':
+            out.append(prelude + '{' + serialize(body, '') + '}')
+        else:
+            out.append(prelude + '{' + body + '}')
+    return sep.join(out)
+
+
+def compounds(selector):
+    """Compound selectors of a complex selector, combinators dropped."""
+    return [c for part in split_top(selector.strip(), ' \t\n>+~') if (c := part.strip())]
+
+
+def parse_compound(compound):
+    """(tag, ids, classes, attribute tests) of a compound selector, pseudo-classes dropped;
+    None if it uses syntax this matcher does not know (treated as matching).
+    """
+    tag, ids, classes, attrs = None, [], [], []
+    for m in COMPOUND_PART.finditer(compound):
+        if m.group('other') is not None:
+            return None
+        if m.group('tag') and m.start() == 0:
+            tag = None if m.group('tag') == '*' else unescape(m.group('tag')).lower()
+        elif m.group('tag'):
+            return None
+        elif m.group('id'):
+            ids.append(unescape(m.group('id')))
+        elif m.group('cls'):
+            classes.append(unescape(m.group('cls')))
+        elif m.group('attr') is not None:
+            a = ATTR.match(m.group('attr'))
+            if not a:
+                return None
+            value = a.group(3)
+            if value and value[0] in '"\'':
+                value = value[1:-1]
+            attrs.append((a.group(1).lower(), a.group(2), unescape(value) if value else value, (a.group(4) or '').lower() == 'i'))
+    return tag, ids, classes, attrs
+
+
+def attr_matches(el, name, op, value, fold):
+    actual = el.get(name)
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if fold:
+        actual, value = actual.lower(), value.lower()
+    if op == '=':
+        return actual == value
+    if op == '~=':
+        return value in actual.split()
+    if op == '|=':
+        return actual == value or actual.startswith(value + '-')
+    if op == '^=':
+        return bool(value) and actual.startswith(value)
+    if op == '$=':
+        return bool(value) and actual.endswith(value)
+    return bool(value) and value in actual
+
+
+class Elements:
+    """Elements of a page (or of its part above the fold), indexed for compound selector matching.
+
+    Names in tokens (the words of the page's scripts) are assumed to be set
+    by a script at some point, so they never rule a selector out.
+    """
+
+    def __init__(self, elements, tokens=frozenset()):
+        self.elements = elements
+        self.tokens = tokens
+        self.by_tag, self.by_id, self.by_class = {}, {}, {}
+        for el in elements:
+            self.by_tag.setdefault(el.tag, []).append(el)
+            if el.get('id'):
+                self.by_id.setdefault(el.get('id'), []).append(el)
+            for c in set((el.get('class') or '').split()):
+                self.by_class.setdefault(c, []).append(el)
+        self.memo = {}
+
+    def has(self, compound):
+        """True if some element may match the compound selector."""
+        if compound not in self.memo:
+            parsed = parse_compound(compound)
+            self.memo[compound] = parsed is None or self.match(*parsed)
+        return self.memo[compound]
+
+    def match(self, tag, ids, classes, attrs):
+        ids = [i for i in ids if i not in self.tokens]
+        classes = [c for c in classes if c not in self.tokens]
+        attrs = [a for a in attrs if a[0] not in self.tokens]
+        any_tag = tag is None or tag in self.tokens
+        if not (ids or classes or attrs):
+            return any_tag or tag in self.by_tag
+        if ids:
+            candidates = self.by_id.get(ids[0], [])
+        elif classes:
+            candidates = self.by_class.get(classes[0], [])
+        else:
+            candidates = self.elements if any_tag else self.by_tag.get(tag, [])
+        for el in candidates:
+            if not any_tag and el.tag != tag:
+                continue
+            if ids and any(el.get('id') != i for i in ids):
+                continue
+            if classes and not set(classes) <= set((el.get('class') or '').split()):
+                continue
+            if all(attr_matches(el, *a) for a in attrs):
+                return True
+        return False
+
+    def used(self, selector):
+        return all(self.has(c) for c in compounds(selector))
+
+
+def prune(nodes, doc):
+    """Nodes with the rules no element of doc can match removed (@font-face/@keyframes handled by prune_unreferenced)."""
+    out = []
+    for kind, prelude, body in nodes:
+        if kind == 'rule':
+            kept = [s.strip() for s in split_top(prelude, ',') if doc.used(s)]
+            if kept:
+                out.append((kind, ','.join(kept), body))
+        elif kind == 'group':
+            children = prune(body, doc)
+            if children:
+                out.append((kind, prelude, children))
+        else:
+            out.append((kind, prelude, body))
+    return out
+
+
+def walk(nodes):
+    for node in nodes:
+        yield node
+        if node[0] == 'group':
+            yield from walk(node[2])
+
+
+def at_name(prelude):
+    return prelude.split(None, 1)[0].lower()
+
+
+def references(sheets):
+    """(font text, animation names) the rules of these stylesheets refer to.
+
+    Custom property values count as well, since a var() may pass a font or
+    animation name on (the theme sets --bloglo-font-awesome).
+    """
+    fonts, animations = [], []
+    for nodes in sheets:
+        for kind, _, body in walk(nodes):
+            if kind == 'rule':
+                fonts += [m.group(1).lower() for m in FONT_VALUE.finditer(body)]
+                animations += [m.group(1) for m in ANIMATION.finditer(body)]
+                fonts += [m.group(1).lower() for m in CUSTOM_PROPERTY.finditer(body)]
+                animations += [m.group(1) for m in CUSTOM_PROPERTY.finditer(body)]
+    return ' '.join(fonts), set(WORD.findall(' '.join(animations)))
+
+
+def prune_unreferenced(nodes, refs):
+    """Drop @font-face and @keyframes rules whose name is not in refs (see references()), then empty groups."""
+    fonts, animation_names = refs
+
+    def keep(node):
+        kind, prelude, body = node
+        if kind == 'block' and at_name(prelude) == '@font-face':
+            m = FONT_FAMILY.search(body)
+            return not m or m.group(1).strip().strip('\'"').lower() in fonts
+        if kind == 'block' and at_name(prelude).endswith('keyframes'):
+            parts = prelude.split(None, 1)
+            return len(parts) < 2 or parts[1].strip().strip('\'"') in animation_names
+        return True
+
+    def strip(items):
+        out = []
+        for node in items:
+            if node[0] == 'group':
+                children = strip(node[2])
+                if children:
+                    out.append((node[0], node[1], children))
+            elif keep(node):
+                out.append(node)
+        return out
+
+    return strip(nodes)
+
+
+def rebase(css, source, prefix):
+    """css from file source with its local url()s made root-relative, behind prefix ('../' or '{{BASE}}')."""
+    def url(m):
+        quote, target = m.group(1), m.group(2)
+        path = resolve(source, target)
+        if path is None:
+            return m.group(0)
+        return f'url({quote}{prefix}{path}{split_url(target)[1]}{quote})'
+
+    return CSS_URL.sub(url, css)
+
+
+def read_stylesheet(source):
+    """(license comment or '', nodes) of a stylesheet, comments and @charset dropped."""
+    css = read_text(source)
+    m = LICENSE.match(css)
+    nodes, _ = parse(COMMENT.sub(lambda m: m.group(1) or '', css))
+    nodes = [n for n in nodes if not (n[0] == 'statement' and at_name(n[1]) == '@charset')]
+    return (m.group(1) if m else ''), nodes
+
+
+def bundled_stylesheets():
+    """(link id, root-relative path) of the local stylesheets inc/head-common.html links, in order."""
+    out = []
+    for tag in STYLESHEET.findall(read_text(LAYOUT_HEAD)):
+        attrs = dict(TAG_ATTR.findall(tag))
+        path = resolve(LAYOUT_HEAD, attrs.get('href', ''))
+        if attrs.get('id') and path and attrs.get('media', 'all') in ('all', '') and (ROOT / path).is_file():
+            out.append((attrs['id'], path))
+    return out
+
+
+def own_stylesheets(rel, page, stylesheets):
+    """The stylesheets the page links itself, outside the layout head; build_site leaves those out of it."""
+    own = re.sub(r'<!-- build:layout-head -->\n.*?<!-- /build:layout-head -->', '', page, flags=re.S)
+    keys = set()
+    for m in build_site.ASSET_TAG.finditer(own):
+        keys |= build_site.asset_keys(rel, m.group(0))
+    return [(i, path) for i, path in stylesheets if f'#{i}' in keys or path in keys]
+
+
+def script_tokens(rel, page):
+    """Words of the page's inline scripts and of the local scripts it loads."""
+    text = []
+    for m in SCRIPT.finditer(page):
+        attrs = dict(TAG_ATTR.findall(m.group(1)))
+        if attrs.get('src'):
+            path = resolve(rel, attrs['src'])
+            if path and (ROOT / path).is_file():
+                text.append(read_text(path))
+        else:
+            text.append(m.group(2))
+    return frozenset(WORD.findall('\n'.join(text)))
+
+
+def page_elements(page):
+    """(all elements, body elements in document order) of a page."""
+    root = lxml_html.document_fromstring(page)
+    elements = [el for el in root.iter() if isinstance(el.tag, str)]
+    body = root.find('body')
+    return elements, [el for el in body.iter() if isinstance(el.tag, str)] if body is not None else []
+
+
+def stylesheet_runs():
+    """{link id: run number} for bundled_stylesheets(). A run is a series of
+    bundled links with no <style> or other stylesheet between them in
+    inc/head-common.html, so one bundle at the first link's place keeps the
+    cascade order.
+    """
+    bundled = {i for i, _ in bundled_stylesheets()}
+    runs, run, previous = {}, 0, None
+    for m in HEAD_STYLE.finditer(read_text(LAYOUT_HEAD)):
+        i = dict(TAG_ATTR.findall(m.group(0))).get('id') if m.group(0).startswith('<link') else None
+        if i in bundled:
+            run += previous not in bundled
+            runs[i] = run
+        previous = i
+    return runs
+
+
+def bundle_page(rel, page, stylesheets, fold):
+    """[(bundle css, critical css)] for a page, one pair per stylesheet."""
+    elements, body = page_elements(page)
+    used = Elements(elements, script_tokens(rel, page))
+    above = Elements(elements[:elements.index(body[0])] + body[:fold] if body else elements)
+    sheets = [(source,) + read_stylesheet(source) for _, source in stylesheets]
+    kept = [prune(nodes, used) for _, _, nodes in sheets]
+    refs = references(kept)
+    kept = [prune_unreferenced(nodes, refs) for nodes in kept]
+    first = [prune(nodes, above) for nodes in kept]
+    refs = references(first)
+    first = [prune_unreferenced(nodes, refs) for nodes in first]
+    out = []
+    for (source, license, _), nodes, first_nodes in zip(sheets, kept, first):
+        out.append((
+            (license + '\n' if license else '') + rebase(serialize(nodes), source, '../') if nodes else '',
+            rebase(serialize(first_nodes), source, '{{BASE}}') if first_nodes else '',
+        ))
+    return out
+
+
+def page_name(rel):
+    return PurePosixPath(rel).stem
+
+
+def kb(n):
+    return f'{n / 1024:.1f} KB'
+
+
+def gz(text):
+    return len(gzip.compress(text.encode('utf-8'), 9, mtime=0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fold', type=int, default=FOLD_ELEMENTS, help=f'elements counted as above the fold, in document order (default: {FOLD_ELEMENTS})')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any bundle, critical CSS, page or the manifest is out of date, write nothing')
+    args = parser.parse_args()
+
+    shared = bundled_stylesheets()
+    runs = stylesheet_runs()
+    outputs = {}
+    manifest, unused = {}, {}
+    for rel in PAGES:
+        page = read_text(rel)
+        own = own_stylesheets(rel, page, shared)
+        stylesheets = [s for s in shared if s not in own]
+        original = ''.join(read_text(source) for _, source in stylesheets)
+        parts = bundle_page(rel, page, stylesheets, args.fold)
+        name = page_name(rel)
+        manifest[rel] = []
+        for run in sorted({runs[i] for i, _ in stylesheets}):
+            members = [k for k, (i, _) in enumerate(stylesheets) if runs[i] == run]
+            if not any(parts[k][0] for k in members):
+                unused.setdefault(rel, []).extend(stylesheets[k][0] for k in members)
+                continue
+            n = len(manifest[rel]) + 1
+            bundle = '\n'.join(parts[k][0] for k in members if parts[k][0]) + '\n'
+            critical = '\n'.join(parts[k][1] for k in members if parts[k][1]) + '\n'
+            bundle_path = f'{OUT_DIR}/{name}-{n}.{sha256_hex(bundle.encode("utf-8"))[:HASH_LEN]}.css'
+            critical_path = f'{OUT_DIR}/{name}-{n}.critical.css'
+            outputs[bundle_path] = bundle
+            outputs[critical_path] = critical
+            manifest[rel].append({'bundle': bundle_path, 'critical': critical_path, 'replaces': [stylesheets[k][0] for k in members]})
+        bundle = ''.join(outputs[entry['bundle']] for entry in manifest[rel])
+        critical = ''.join(outputs[entry['critical']] for entry in manifest[rel])
+        print(f'{rel}: {kb(len(original))} blocking ({kb(gz(original))} gz) -> {kb(len(critical))} critical inline'
+              f' + {kb(len(bundle))} deferred in {len(manifest[rel])} bundle(s) ({kb(gz(bundle))} gz); saved {kb(len(original) - len(bundle))}'
+              f' ({1 - len(bundle) / len(original):.0%}), {kb(len(original) - len(critical))} no longer blocks rendering')
+
+    text = json.dumps({'version': VERSION, 'pages': manifest, 'unused': unused}, indent=1) + '\n'
+    old_manifest = MANIFEST.read_text(encoding='utf-8') if MANIFEST.is_file() else None
+    written = [path for path, css in outputs.items() if not (ROOT / path).is_file() or read_text(path) != css]
+    # css/ only holds this script's output; anything not written this run is left over.
+    stale = sorted(f'{OUT_DIR}/{p.name}' for p in (ROOT / OUT_DIR).glob('*.css') if f'{OUT_DIR}/{p.name}' not in outputs) if (ROOT / OUT_DIR).is_dir() else []
+
+    if args.check:
+        # Only meaningful once the manifest is current; otherwise that is reported already.
+        pages = [rel for rel in PAGES if build_site.inline_layout(rel, read_text(rel)) != read_text(rel)]
+        for path in written + stale + pages + ([MANIFEST.relative_to(ROOT).as_posix()] if old_manifest != text else []):
+            print(f'Out of date: {path}')
+        if written or stale or pages or old_manifest != text:
+            sys.exit(1)
+        return
+
+    (ROOT / OUT_DIR).mkdir(exist_ok=True)
+    for path in written:
+        with open(ROOT / path, 'w', encoding='utf-8', newline='') as f:
+            f.write(outputs[path])
+        print(f'Wrote {path}')
+    for path in stale:
+        (ROOT / path).unlink()
+        print(f'Removed {path}')
+    if old_manifest != text:
+        with open(MANIFEST, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        print(f'Wrote {MANIFEST.relative_to(ROOT).as_posix()}')
+    build_site.css_bundles.cache_clear()
+    for rel in PAGES:
+        old = read_text(rel)
+        new = build_site.inline_layout(rel, old)
+        if new != old:
+            with open(ROOT / rel, 'w', encoding='utf-8', newline='') as f:
+                f.write(new)
+            print(f'Rewrote {rel}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Generate responsive derivatives (width variants, WebP and AVIF encodings) of
+the images under imgs/publications, imgs/people and imgs/datasets, and write
+imgs/derived/manifest.json describing them.
+Run from project root, before scripts/build_site.py: the renderers read the
+manifest and emit <picture>/srcset markup that points at the real variants.
+Requires: pip install pillow
+
+The site is served from the committed tree (GitHub Pages, no deploy build),
+so imgs/derived/ is committed with the pages that reference it; rerun this
+and commit the result whenever an image under those directories changes.
+To keep that small, each directory only gets the widths it is displayed at
+(WIDTHS, up to about 2x) and only the modern encodings: the <img> inside the
+<picture> keeps the original file as its fallback. Photos are not derived:
+the gallery shows the thumbnails from scripts/build_photo_thumbs.py and
+opens the original.
+
+Sources whose sha256 matches the manifest and whose variants all exist are
+skipped, so reruns only encode new or changed images. Work is spread over a
+process pool (--jobs).
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from build_cache import sha256_file
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    print("Run: pip install pillow", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+IMGS = ROOT / 'imgs'
+DERIVED = IMGS / 'derived'
+MANIFEST = DERIVED / 'manifest.json'
+SOURCE_DIRS = ('publications', 'people', 'datasets')
+SOURCE_EXTS = ('.jpg', '.jpeg', '.png', '.webp')
+# Variant widths per directory: publication thumbnails and avatars are shown
+# at 160-320px, dataset cards at up to 400px.
+WIDTHS = {'publications': (300, 768), 'people': (300, 768), 'datasets': (300, 768, 1024)}
+# format -> (file extension, Pillow save options)
+ENCODINGS = {
+    'avif': ('.avif', {'quality': 55, 'speed': 6}),
+    'webp': ('.webp', {'quality': 78, 'method': 6}),
+}
+
+
+def target_widths(rel, width):
+    """The directory's widths below the source width, plus the source width capped at the largest."""
+    widths = WIDTHS[Path(rel).parts[1]]
+    out = [w for w in widths if w < width]
+    out.append(min(width, widths[-1]))
+    return sorted(set(out))
+
+
+def output_formats():
+    formats = ['webp']
+    if features.check('avif'):
+        formats.insert(0, 'avif')
+    return formats
+
+
+def variant_path(rel, width, fmt):
+    """Keeps the source extension in the name: x.jpg and x.png may both exist."""
+    rel = Path(rel)
+    stem = re.sub(r'[\s,]+', '-', rel.stem)
+    sub = rel.parent.relative_to('imgs')
+    return (Path('imgs') / 'derived' / sub / f'{stem}-{rel.suffix[1:].lower()}-{width}w{ENCODINGS[fmt][0]}').as_posix()
+
+
+def expected_variants(rel, width, formats):
+    return {fmt: [[variant_path(rel, w, fmt), w] for w in target_widths(rel, width)] for fmt in formats}
+
+
+def derive(rel, digest):
+    """Encode every variant of one source image. Runs in a worker process."""
+    with Image.open(ROOT / rel) as im:
+        im = ImageOps.exif_transpose(im)
+        width, height = im.size
+        formats = output_formats()
+        variants = expected_variants(rel, width, formats)
+        for fmt, entries in variants.items():
+            ext, options = ENCODINGS[fmt]
+            for out_rel, w in entries:
+                h = max(1, round(height * w / width))
+                resized = im if w == width else im.resize((w, h), Image.LANCZOS)
+                if resized.mode not in ('RGB', 'RGBA'):
+                    resized = resized.convert('RGBA' if 'A' in resized.getbands() or 'transparency' in resized.info else 'RGB')
+                out = ROOT / out_rel
+                out.parent.mkdir(parents=True, exist_ok=True)
+                tmp = out.with_name(out.name + '.tmp')
+                resized.save(tmp, format=fmt.upper(), **options)
+                tmp.replace(out)
+    return rel, {'sha256': digest, 'width': width, 'height': height, 'variants': variants}
+
+
+def is_current(rel, entry, digest):
+    if not entry or entry.get('sha256') != digest:
+        return False
+    if entry['variants'] != expected_variants(rel, entry['width'], output_formats()):
+        return False
+    return all((ROOT / p).is_file() for entries in entry['variants'].values() for p, _ in entries)
+
+
+def list_sources(dirs):
+    for d in dirs:
+        for f in sorted((IMGS / d).rglob('*')):
+            if f.is_file() and f.suffix.lower() in SOURCE_EXTS:
+                yield f.relative_to(ROOT).as_posix()
+
+
+def load_manifest():
+    if not MANIFEST.is_file():
+        return {}
+    with open(MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dirs', nargs='*', default=list(SOURCE_DIRS), help=f'subdirectories of imgs/ (default: {" ".join(SOURCE_DIRS)})')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='re-encode every image')
+    args = parser.parse_args()
+    for d in set(args.dirs) - set(SOURCE_DIRS):
+        parser.error(f'{d} is not one of: {" ".join(SOURCE_DIRS)}')
+
+    manifest = load_manifest()
+    sources = list(list_sources(args.dirs))
+    todo = []
+    for rel in sources:
+        digest = sha256_file(ROOT / rel)
+        if args.force or not is_current(rel, manifest.get(rel), digest):
+            todo.append((rel, digest))
+
+    failed = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(derive, rel, digest): rel for rel, digest in todo}
+            for n, future in enumerate(as_completed(futures), 1):
+                rel = futures[future]
+                try:
+                    _, entry = future.result()
+                except Exception as e:
+                    print(f'Failed {rel}: {e}', file=sys.stderr)
+                    failed.append(rel)
+                    continue
+                manifest[rel] = entry
+                print(f'[{n}/{len(todo)}] {rel}')
+
+    # Drop entries whose source is gone or no longer derived; keep entries of directories not selected this run.
+    selected = tuple(f'imgs/{d}/' for d in args.dirs)
+    derived = tuple(f'imgs/{d}/' for d in SOURCE_DIRS)
+    present = set(sources)
+    manifest = {k: v for k, v in sorted(manifest.items()) if k.startswith(derived) and (not k.startswith(selected) or k in present)}
+    DERIVED.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST, 'w', encoding='utf-8', newline='') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    # imgs/derived/ is committed: remove the variants no entry lists any more.
+    keep = {p for entry in manifest.values() for entries in entry['variants'].values() for p, _ in entries}
+    removed = 0
+    for f in sorted(DERIVED.rglob('*')):
+        if f.is_file() and f != MANIFEST and f.relative_to(ROOT).as_posix() not in keep:
+            f.unlink()
+            removed += 1
+    print(f'{len(todo) - len(failed)} encoded, {len(sources) - len(todo)} up to date, {removed} stale variant(s) removed, {len(failed)} failed')
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
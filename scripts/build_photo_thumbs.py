@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Generate gallery thumbnails and blur-up placeholders for configs/photos.yaml and record them in it.
+Run from project root, before scripts/build_site.py.
+Requires: pip install pillow pyyaml
+
+For every image of every album this writes a THUMB_WIDTH-wide WebP
+thumbnail to imgs/thumbs/ (mirroring the source's path under imgs/) and
+adds four fields to the image's entry in photos.yaml:
+
+    - src: '../imgs/photos/2024-08-KDD-2024-Barcelona-Spain-1.jpg'
+      width: 1024                  # intrinsic size of src (EXIF-rotated)
+      height: 768
+      thumb: '../imgs/thumbs/photos/2024-08-KDD-2024-Barcelona-Spain-1.webp'
+      lqip: 'data:image/webp;base64,...'   # LQIP_WIDTH-wide, ~150 bytes
+
+The gallery shows the thumbnail over the inlined placeholder, at the real
+aspect ratio, and links it to src, so the full image is only downloaded when
+a photo is opened. The fields are rewritten in place under each `- src:`
+line; the rest of the file (comments, quoting, order) is left alone, and
+entries added by hand only need src.
+
+Thumbnails are not packed into per-album sprite sheets: the gallery crops
+each photo into a responsive flex cell (object-fit: cover), which a
+background-position sprite cannot do, and the pages are served over HTTP/2.
+
+The sha256 of each source is kept in .photo-thumbs-cache.json with what was
+derived from it, so reruns only open new or changed photos. Thumbnails no
+entry refers to any more are removed. Work is spread over a process pool.
+
+    python scripts/build_photo_thumbs.py           # write thumbnails, update photos.yaml
+    python scripts/build_photo_thumbs.py --check   # exit 1 if anything would change
+"""
+import argparse
+import base64
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from build_cache import sha256_file
+
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    print("Run: pip install pillow", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG = ROOT / 'configs' / 'photos.yaml'
+THUMBS = ROOT / 'imgs' / 'thumbs'
+CACHE_FILE = ROOT / '.photo-thumbs-cache.json'
+VERSION = 1
+THUMB_WIDTH = 480    # about the 400px gallery cell, the full image is a click away
+THUMB_OPTIONS = {'quality': 72, 'method': 6}
+LQIP_WIDTH = 16      # upscaled by the browser, which blurs it
+LQIP_OPTIONS = {'quality': 40, 'method': 6}
+FIELDS = ('width', 'height', 'thumb', 'lqip')
+SRC_LINE = re.compile(r'^( *)- src: *(.+?)\s*$')
+
+
+def source_path(src):
+    """imgs/... path of an entry's src (relative to pages/, or root-absolute), None if remote."""
+    src = str(src or '').split('?')[0]
+    if not src or re.match(r'[a-z][a-z0-9+.-]*:|//', src):
+        return None
+    path = ROOT / src.lstrip('/') if src.startswith('/') else (ROOT / 'pages' / src).resolve()
+    return path.relative_to(ROOT).as_posix()
+
+
+def thumb_path(rel):
+    return (Path('imgs') / 'thumbs' / Path(rel).relative_to('imgs')).with_suffix('.webp').as_posix()
+
+
+def thumb_src(src, rel):
+    """URL of the thumbnail of rel, in the prefix style of src (../imgs/... or /imgs/...)."""
+    src = str(src)
+    return src[:src.find('imgs/')] + thumb_path(rel)
+
+
+def encode(im, width, options):
+    small = im.resize((width, max(1, round(im.height * width / im.width))), Image.LANCZOS)
+    out = io.BytesIO()
+    small.save(out, format='WEBP', **options)
+    return out.getvalue()
+
+
+def derive(rel, digest):
+    """Size, placeholder and thumbnail bytes of one photo. Runs in a worker process."""
+    with Image.open(ROOT / rel) as im:
+        im = ImageOps.exif_transpose(im).convert('RGB')
+        width, height = im.size
+        thumb = encode(im, min(THUMB_WIDTH, width), THUMB_OPTIONS)
+        lqip = 'data:image/webp;base64,' + base64.b64encode(encode(im, LQIP_WIDTH, LQIP_OPTIONS)).decode('ascii')
+    return {'sha256': digest, 'width': width, 'height': height, 'lqip': lqip}, thumb
+
+
+def load_cache():
+    if not CACHE_FILE.is_file():
+        return {}
+    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('photos', {}) if data.get('version') == VERSION else {}
+
+
+def enrich(text, fields):
+    """photos.yaml text with the FIELDS lines under each `- src:` line replaced by fields[src]."""
+    lines = text.splitlines(keepends=True)
+    out, i = [], 0
+    while i < len(lines):
+        line = lines[i]
+        out.append(line)
+        i += 1
+        m = SRC_LINE.match(line)
+        if not m:
+            continue
+        indent = m.group(1) + '  '
+        generated = re.compile(rf'{indent}(?:{"|".join(FIELDS)}):')
+        while i < len(lines) and generated.match(lines[i]):
+            i += 1
+        values = fields.get(yaml.safe_load(m.group(2)))
+        if values:
+            out += [f'{indent}{key}: {values[key]}\n' for key in FIELDS]
+    return ''.join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='re-encode every photo')
+    parser.add_argument('--check', action='store_true', help='exit 1 if a thumbnail or photos.yaml is out of date, write nothing')
+    args = parser.parse_args()
+
+    with open(CONFIG, 'r', encoding='utf-8') as f:
+        text = f.read()
+    cfg = yaml.safe_load(text) or {}
+    sources, missing = {}, []
+    for album in cfg.get('albums') or []:
+        for img in album.get('images') or []:
+            rel = source_path(img.get('src'))
+            if rel is None:
+                continue
+            if not (ROOT / rel).is_file():
+                missing.append(img['src'])
+                continue
+            sources[img['src']] = rel
+
+    cache = {} if args.force else load_cache()
+    todo, stale = {}, []
+    for rel in sorted(set(sources.values())):
+        digest = sha256_file(ROOT / rel)
+        entry = cache.get(rel)
+        if not entry or entry['sha256'] != digest or not (ROOT / thumb_path(rel)).is_file():
+            todo[rel] = digest
+
+    failed = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(derive, rel, digest): rel for rel, digest in todo.items()}
+            for n, future in enumerate(as_completed(futures), 1):
+                rel = futures[future]
+                try:
+                    entry, thumb = future.result()
+                except Exception as e:
+                    print(f'Failed {rel}: {e}', file=sys.stderr)
+                    failed.append(rel)
+                    continue
+                cache[rel] = entry
+                out = ROOT / thumb_path(rel)
+                if out.is_file() and out.read_bytes() == thumb:
+                    continue
+                stale.append(thumb_path(rel))
+                if not args.check:
+                    out.parent.mkdir(parents=True, exist_ok=True)
+                    out.write_bytes(thumb)
+                    print(f'[{n}/{len(todo)}] {thumb_path(rel)}')
+
+    fields = {}
+    for src, rel in sources.items():
+        if rel in cache:
+            entry = cache[rel]
+            fields[src] = {'width': entry['width'], 'height': entry['height'], 'thumb': f"'{thumb_src(src, rel)}'", 'lqip': f"'{entry['lqip']}'"}
+    new = enrich(text, fields)
+    wanted = {thumb_path(rel) for rel in sources.values()}
+    orphans = sorted(p.relative_to(ROOT).as_posix() for p in THUMBS.rglob('*.webp') if p.relative_to(ROOT).as_posix() not in wanted) if THUMBS.is_dir() else []
+
+    for src in missing:
+        print(f'Missing image: {src}', file=sys.stderr)
+    if args.check:
+        for path in stale + (['configs/photos.yaml'] if new != text else []) + orphans:
+            print(f'Out of date: {path}')
+        if stale or new != text or orphans or failed:
+            sys.exit(1)
+        print(f'Up to date: {len(wanted)} thumbnail(s)')
+        return
+
+    for path in orphans:
+        (ROOT / path).unlink()
+        print(f'Removed {path}')
+    if new != text:
+        with open(CONFIG, 'w', encoding='utf-8', newline='') as f:
+            f.write(new)
+        print('Wrote configs/photos.yaml')
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': VERSION, 'photos': dict(sorted(cache.items()))}, f, indent=1)
+        f.write('\n')
+    print(f'{len(todo) - len(failed)} encoded, {len(wanted) - len(todo)} up to date, {len(failed)} failed')
+    if failed or missing:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
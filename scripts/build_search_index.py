@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Build the site search index (data/search-index.json) from configs/*.yaml.
+Run from project root.
+Requires: pip install pyyaml
+
+Indexes publications (title, authors, venue, categories), people (name,
+research, degree, group) and datasets (title, summary and the Markdown
+content of dataset-pages.yaml) into a compact inverted index that
+inc/search.js queries in the browser:
+
+    docs      [[type, title, url, snippet], ...]
+    terms     sorted token list; a query token matches every term it prefixes
+    postings  per term, [doc << 4 | field bits, ...] (bits: FIELD_BITS)
+
+Tokens are lowercased, accent-folded runs of [a-z0-9]; inc/search.js
+tokenizes queries the same way. The index is only rebuilt when one of its
+configs (or this script, or publication_tabs.py) changed since the last
+build, using the same manifest as build_site.py (.build-cache.json);
+--force rebuilds anyway.
+"""
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from build_cache import BuildCache
+from publication_tabs import PUB_CATEGORIES
+
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIGS = ROOT / 'configs'
+OUTPUT = ROOT / 'data' / 'search-index.json'
+CACHE_FILE = ROOT / '.build-cache.json'
+SOURCES = ('publications.yaml', 'people.yaml', 'datasets.yaml', 'dataset-pages.yaml')
+VERSION = 1
+# Field -> bit in a posting; inc/search.js weights them title > people > meta > body.
+FIELD_BITS = {'title': 1, 'people': 2, 'meta': 4, 'body': 8}
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'its',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'we', 'with',
+}
+PUB_CATEGORY_LABELS = dict(PUB_CATEGORIES)
+# people.yaml card sections -> label shown in results
+PEOPLE_GROUPS = {
+    'postdoc': 'Postdoc', 'phd_students': 'PhD Student', 'mphil_students': 'MPhil Student',
+    'research_assistant': 'Research Assistant', 'research_interns': 'Research Intern',
+}
+TAG = re.compile(r'<[^>]+>')
+MD_LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+URL = re.compile(r'https?://\S+')
+FENCE = re.compile(r'^```.*?^```', re.M | re.S)
+
+
+def tokenize(text):
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return [t for t in re.findall(r'[a-z0-9]+', text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def plain(text):
+    """Markdown/HTML to the words a reader sees: no tags, link targets, URLs or code blocks."""
+    text = FENCE.sub(' ', str(text or ''))
+    text = MD_LINK.sub(r'\1', text)
+    return URL.sub(' ', TAG.sub(' ', text))
+
+
+def load_config(name):
+    with open(CONFIGS / name, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def as_list(value):
+    return value if isinstance(value, list) else []
+
+
+def publication_docs(pubs):
+    for pub in as_list(pubs):
+        cats = pub.get('categories') or ['others']
+        cats = cats if isinstance(cats, list) else [cats]
+        venue = re.sub(r'\s*(PDF|CODE|DATASET)\s*$', '', pub.get('venue') or '', flags=re.I).strip()
+        yield {
+            'type': 'publication',
+            'title': pub.get('title') or '',
+            'url': pub.get('link') or pub.get('pdf_link') or '/pages/publications.html',
+            'snippet': f'{pub.get("authors") or ""} · {venue}'.strip(' ·'),
+            'fields': {
+                'title': pub.get('title'),
+                'people': pub.get('authors'),
+                'meta': ' '.join([venue, str(pub.get('year') or '')] + [f'{c} {PUB_CATEGORY_LABELS.get(c, "")}' for c in cats]),
+            },
+        }
+
+
+def person_docs(cfg):
+    if not isinstance(cfg, dict):
+        return
+    director = cfg.get('lab_director')
+    if isinstance(director, dict):
+        yield {
+            'type': 'person',
+            'title': director.get('name') or '',
+            'url': '/pages/people.html',
+            'snippet': plain(director.get('title')).replace('**', '').strip(),
+            'fields': {'title': director.get('name'), 'meta': plain(director.get('title')), 'body': plain(director.get('description'))},
+        }
+    for group, p in people_entries(cfg):
+        if not isinstance(p, dict) or not p.get('name'):
+            continue
+        # Cards have research/degree_from, alumni and collaborators affiliation/note.
+        details = [plain(p.get(k)).strip() for k in ('research', 'affiliation', 'degree_from', 'note', 'period') if p.get(k)]
+        yield {
+            'type': 'person',
+            'title': p['name'],
+            'url': p.get('link') or '/pages/people.html',
+            'snippet': ' · '.join([group] + details[:1]),
+            'fields': {'title': p['name'], 'meta': ' '.join([group] + details)},
+        }
+
+
+def people_entries(cfg):
+    """(group label, person) for the card sections, alumni lists and outside collaborators."""
+    for key, group in PEOPLE_GROUPS.items():
+        for p in as_list(cfg.get(key)):
+            yield group, p
+    alumni = cfg.get('alumni')
+    for items in (alumni.values() if isinstance(alumni, dict) else []):
+        for p in as_list(items):
+            yield 'Alumni', p
+    outside = cfg.get('outside_collaborators')
+    for p in as_list(outside.get('list') if isinstance(outside, dict) else None):
+        yield 'Collaborator', p
+
+
+def dataset_docs(datasets, pages):
+    content = {p.get('id'): p for p in as_list(pages) if isinstance(p, dict)}
+    for d in as_list(datasets):
+        page = content.get(d.get('id'), {})
+        yield {
+            'type': 'dataset',
+            'title': d.get('title') or page.get('title') or '',
+            'url': d.get('link') or f'/pages/dataset-pages.html?name={d.get("id")}',
+            'snippet': d.get('summary') or page.get('summary') or '',
+            'fields': {
+                'title': d.get('title') or page.get('title'),
+                'meta': d.get('summary') or page.get('summary'),
+                'body': plain(page.get('content')),
+            },
+        }
+
+
+def build_index(configs):
+    docs = list(publication_docs(configs['publications.yaml']))
+    docs += person_docs(configs['people.yaml'])
+    docs += dataset_docs(configs['datasets.yaml'], configs['dataset-pages.yaml'])
+    postings = {}
+    for i, doc in enumerate(docs):
+        bits = {}
+        for field, text in doc['fields'].items():
+            for token in tokenize(text):
+                bits[token] = bits.get(token, 0) | FIELD_BITS[field]
+        for token, b in bits.items():
+            postings.setdefault(token, []).append(i << 4 | b)
+    terms = sorted(postings)
+    return {
+        'version': VERSION,
+        'fields': FIELD_BITS,
+        'docs': [[d['type'], d['title'], d['url'], d['snippet'][:160]] for d in docs],
+        'terms': terms,
+        'postings': [postings[t] for t in terms],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true', help='rebuild even if no config changed')
+    parser.add_argument('--check', action='store_true', help='exit 1 if the index is out of date, write nothing')
+    parser.add_argument('--cache', type=Path, default=CACHE_FILE, help=f'build manifest (default: {CACHE_FILE.name})')
+    args = parser.parse_args()
+
+    rel = OUTPUT.relative_to(ROOT).as_posix()
+    inputs = [f'configs/{name}' for name in SOURCES] + [f'scripts/{name}' for name in ('build_search_index.py', 'publication_tabs.py')]
+    cache = BuildCache(args.cache, ROOT)
+    if not args.force and not args.check:
+        fresh, reason = cache.check(rel, inputs)
+        if fresh:
+            print(f'Up to date: {rel} ({reason})')
+            return
+
+    index = build_index({name: load_config(name) for name in SOURCES})
+    text = json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+    old = OUTPUT.read_text(encoding='utf-8') if OUTPUT.is_file() else None
+    if args.check:
+        if old != text:
+            print(f'Out of date: {rel}')
+            sys.exit(1)
+        print(f'Up to date: {rel}')
+        return
+    if old != text:
+        OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+        with open(OUTPUT, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        print(f'Wrote {rel}: {len(index["docs"])} docs, {len(index["terms"])} terms, {len(text.encode("utf-8")) / 1024:.1f} KB')
+    else:
+        print(f'Up to date: {rel}')
+    cache.record(rel, inputs)
+    cache.save()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,928 @@
+#!/usr/bin/env python3
+"""
+Pre-render configs/*.yaml into the page shells (index.html, pages/*.html) so
+pages paint without fetching YAML and building the DOM in the browser.
+Run from project root.
+Requires: pip install pyyaml markdown
+
+Each page marks the generated part with a pair of comments:
+
+    <!-- build:people -->
+    ...rendered HTML, replaced on every build...
+    <!-- /build:people -->
+
+The renderers below are the Python counterparts of the templates in each
+page's inline script. Rendered roots carry a data-prerendered attribute and
+the inline scripts skip their fetch+render when they see it, so an unbuilt
+page still works; the libraries that fallback needs (js-yaml, marked) are
+loaded by the scripts on demand, and their <script> tags are dropped from
+pre-rendered pages. Output only depends on the config files, and pages whose
+output did not change are not rewritten.
+
+With --incremental, a manifest (.build-cache.json) records the hash of every
+input of every page (its configs, the images the rendered HTML references and
+this script) and pages whose inputs are unchanged are not rendered at all.
+
+Publications are also written as JSON shards (data/publications/: one per
+year tab and per category tab, journal-first, plus index.json with their
+sizes); pages/publications.html only pre-renders the first page of the tab
+shown on load and fetches the others as they scroll into view.
+
+The shared layout (inc/head-common.html, header.html, footer.html) is
+inlined into every page as the layout-head/-header/-footer regions, with
+{{BASE}} resolved for the page's depth and the stylesheets/scripts the page
+already declares left out of the inlined head. inc/layout.js then has
+nothing to fetch; it still loads the includes into pages that were never
+built. Once scripts/build_css.py has run, each run of adjacent theme
+stylesheets in the head is replaced, in place, by the page's critical CSS
+and a deferred, pruned bundle for that run.
+
+Images processed by scripts/build_images.py (committed under imgs/derived/)
+are emitted as <picture> elements whose sources list the real width variants
+in AVIF/WebP, with the original as the <img> fallback. Photos
+with a thumb in photos.yaml (scripts/build_photo_thumbs.py) are shown as that
+thumbnail over their blur-up placeholder, linked to the full image.
+--explain prints why each page was rebuilt or skipped.
+"""
+import argparse
+import functools
+import json
+import re
+import sys
+from pathlib import Path
+
+from build_cache import BuildCache
+from publication_tabs import PUB_CATEGORIES, YEAR_ORDER
+
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+try:
+    import markdown
+except ImportError:
+    print("Run: pip install markdown", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIGS = ROOT / 'configs'
+CACHE_FILE = ROOT / '.build-cache.json'
+IMAGE_MANIFEST = ROOT / 'imgs' / 'derived' / 'manifest.json'
+IMAGE_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+CSS_MANIFEST = ROOT / 'css' / 'manifest.json'
+CSS_MANIFEST_VERSION = 3
+
+HERO_COLUMNS = (
+    '<div id="wp-block-themeisle-blocks-advanced-columns-2c60bc77" class="wp-block-themeisle-blocks-advanced-columns '
+    'has-1-columns has-desktop-equal-layout has-tablet-equal-layout {mobile} has-vertical-center ticss-c00aadba" '
+    'style="{style}"><div class="wp-block-themeisle-blocks-advanced-columns-overlay" style="background:#000;opacity:0.3"></div>'
+    '<div class="innerblocks-wrap" style="display:flex;align-items:center;justify-content:center;text-align:center;width:100%;height:100%;box-sizing:border-box">'
+    '<div class="wp-block-themeisle-blocks-advanced-column" style="display:flex;align-items:center;justify-content:center;text-align:center;width:100%;height:100%;box-sizing:border-box">'
+    '<h1{heading_id} class="wp-block-themeisle-blocks-advanced-heading" style="text-align:center;margin:0">{title}</h1></div></div></div>'
+)
+HERO_STYLE = 'display:flex;align-items:center;justify-content:center;position:relative;height:130px;min-height:130px;padding-top:24px;padding-bottom:24px;box-sizing:border-box'
+
+
+def esc(s):
+    return str(s or '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def attr(s):
+    return str(s or '').replace('"', '&quot;')
+
+
+def load_config(name):
+    with open(CONFIGS / name, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def image_variants():
+    """Derivatives written by scripts/build_images.py, keyed by imgs/... path ({} if not built).
+    Entries with a variant missing on disk are left out, so pages never point at an image that is not there.
+    """
+    if not IMAGE_MANIFEST.is_file():
+        return {}
+    with open(IMAGE_MANIFEST, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return {rel: entry for rel, entry in manifest.items()
+            if all((ROOT / path).is_file() for variants in entry['variants'].values() for path, _ in variants)}
+
+
+def responsive_img(tag, src, sizes):
+    """Wrap an <img> tag in a <picture> offering the real width variants of
+    src in AVIF/WebP. The <img> itself keeps src, without a srcset, as the
+    fallback. Variant URLs keep the prefix style of src (/imgs/... or
+    ../imgs/...). Returns tag unchanged when src has no derivatives.
+    """
+    src = str(src or '')
+    i = src.find('imgs/')
+    entry = image_variants().get(src[i:].split('?')[0]) if i != -1 and '://' not in src else None
+    if not entry:
+        return tag
+    prefix = src[:i]
+
+    def srcset(fmt):
+        return attr(', '.join(f'{prefix}{path} {w}w' for path, w in entry['variants'][fmt]))
+
+    tag = re.sub(r' (?:srcset|sizes)="[^"]*"', '', tag)
+    sources = ''.join(f'<source type="{mime}" srcset="{srcset(fmt)}" sizes="{sizes}">' for fmt, mime in IMAGE_TYPES.items() if fmt in entry['variants'])
+    return f'<picture>{sources}{tag}</picture>'
+
+
+def hero(title, mobile='has-mobile-collapsedRows-layout has-reverse-columns-mobile', style=HERO_STYLE, heading_id=''):
+    return HERO_COLUMNS.format(
+        mobile=mobile,
+        style=style,
+        heading_id=f' id="{heading_id}"' if heading_id else '',
+        title=esc(title),
+    )
+
+
+# --- index.html: news table ---
+
+NEWS_STYLE = 'font-size: 16px; font-family: helvetica, arial, sans-serif;'
+
+
+def render_news(items):
+    rows = []
+    for item in items or []:
+        date = str(item.get('date') or '').strip()
+        content = str(item.get('content') or '').strip()
+        rows.append(
+            f'<tr><th style="width: 10.1818%;"><p><span style="{NEWS_STYLE}">{esc(date)}</span></p></th>'
+            f'<td style="width: 88.8485%;"><p><span style="{NEWS_STYLE}">{content}</span></p></td></tr>'
+        )
+    body = ''.join(rows) or '<tr><td colspan="2" style="text-align:center;padding:1em;color:#666;">No news.</td></tr>'
+    return f'<tbody id="news-tbody" data-prerendered>\n{body}\n</tbody>'
+
+
+# --- pages/publications.html ---
+
+PUB_ROW_CLASS = 'wp-block-themeisle-blocks-advanced-columns has-2-columns has-desktop-equal-layout has-tablet-equal-layout has-mobile-collapsedRows-layout has-vertical-unset'
+PUB_ENTRY_CLASS = 'wp-block-themeisle-blocks-advanced-columns has-2-columns has-desktop-oneTwo-layout has-tablet-equal-layout has-mobile-collapsedRows-layout has-vertical-unset'
+PUB_SPACER = '<div style="height:15px" aria-hidden="true" class="wp-block-spacer"></div>'
+PUB_IMAGE_SIZES = '(max-width: 767px) 100vw, 320px'
+# Entries per shard page; even, so a page ends on a full two-column row.
+PUB_PAGE_SIZE = 12
+PUB_SHARD_FIELDS = ('title', 'authors', 'venue', 'year', 'is_journal', 'categories', 'image', 'link')
+TABS_ITEM = (
+    '<div data-title="&lt;strong&gt;{label}&lt;/strong&gt;" class="wp-block-themeisle-blocks-tabs-item"{extra}>'
+    '<div class="wp-block-themeisle-blocks-tabs-item__header" tabindex="0"><strong>{label}</strong></div>'
+    '<div class="wp-block-themeisle-blocks-tabs-item__content"{content_extra}>'
+)
+
+
+def pub_year(pub):
+    return 'before2020' if str(pub.get('year')) == 'before2020' else str(pub.get('year'))
+
+
+def pub_categories(pub):
+    cats = pub.get('categories') or ['others']
+    return cats if isinstance(cats, list) else [cats]
+
+
+def highlight_authors(authors):
+    a = str(authors or '')
+    a = re.sub(r'Yuxuan Liang\*', '{{YL*}}', a)
+    a = re.sub(r'Yuxuan Liang(?=[,\s]|$)', '{{YL}}', a)
+    a = a.replace('<', '&lt;').replace('>', '&gt;')
+    a = a.replace('{{YL*}}', '<span class="pub-author-yl">Yuxuan Liang*</span>')
+    return a.replace('{{YL}}', '<span class="pub-author-yl">Yuxuan Liang</span>')
+
+
+def render_pub_entry(pub):
+    """Counterpart of buildPubEntry() in pages/publications.html."""
+    venue = re.sub(r'\s*(PDF|CODE|DATASET)\s*$', '', pub.get('venue') or '', flags=re.I).strip()
+    venue = venue.replace('<', '&lt;').replace('>', '&gt;')
+    link = pub.get('link') or pub.get('pdf_link') or ''
+    title = (pub.get('title') or '').replace('<', '&lt;').replace('>', '&gt;')
+    if link:
+        title_html = f'<a href="{attr(link)}" target="_blank" rel="noopener"><strong>{title}</strong></a>'
+    else:
+        title_html = f'<strong>{title}</strong>'
+    venue_class = 'pub-venue-journal' if pub.get('is_journal') else 'pub-venue-conference'
+    img = f'<img decoding="async" width="1024" height="529" src="{attr(pub.get("image"))}" alt="" sizes="(max-width: 1024px) 100vw, 1024px">'
+    type_attr = ' data-pub-type="journal"' if pub.get('is_journal') else ''
+    return (
+        f'<div class="pub-entry" data-pub-year="{pub_year(pub)}" data-pub-categories="{" ".join(pub_categories(pub))}"{type_attr}>'
+        f'<div class="{PUB_ENTRY_CLASS}"><div class="wp-block-themeisle-blocks-advanced-columns-overlay"></div><div class="innerblocks-wrap">'
+        '<div class="wp-block-themeisle-blocks-advanced-column"><div class="wp-block-image"><figure class="alignleft size-large">'
+        f'{responsive_img(img, pub.get("image"), PUB_IMAGE_SIZES)}</figure></div></div>'
+        '<div class="wp-block-themeisle-blocks-advanced-column">'
+        f'<div class="title"><span style="font-size: 16px; font-family: Roboto, sans-serif;">{title_html}</span></div>'
+        f'<div class="author"><span style="font-family: Roboto, sans-serif; font-size: 16px;">{highlight_authors(pub.get("authors"))}</span></div>'
+        f'<div><span style="font-size: 16px; font-family: Roboto, sans-serif;" class="{venue_class}"><strong>{venue}</strong></span></div></div></div></div>'
+        '</div>'
+    )
+
+
+def sort_pubs_by_year(pubs):
+    """Group by year in YEAR_ORDER, journals first within a year (stable)."""
+    by_year = {}
+    for pub in pubs:
+        by_year.setdefault(pub_year(pub), []).append(pub)
+    return [(y, sorted(by_year[y], key=lambda p: 0 if p.get('is_journal') else 1)) for y in YEAR_ORDER if by_year.get(y)]
+
+
+def render_pub_rows(entries):
+    """Counterpart of the two-column row layout in doPublicationsLayout()."""
+    out = []
+    for i in range(0, len(entries), 2):
+        pair = ''.join(entries[i:i + 2])
+        out.append(f'<div class="{PUB_ROW_CLASS}"><div class="wp-block-themeisle-blocks-advanced-columns-overlay"></div><div class="innerblocks-wrap">{pair}</div></div>')
+        if i + 2 < len(entries):
+            out.append(PUB_SPACER)
+    return ''.join(out)
+
+
+def render_publications(pubs):
+    """Tabs shell; each year/category view is filled from its shard as it scrolls into view.
+
+    Only the first page of the tab shown on load (All > newest year) is
+    rendered here, so the page paints without waiting for a shard.
+    """
+    if not isinstance(pubs, list):
+        pubs = []
+    grouped = dict(sort_pubs_by_year(pubs))
+    shards = pub_shards(pubs)
+    out = [
+        f'<div id="wp-block-themeisle-blocks-tabs-ed27d658" class="wp-block-themeisle-blocks-tabs  is-style-boxed" data-prerendered data-pub-page-size="{PUB_PAGE_SIZE}"><div class="wp-block-themeisle-blocks-tabs__content">',
+        TABS_ITEM.format(label='All', extra=' data-pub-filter="all"', content_extra=''),
+        '<div id="wp-block-themeisle-blocks-tabs-958195e6" class="wp-block-themeisle-blocks-tabs is-style-border"><div class="wp-block-themeisle-blocks-tabs__content">',
+    ]
+    for i, year in enumerate(YEAR_ORDER):
+        label = 'Before 2020' if year == 'before2020' else year
+        first = grouped.get(year, [])[:PUB_PAGE_SIZE] if i == 0 else []
+        view = f' data-pub-shard="year-{year}" data-pub-count="{len(shards[f"year-{year}"])}" data-pub-rendered="{len(first)}"'
+        out.append(TABS_ITEM.format(label=label, extra='', content_extra=view))
+        out.append(render_pub_rows([render_pub_entry(p) for p in first]))
+        out.append('</div>\n</div>')
+    out.append('</div>\n</div>\n</div>\n</div>')
+    for slug, label in PUB_CATEGORIES:
+        name = f'category-{slug}'
+        out.append(TABS_ITEM.format(label=label, extra=f' data-pub-filter="{slug}"', content_extra=''))
+        out.append(f'<div class="pub-filtered-view" data-pub-shard="{name}" data-pub-count="{len(shards[name])}" data-pub-rendered="0" data-pub-grouped></div>')
+        out.append('</div>\n</div>')
+    out.append('</div></div>')
+    return '\n'.join(out)
+
+
+def pub_shards(pubs):
+    """Shard name -> publications, journal-first within each year: one shard per year and per category tab."""
+    ordered = sort_pubs_by_year(pubs if isinstance(pubs, list) else [])
+    grouped = dict(ordered)
+    shards = {f'year-{year}': grouped.get(year, []) for year in YEAR_ORDER}
+    for slug, _ in PUB_CATEGORIES:
+        shards[f'category-{slug}'] = [p for _, year_pubs in ordered for p in year_pubs if slug in pub_categories(p)]
+    return shards
+
+
+def render_pub_shards(pubs):
+    """data/publications/*.json: one file per shard plus index.json with the shard sizes."""
+    files, index = {}, {}
+    for name, items in pub_shards(pubs).items():
+        records = []
+        for pub in items:
+            record = {k: pub.get(k) for k in PUB_SHARD_FIELDS}
+            record.update(year=pub_year(pub), categories=pub_categories(pub), html=render_pub_entry(pub))
+            records.append(record)
+        text = json.dumps({'shard': name, 'count': len(records), 'pubs': records}, ensure_ascii=False, separators=(',', ':')) + '\n'
+        files[f'{name}.json'] = text
+        index[name] = {'count': len(records), 'bytes': len(text.encode('utf-8'))}
+    files['index.json'] = json.dumps({'page_size': PUB_PAGE_SIZE, 'shards': index}, indent=1) + '\n'
+    return files
+
+
+# --- pages/people.html ---
+
+PEOPLE_SPACER = '<div style="height:20px" aria-hidden="true" class="wp-block-spacer"></div>'
+SOCIAL_ICONS = [
+    (('linkedin',), 'social-icon--linkedin', '<path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/>'),
+    (('scholar', 'google'), 'social-icon--scholar', '<path d="M12 24a7 7 0 1 1 0-14 7 7 0 0 1 0 14zm0-24L0 9.5l4.838 3.94A8 8 0 0 1 12 9a8 8 0 0 1 7.162 4.44L24 9.5 12 0z"/>'),
+    (('github',), 'social-icon--github', '<path d="M12 .297c-6.63 0-12 5.373-12 12 0 5.303 3.438 9.8 8.205 11.385.6.113.82-.258.82-.577 0-.285-.01-1.04-.015-2.04-3.338.724-4.042-1.61-4.042-1.61C4.422 18.07 3.633 17.7 3.633 17.7c-1.087-.744.084-.729.084-.729 1.205.084 1.838 1.236 1.838 1.236 1.07 1.835 2.809 1.305 3.495.998.108-.776.417-1.305.76-1.605-2.665-.3-5.466-1.332-5.466-5.93 0-1.31.465-2.38 1.235-3.22-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23A11.509 11.509 0 0 1 12 5.803c1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.22 0 4.61-2.805 5.625-5.475 5.92.43.372.823 1.102.823 2.222 0 1.606-.015 2.896-.015 3.286 0 .32.21.694.825.576C20.565 22.092 24 17.592 24 12.297c0-6.627-5.373-12-12-12"/>'),
+    (('home',), 'social-icon--home', '<path d="M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z"/>'),
+]
+SOCIAL_ICON_DEFAULT = '<path d="M19 19H5V5h7V3H5a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14c1.1 0 2-.9 2-2v-7h-2v7zM14 3v2h3.59l-9.83 9.83 1.41 1.41L19 6.41V10h2V3h-7z"/>'
+
+
+def social_icon(label):
+    lower = (label or '').lower()
+    cls, path = 'social-icon-svg', SOCIAL_ICON_DEFAULT
+    for needles, modifier, icon in SOCIAL_ICONS:
+        if any(n in lower for n in needles):
+            cls, path = f'social-icon-svg {modifier}', icon
+            break
+    return f'<span class="{cls}" aria-hidden="true"><svg viewBox="0 0 24 24" width="14" height="14" fill="currentColor">{path}</svg></span>'
+
+
+def render_person_card(p, is_first):
+    link_open = f'<a href="{attr(p.get("link"))}">' if p.get('link') else ''
+    link_close = '</a>' if p.get('link') else ''
+    loading = 'fetchpriority="high" ' if is_first else 'loading="lazy" '
+    img = responsive_img(
+        f'<img {loading}decoding="async" width="400" height="400" src="{attr(p.get("image"))}" alt="" style="aspect-ratio:1;object-fit:cover;width:160px">',
+        p.get('image'), '160px',
+    )
+    img = f'<figure class="aligncenter size-full is-resized">{link_open}{img}{link_close}</figure>'
+    deg = f' from <span style="text-decoration: underline;">{esc(p.get("degree_from"))}</span>' if p.get('degree_from') else ''
+    research = f': {esc(p.get("research"))}' if p.get('research') else ''
+    line = f'<strong>{esc(p.get("name"))}</strong><br>{deg}<br>{esc(p.get("period"))}{research}'
+    return f'<div class="wp-block-themeisle-blocks-advanced-column"><div class="wp-block-image is-style-rounded">{img}</div><p class="has-text-align-center" style="font-size:16px">{line}</p></div>'
+
+
+def render_card_section(title, people):
+    if not people:
+        return ''
+    rows = []
+    for i in range(0, len(people), 4):
+        cols = ''.join(render_person_card(p, j == 0) for j, p in enumerate(people[i:i + 4]))
+        rows.append(
+            '<div class="wp-block-themeisle-blocks-advanced-columns has-4-columns has-desktop-equal-layout has-tablet-equal-layout has-mobile-collapsedRows-layout has-vertical-top">'
+            f'<div class="wp-block-themeisle-blocks-advanced-columns-overlay"></div><div class="innerblocks-wrap">{cols}</div></div>'
+        )
+    return f'<h3 class="wp-block-heading">{esc(title)}</h3>' + PEOPLE_SPACER.join(rows)
+
+
+def render_lab_director(d):
+    socials = ''.join(
+        f'<li><a href="{attr(s.get("url"))}" target="_blank" rel="noopener">{social_icon(s.get("label"))}<span>{esc(s.get("label"))}</span></a></li>'
+        for s in d.get('socials') or []
+    )
+    title_html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', d.get('title') or '').replace('&', '&amp;')
+    avatar = responsive_img(f'<img decoding="async" class="eb-team-member-avatar" src="{attr(d.get("image"))}" alt="{esc(d.get("name"))}">', d.get('image'), '300px')
+    return (
+        '<h3 class="wp-block-heading">Lab Director</h3><div class="wp-block-group"><div class="wp-block-group__inner-container is-layout-constrained wp-block-group-is-layout-constrained">'
+        '<div class="wp-block-essential-blocks-team-member root-eb-team-member-y7zxn"><div class="eb-parent-wrapper eb-parent-eb-team-member-y7zxn"><div class="eb-team-member-y7zxn eb-team-wrapper preset1"><div class="eb-team-inner">'
+        f'<div class="eb-team-member-image">{avatar}</div>'
+        f'<div class="eb-team-member-contents"><div class="eb-team-member-texts"><h3 class="eb-team-member-name">{esc(d.get("name"))}</h3><h4 class="eb-team-member-job-title">{title_html}</h4>'
+        f'<ul class="socials">{socials}</ul><hr class="eb-team-member-content-separator"><p class="eb-team-member-description">{d.get("description") or ""}</p></div></div></div></div></div></div></div>'
+    )
+
+
+def render_alumni_item(a):
+    name = f'<a href="{attr(a.get("link"))}">{esc(a.get("name"))}</a>' if a.get('link') else esc(a.get('name'))
+    aff = a.get('affiliation') or ('B.S from ' + str(a.get('degree_from') or ''))
+    note = ' ' + esc(a.get('note')) if a.get('note') else '.'
+    return f'<li style="font-size:16px">{name} ({esc(a.get("period"))}) {esc(aff)}{note}</li>'
+
+
+def render_alumni_list(title, items):
+    lis = ''.join(render_alumni_item(a) for a in items)
+    return f'<p style="font-size:16px"><mark><strong>{esc(title)}</strong></mark></p><ul class="wp-block-list">{lis}</ul>'
+
+
+def render_outside_item(o):
+    name = f'<a href="{attr(o.get("link"))}" target="_blank" rel="noreferrer noopener">{esc(o.get("name"))}</a>' if o.get('link') else esc(o.get('name'))
+    co = ''
+    if o.get('co_supervisor') and o.get('co_supervisor_link'):
+        co = f', co-supervised with <a href="{attr(o.get("co_supervisor_link"))}" target="_blank" rel="noreferrer noopener">{esc(o.get("co_supervisor"))}</a>'
+    return f'<li style="font-size:16px">{name} ({esc(o.get("affiliation"))}){co}, {esc(o.get("period"))}.</li>'
+
+
+def render_people(cfg):
+    cfg = cfg or {}
+    html = hero(cfg.get('hero_title') or 'Members', mobile='has-mobile-equal-layout')
+    if cfg.get('lab_director'):
+        html += PEOPLE_SPACER + render_lab_director(cfg['lab_director'])
+    for key, title in (('postdoc', 'Postdoc'), ('phd_students', 'PhD Students'), ('mphil_students', 'Mphil Students'),
+                       ('research_assistant', 'Research Assistant'), ('research_interns', 'Research Interns')):
+        if cfg.get(key):
+            html += PEOPLE_SPACER + render_card_section(title, cfg[key])
+    alum = cfg.get('alumni') or {}
+    if alum.get('mphil_student') or alum.get('research_intern') or alum.get('research_assistant'):
+        html += PEOPLE_SPACER + '<h3 class="wp-block-heading">Alumni</h3>'
+        for key, title in (('mphil_student', 'MPhil Student'), ('research_intern', 'Research Intern'), ('research_assistant', 'Research Assistant')):
+            if alum.get(key):
+                html += render_alumni_list(title, alum[key])
+    outside = cfg.get('outside_collaborators') or {}
+    if outside.get('list'):
+        lis = ''.join(render_outside_item(o) for o in outside['list'])
+        html += PEOPLE_SPACER + f'<h3 class="wp-block-heading">Outside HKUST(GZ)</h3><p style="font-size:16px">{esc(outside.get("intro"))}</p><ul class="wp-block-list">{lis}</ul>'
+    collab = cfg.get('collaborators')
+    if collab:
+        html += PEOPLE_SPACER + f'<h3 class="wp-block-heading">Collaborators</h3><p style="font-size:16px">{esc(collab.get("intro"))}</p>'
+        if collab.get('logo'):
+            html += f'<figure class="wp-block-image size-large"><img loading="lazy" decoding="async" width="1024" height="54" src="{attr(collab["logo"])}" alt="" class="wp-image-2592"></figure>'
+    html += PEOPLE_SPACER
+    return f'<div id="people-root" data-prerendered>{html}</div>'
+
+
+# --- pages/photos.html ---
+
+PHOTOS_SPACER = '<div style="height:18px" aria-hidden="true" class="wp-block-spacer"></div>'
+PHOTO_SIZES = '(max-width: 767px) 100vw, 400px'
+
+
+def render_photos(cfg):
+    cfg = cfg or {}
+    html = hero(cfg.get('hero_title') or 'Photos & Videos', heading_id='wp-block-themeisle-blocks-advanced-heading-5d5675df')
+    for i, album in enumerate(cfg.get('albums') or []):
+        html += PHOTOS_SPACER + (
+            '<div class="wp-block-themeisle-blocks-advanced-columns has-2-columns has-desktop-equal-layout has-tablet-equal-layout has-mobile-equal-layout has-vertical-unset">'
+            '<div class="wp-block-themeisle-blocks-advanced-columns-overlay"></div><div class="innerblocks-wrap">'
+            f'<div class="wp-block-themeisle-blocks-advanced-column"><h6 class="wp-block-heading">{esc(album.get("title"))}</h6></div>'
+            f'<div class="wp-block-themeisle-blocks-advanced-column"><h6 class="wp-block-heading has-text-align-right">{esc(album.get("location"))}</h6></div></div></div>'
+        )
+        images = album.get('images') or []
+        col_class = 'columns-4' if len(images) <= 4 else 'columns-default'
+        html += f'<figure class="wp-block-gallery has-nested-images {col_class} is-cropped is-layout-flex wp-block-gallery-is-layout-flex">'
+        for j, img in enumerate(images):
+            src = img.get('src') or ''
+            w = img.get('width') or 1024
+            h = img.get('height') or 768
+            load = ' fetchpriority="high"' if i == 0 and j == 0 else ' loading="lazy"'
+            if img.get('thumb'):
+                # Thumbnail over its inlined placeholder; the full image only loads when opened.
+                lqip = f' style="background:url({attr(img["lqip"])}) center/cover"' if img.get('lqip') else ''
+                tag = f'<img{load} decoding="async" width="{w}" height="{h}" src="{attr(img["thumb"])}" alt="" class="wp-image-{i * 10 + j}"{lqip}>'
+                html += f'<figure class="wp-block-image size-large"><a href="{attr(src)}">{tag}</a></figure>'
+                continue
+            tag = (
+                f'<img{load} decoding="async" width="{w}" height="{h}" src="{attr(src)}" alt="" '
+                f'class="wp-image-{i * 10 + j}" srcset="{attr(src)} {w}w" sizes="(max-width: {w}px) 100vw, {w}px">'
+            )
+            html += f'<figure class="wp-block-image size-large">{responsive_img(tag, src, PHOTO_SIZES)}</figure>'
+        html += '</figure>'
+    html += PHOTOS_SPACER
+    return f'<div id="photos-root" data-prerendered>{html}</div>'
+
+
+# --- pages/openings.html ---
+
+OPENINGS_SPACER = PHOTOS_SPACER
+DEFAULT_OPENINGS_HERO = '/imgs/common/学校图-核心区1.jpg'
+
+
+def rich(s):
+    """**bold**, __underline__ and [text](url) on escaped text (richAttr() in the page)."""
+    s = str(s or '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    s = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', s)
+    s = re.sub(r'__(.+?)__', r'<span style="text-decoration:underline">\1</span>', s)
+    return re.sub(r'\[([^\]]+)\]\(([^)]+)\)', lambda m: f'<a href="{attr(m.group(2))}">{m.group(1)}</a>', s)
+
+
+def bold(s):
+    return re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', str(s or ''))
+
+
+def render_openings(cfg):
+    cfg = cfg or {}
+    bg = (cfg.get('hero_background_image') or DEFAULT_OPENINGS_HERO).replace('"', '&quot;')
+    style = HERO_STYLE + f';--background:url({bg}) no-repeat scroll 53% 59%/cover'
+    html = hero(cfg.get('hero_title') or 'Openings', style=style) + OPENINGS_SPACER
+    if cfg.get('intro'):
+        html += f'<p style="font-size:16px">{rich(cfg["intro"])}</p>'
+    video = cfg.get('video') or {}
+    if video.get('src'):
+        html += f'<figure class="wp-block-video alignleft"><video autoplay controls loop muted poster="{attr(video.get("poster"))}" src="{attr(video["src"])}"></video></figure>'
+    if cfg.get('scholarships'):
+        html += f'<p style="font-size:16px">{rich(cfg["scholarships"])}'
+        link = cfg.get('scholarships_link') or {}
+        if link.get('href'):
+            html += f' [<a href="{attr(link["href"])}">{esc(link.get("text"))}</a>]'
+        html += '</p>'
+    html += OPENINGS_SPACER
+    if cfg.get('contact_heading'):
+        html += f'<h3 class="wp-block-heading"><strong>{esc(cfg["contact_heading"])}</strong></h3>'
+    email = cfg.get('contact_email') or ''
+    apply = bold(cfg.get('contact_apply')).replace('{email}', f'<a href="mailto:{attr(email)}">{esc(email)}</a>')
+    if apply:
+        html += f'<p style="font-size:16px">{apply}</p>'
+    if cfg.get('contact_note'):
+        html += f'<p style="font-size:16px">{rich(cfg["contact_note"])}</p>'
+    if cfg.get('phd_heading'):
+        phd_id = f' id="{attr(cfg["phd_heading_id"])}"' if cfg.get('phd_heading_id') else ''
+        html += f'<h3 class="wp-block-heading"{phd_id}>{esc(cfg["phd_heading"])}</h3>'
+    mphil = cfg.get('mphil_link') or {}
+    mphil_link = f'<a href="{attr(mphil["href"])}">{esc(mphil.get("text"))}</a>' if mphil.get('href') else ''
+    phd_intro = bold(cfg.get('phd_intro')).replace('{mphil_link}', mphil_link)
+    if phd_intro:
+        html += f'<p style="font-size:16px">{phd_intro}</p>'
+    if cfg.get('requirements_general'):
+        html += '<ul class="wp-block-list">' + ''.join(f'<li style="font-size:16px">{rich(r)}</li>' for r in cfg['requirements_general']) + '</ul>'
+    if cfg.get('requirements_priority_intro'):
+        html += f'<p style="font-size:16px">{rich(cfg["requirements_priority_intro"])}</p>'
+    if cfg.get('requirements_priority'):
+        html += '<ul class="wp-block-list">' + ''.join(f'<li style="font-size:16px">{rich(r)}</li>' for r in cfg['requirements_priority']) + '</ul>'
+    html += OPENINGS_SPACER
+    return f'<div class="entry-content bloglo-entry" id="openings-root" data-prerendered>{html}</div>'
+
+
+# --- pages/datasets.html ---
+
+def render_datasets(items):
+    cards = []
+    for d in items or []:
+        link, title = attr(d.get('link')), esc(d.get('title'))
+        img = responsive_img(f'<img src="{attr(d.get("image"))}" alt="{title}" loading="lazy" decoding="async">', d.get('image'), PHOTO_SIZES)
+        cards.append(
+            f'<article class="dataset-card"><a href="{link}" class="entry-image-link">{img}</a>'
+            f'<div class="card-body"><h4 class="entry-title"><a href="{link}" title="{title}" rel="bookmark">{title}</a></h4><p class="entry-summary">{esc(d.get("summary"))}</p></div></article>'
+        )
+    body = ''.join(cards) or '<div class="datasets-loading">No datasets.</div>'
+    return f'<div id="datasets-root" class="datasets-grid" data-prerendered>{body}</div>'
+
+
+def render_datasets_config(items):
+    data = json.dumps(items or [], ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    return f'<script type="application/json" id="datasets-config">{data}</script>'
+
+
+# --- pages/dataset-pages.html ---
+
+DATASET_PAGE_URL = '/pages/dataset-pages.html'
+CALENDAR_SVG = '<svg class="bloglo-icon" aria-hidden="true" xmlns="http://www.w3.org/2000/svg" viewbox="0 0 29.36 29.36"><path d="M14.68 0a14.68 14.68 0 1014.68 14.68A14.64 14.64 0 0014.68 0zm0 26.69a12 12 0 1112-12 12 12 0 01-12 12zm5.87-10.54L16 13.88V6.67a1.25 1.25 0 00-1.33-1.33 1.26 1.26 0 00-1.34 1.33v8a1.28 1.28 0 00.81 1.2l5.33 2.67c.14.13.27.13.54.13a1.28 1.28 0 001.2-.8 1.41 1.41 0 00-.67-1.73z"></path></svg>'
+EDIT_SVG = '<svg class="bloglo-icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewbox="0 0 32 32"><path d="M4.004 23.429h5.339c.4 0 .667-.133.934-.4L24.958 8.348a1.29 1.29 0 000-1.868l-5.339-5.339a1.29 1.29 0 00-1.868 0L3.07 15.822c-.267.267-.4.534-.4.934v5.339c0 .801.534 1.335 1.335 1.335zm1.335-6.139L18.685 3.944l3.47 3.47L8.809 20.76h-3.47v-3.47zm22.688 10.143H4.004c-.801 0-1.335.534-1.335 1.335s.534 1.335 1.335 1.335h24.023c.801 0 1.335-.534 1.335-1.335s-.534-1.335-1.335-1.335z"></path></svg>'
+
+
+def format_date(ymd):
+    parts = str(ymd or '').split('-')
+    if len(parts) != 3:
+        return str(ymd or '')
+    return f'{parts[0]}年{int(parts[1])}月{int(parts[2])}日'
+
+
+def render_markdown(text):
+    """GFM-ish Markdown (marked.parse(..., {gfm: true}) in the page) plus the WordPress block classes."""
+    html = markdown.markdown(text or '', extensions=['tables', 'fenced_code', 'sane_lists'])
+    html = html.replace('<pre>', '<pre class="wp-block-code">')
+    return html.replace('<table>', '<figure class="wp-block-table"><table>').replace('</table>', '</table></figure>')
+
+
+def render_dataset_article(item):
+    title = item.get('title') or item.get('id')
+    date, updated = item.get('date') or '', item.get('lastUpdated') or ''
+    date_time = f'{date}T00:00:00+08:00' if date else ''
+    updated_time = f'{updated}T00:00:00+08:00' if updated else ''
+    thumb = responsive_img(
+        f'<img src="{esc(item.get("image"))}" class="attachment-full size-full wp-post-image" alt="{esc(title)}">',
+        item.get('image'), '(max-width: 1024px) 100vw, 1024px',
+    )
+    return (
+        '<div class="post-category"><span class="cat-links"><span class="screen-reader-text">Posted in</span><span><a href="/pages/datasets.html" rel="category">Datasets</a></span></span></div>'
+        f'<header class="entry-header"><h1 class="entry-title" itemprop="headline">{esc(title)}</h1></header>'
+        f'<div class="entry-meta"><div class="entry-meta-elements"><span class="posted-on"><time class="entry-date published updated" datetime="{esc(date_time)}">{CALENDAR_SVG}{format_date(date)}</time></span></div></div>'
+        f'<div class="post-thumb entry-media thumbnail">{thumb}</div>'
+        f'<div class="entry-content bloglo-entry" itemprop="text">{render_markdown(item.get("content"))}</div>'
+        f'<div class="entry-footer"><span class="last-updated bloglo-iflex-center">{EDIT_SVG}<time class="entry-date updated" datetime="{esc(updated_time)}">Last updated on {format_date(updated)}</time></span></div>'
+    )
+
+
+def nav_thumb(item, alt):
+    tag = f'<img width="75" height="75" src="{esc(item.get("image"))}" class="attachment-75x75 size-75x75 wp-post-image" alt="{alt}" decoding="async" loading="lazy">'
+    return responsive_img(tag, item.get('image'), '75px')
+
+
+def render_dataset_nav(prev, nxt):
+    html = ''
+    if prev:
+        t = esc(prev.get('title') or prev.get('id'))
+        html += (
+            f'<div class="nav-previous"><h6 class="nav-title">Previous Post</h6><a href="{DATASET_PAGE_URL}?name={esc(prev.get("id"))}" rel="prev">'
+            f'<div class="nav-content">{nav_thumb(prev, t)} <span>{t}</span></div></a></div>'
+        )
+    if nxt:
+        t = esc(nxt.get('title') or nxt.get('id'))
+        html += (
+            f'<div class="nav-next"><h6 class="nav-title">Next Post</h6><a href="{DATASET_PAGE_URL}?name={esc(nxt.get("id"))}" rel="next">'
+            f'<div class="nav-content"><span>{t}</span> {nav_thumb(nxt, t)}</div></a></div>'
+        )
+    return html
+
+
+def render_dataset_pages(items):
+    """One <template> pair per dataset; the page script picks the one named by ?name=."""
+    items = [d for d in items or [] if d and d.get('id')]
+    out = []
+    for i, item in enumerate(items):
+        prev = items[i - 1] if i > 0 else None
+        nxt = items[i + 1] if i + 1 < len(items) else None
+        out.append(f'<template id="dataset-article-{attr(item["id"])}" data-title="{esc(item.get("title") or item["id"])}">{render_dataset_article(item)}</template>')
+        out.append(f'<template id="dataset-nav-{attr(item["id"])}">{render_dataset_nav(prev, nxt)}</template>')
+    return '\n'.join(out)
+
+
+# Shared layout (inc/*.html), inlined into every page instead of being fetched by inc/layout.js.
+LAYOUT_HEAD = 'inc/head-common.html'
+# region name -> (include, empty placeholder an unbuilt page has, wrapper it becomes)
+LAYOUT_BODY = {
+    'layout-header': ('inc/header.html', '<div id="layout-header"></div>', '<div id="layout-header" data-prerendered>\n{}\n</div>'),
+    'layout-footer': ('inc/footer.html', '<div id="layout-footer"></div>', '<div id="layout-footer" data-prerendered>\n{}\n</div>'),
+}
+LAYOUT_INPUTS = [LAYOUT_HEAD] + [include for include, _, _ in LAYOUT_BODY.values()] + [CSS_MANIFEST.relative_to(ROOT).as_posix()]
+HEAD_PLACEHOLDER = re.compile(r'<meta id="layout-head"[^>]*>')
+# Stylesheets and scripts in the head include, matched up with the page's own tags.
+ASSET_TAG = re.compile(r'[ \t]*(?:<link\b[^>]*>|<script\b[^>]*\bsrc="[^"]*"[^>]*>\s*</script>|<style\b[^>]*\bid="[^"]*"[^>]*>.*?</style>)[ \t]*\n?', re.S)
+TAG_ATTR = re.compile(r'\b(id|href|src|rel)="([^"]*)"')
+
+
+def read_text(rel):
+    with open(ROOT / rel, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def asset_keys(rel, tag):
+    """Ids and root-relative URLs (query dropped) a stylesheet/script tag is known by."""
+    attrs = dict(TAG_ATTR.findall(tag.split('>', 1)[0]))
+    if tag.lstrip().startswith('<link') and 'stylesheet' not in attrs.get('rel', '').split():
+        return set()
+    keys = {f'#{attrs["id"]}'} if attrs.get('id') else set()
+    url = attrs.get('href') or attrs.get('src')
+    if url:
+        url = url.split('?')[0].split('#')[0]
+        if '://' not in url and not url.startswith('//'):
+            url = url.lstrip('/') if url.startswith('/') else (ROOT / rel).parent.joinpath(url).resolve().relative_to(ROOT).as_posix()
+        keys.add(url)
+    return keys
+
+
+def render_layout_head(rel, page_html):
+    """head-common.html with {{BASE}} resolved for rel's depth, minus the
+    stylesheets/scripts the page already declares itself (the page's own tag
+    wins) and repeats within the include.
+    """
+    head = read_text(LAYOUT_HEAD).replace('{{BASE}}', '../' * rel.count('/'))
+    seen = set()
+    for m in ASSET_TAG.finditer(page_html):
+        seen |= asset_keys(rel, m.group(0))
+
+    def dedupe(m):
+        keys = asset_keys(rel, m.group(0))
+        if keys & seen:
+            return ''
+        seen.update(keys)
+        return m.group(0)
+
+    return defer_stylesheets(rel, ASSET_TAG.sub(dedupe, head)).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def css_bundles():
+    """scripts/build_css.py's manifest: critical CSS and deferred bundles per page
+    ('pages') and the stylesheets a page uses nothing of ('unused'); {} if not built.
+    """
+    if not CSS_MANIFEST.is_file():
+        return {}
+    with open(CSS_MANIFEST, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if data.get('version') == CSS_MANIFEST_VERSION else {}
+
+
+def css_inputs(rel):
+    """The critical CSS files inlined into rel, if any."""
+    return [entry['critical'] for entry in css_bundles().get('pages', {}).get(rel, [])]
+
+
+def defer_stylesheets(rel, head):
+    """Swap each run of stylesheets scripts/build_css.py bundled for rel for its
+    critical CSS and a deferred link to its bundle, both where the first
+    stylesheet of the run was, so the cascade order is unchanged. Stylesheets
+    none of whose rules the page uses are dropped.
+    """
+    entries = css_bundles().get('pages', {}).get(rel)
+    if entries is None or not all((ROOT / entry['critical']).is_file() for entry in entries):
+        return head
+    base = '../' * rel.count('/')
+    runs = {f'#{i}': n for n, entry in enumerate(entries) for i in entry['replaces']}
+    unused = {f'#{i}' for i in css_bundles().get('unused', {}).get(rel, [])}
+    done = set()
+
+    def swap(m):
+        keys = asset_keys(rel, m.group(0))
+        if keys & unused:
+            return ''
+        n = next((runs[key] for key in keys if key in runs), None)
+        if n is None:
+            return m.group(0)
+        if n in done:
+            return ''
+        done.add(n)
+        critical = read_text(entries[n]['critical']).replace('{{BASE}}', base).strip()
+        bundle = base + entries[n]['bundle']
+        return (f'<style id="critical-css-{n + 1}">\n{critical}\n</style>\n'
+                f'<link rel="preload" id="deferred-css-{n + 1}" href="{bundle}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'<noscript><link rel="stylesheet" href="{bundle}"></noscript>\n')
+
+    return ASSET_TAG.sub(swap, head)
+
+
+def inline_layout(rel, html):
+    """Inline the shared head, header and footer into a page.
+
+    The first build turns layout.js's placeholders into build regions (the
+    header/footer containers get data-prerendered so layout.js leaves them
+    alone); later builds refresh the regions like any other.
+    """
+    if '<!-- build:layout-head -->' not in html:
+        if not HEAD_PLACEHOLDER.search(html):
+            return html
+        html = HEAD_PLACEHOLDER.sub(lambda m: '<!-- build:layout-head -->\n<!-- /build:layout-head -->', html, count=1)
+    for name, (include, placeholder, wrapper) in LAYOUT_BODY.items():
+        if f'<!-- build:{name} -->' not in html and placeholder in html:
+            html = html.replace(placeholder, wrapper.format(f'<!-- build:{name} -->\n<!-- /build:{name} -->'), 1)
+        if f'<!-- build:{name} -->' in html:
+            html = replace_region(html, name, read_text(include).replace('{{BASE}}', '../' * rel.count('/')).strip())
+    own = re.sub(r'<!-- build:layout-head -->\n.*?<!-- /build:layout-head -->', '', html, flags=re.S)
+    return replace_region(html, 'layout-head', render_layout_head(rel, own))
+
+
+# page (relative to ROOT) -> [(region name, config file, renderer)]
+PAGES = {
+    'index.html': [('news', 'news.yaml', render_news)],
+    'pages/publications.html': [('publications', 'publications.yaml', render_publications)],
+    'pages/people.html': [('people', 'people.yaml', render_people)],
+    'pages/photos.html': [('photos', 'photos.yaml', render_photos)],
+    'pages/openings.html': [('openings', 'openings.yaml', render_openings)],
+    'pages/datasets.html': [
+        ('datasets', 'datasets.yaml', render_datasets),
+        ('datasets-config', 'datasets.yaml', render_datasets_config),
+    ],
+    'pages/dataset-pages.html': [('dataset-pages', 'dataset-pages.yaml', render_dataset_pages)],
+    'pages/admin.html': [],
+}
+
+# page -> [(output directory, config file, renderer returning {file name: text})]
+# Data files the page fetches at runtime; built whenever the page is selected.
+DATA = {
+    'pages/publications.html': [('data/publications', 'publications.yaml', render_pub_shards)],
+}
+
+
+def replace_region(html, name, body):
+    pattern = re.compile(r'(<!-- build:%s -->\n).*?(<!-- /build:%s -->)' % (re.escape(name), re.escape(name)), re.S)
+    if not pattern.search(html):
+        raise ValueError(f'region "{name}" not found')
+    return pattern.sub(lambda m: m.group(1) + body + '\n' + m.group(2), html, count=1)
+
+
+LOCAL_REF = re.compile(r'(?:src|srcset|poster|href)="([^"]+)"|url\(([^)]+)\)')
+
+
+def local_refs(rel, html):
+    """Root-relative paths of existing local files referenced from rendered HTML."""
+    base = (ROOT / rel).parent
+    refs = set()
+    for m in LOCAL_REF.finditer(html):
+        for url in (m.group(1) or m.group(2)).split(','):
+            url = url.strip().split(' ')[0].split('?')[0].split('#')[0].strip('\'"')
+            if not url or '://' in url or url.startswith(('//', 'mailto:', 'data:')):
+                continue
+            path = (ROOT / url.lstrip('/')) if url.startswith('/') else (base / url)
+            path = path.resolve()
+            if path.is_file() and ROOT in path.parents and IMAGE_MANIFEST.parent not in path.parents:
+                refs.add(path.relative_to(ROOT).as_posix())
+    return refs
+
+
+# Libraries only the inline scripts' fetch+render fallback uses. The scripts
+# load them on demand, so a pre-rendered page drops the blocking tags.
+FALLBACK_SCRIPT = re.compile(r'<script src="https://cdnjs\.cloudflare\.com/ajax/libs/(?:js-yaml|marked)/[^"]*"></script>\n')
+
+
+def build_page(rel, regions, configs):
+    """Return (current html, rebuilt html, local files the rendered regions reference)."""
+    path = ROOT / rel
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        html = f.read()
+    out = html
+    refs = set()
+    for name, config, render in regions:
+        if config not in configs:
+            configs[config] = load_config(config)
+        body = render(configs[config])
+        refs |= local_refs(rel, body)
+        out = replace_region(out, name, body)
+    if regions:
+        out = FALLBACK_SCRIPT.sub('', out)
+    return html, inline_layout(rel, out), refs
+
+
+def page_inputs(regions):
+    """Inputs known before rendering: the page's config files, the image manifest and this script."""
+    inputs = sorted({f'configs/{config}' for _, config, _ in regions})
+    return inputs + [IMAGE_MANIFEST.relative_to(ROOT).as_posix(), Path(__file__).resolve().relative_to(ROOT).as_posix()]
+
+
+def build_data(out_dir, config, render, configs):
+    """Return ({root-relative path: (current text or None, rebuilt text)}, stale .json files to remove)."""
+    if config not in configs:
+        configs[config] = load_config(config)
+    files = {}
+    for name, text in render(configs[config]).items():
+        path = ROOT / out_dir / name
+        old = None
+        if path.is_file():
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                old = f.read()
+        files[f'{out_dir}/{name}'] = (old, text)
+    existing = sorted((ROOT / out_dir).glob('*.json')) if (ROOT / out_dir).is_dir() else []
+    stale = [p.relative_to(ROOT).as_posix() for p in existing if p.relative_to(ROOT).as_posix() not in files]
+    return files, stale
+
+
+def check_outputs(cache, out_dir, inputs):
+    """(fresh, reason) for every file the last build wrote to out_dir."""
+    outputs = sorted(o for o in cache.outputs if o.startswith(out_dir + '/'))
+    if not outputs:
+        return False, 'no cache entry'
+    for output in outputs:
+        fresh, reason = cache.check(output, inputs)
+        if not fresh:
+            return False, f'{output}: {reason}'
+    return True, 'inputs unchanged'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', help='only build these pages (default: all)')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any page is out of date, write nothing')
+    parser.add_argument('--incremental', action='store_true', help='skip pages whose inputs are unchanged since the last build')
+    parser.add_argument('--explain', action='store_true', help='print why each page was rebuilt or skipped')
+    parser.add_argument('--cache', type=Path, default=CACHE_FILE, help=f'build manifest (default: {CACHE_FILE.name})')
+    args = parser.parse_args()
+
+    selected = args.pages or list(PAGES)
+    unknown = [p for p in selected if p not in PAGES]
+    if unknown:
+        print(f'Unknown page(s): {", ".join(unknown)}', file=sys.stderr)
+        sys.exit(2)
+
+    cache = BuildCache(args.cache, ROOT) if (args.incremental or args.explain) and not args.check else None
+    configs = {}
+    stale = []
+    for rel in selected:
+        inputs = page_inputs(PAGES[rel]) + LAYOUT_INPUTS + css_inputs(rel)
+        if cache is not None:
+            fresh, reason = cache.check(rel, inputs)
+            if not args.incremental:
+                fresh, reason = False, f'full build ({reason})'
+            if fresh:
+                if args.explain:
+                    print(f'skip     {rel}: {reason}')
+                continue
+            if args.explain:
+                print(f'rebuild  {rel}: {reason}')
+        try:
+            old, new, refs = build_page(rel, PAGES[rel], configs)
+        except ValueError as e:
+            print(f'{rel}: {e}', file=sys.stderr)
+            sys.exit(1)
+        if old != new:
+            stale.append(rel)
+            if args.check:
+                print(f'Out of date: {rel}')
+            else:
+                with open(ROOT / rel, 'w', encoding='utf-8', newline='') as f:
+                    f.write(new)
+                print(f'Wrote {rel}')
+        elif not args.explain:
+            print(f'Up to date: {rel}')
+        if cache is not None:
+            cache.record(rel, inputs + sorted(refs))
+    for rel in selected:
+        for out_dir, config, render in DATA.get(rel, []):
+            inputs = page_inputs([(out_dir, config, render)])
+            if cache is not None:
+                fresh, reason = check_outputs(cache, out_dir, inputs)
+                if not args.incremental:
+                    fresh, reason = False, f'full build ({reason})'
+                if fresh:
+                    if args.explain:
+                        print(f'skip     {out_dir}/: {reason}')
+                    continue
+                if args.explain:
+                    print(f'rebuild  {out_dir}/: {reason}')
+            files, removed = build_data(out_dir, config, render, configs)
+            changed = [path for path, (old, new) in files.items() if old != new]
+            stale.extend(changed + removed)
+            if args.check:
+                for path in changed + removed:
+                    print(f'Out of date: {path}')
+                if not changed and not removed:
+                    print(f'Up to date: {out_dir}/ ({len(files)} files)')
+                continue
+            for path in changed:
+                (ROOT / path).parent.mkdir(parents=True, exist_ok=True)
+                with open(ROOT / path, 'w', encoding='utf-8', newline='') as f:
+                    f.write(files[path][1])
+                print(f'Wrote {path}')
+            for path in removed:
+                (ROOT / path).unlink()
+                print(f'Removed {path}')
+            if not changed and not removed and not args.explain:
+                print(f'Up to date: {out_dir}/ ({len(files)} files)')
+            if cache is not None:
+                for path in removed:
+                    cache.forget(path)
+                for path in files:
+                    cache.record(path, inputs)
+    if cache is not None:
+        cache.save()
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
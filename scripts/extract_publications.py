@@ -2,22 +2,36 @@
 """
 One-off script to extract publications from pages/publications.html
 and write configs/publications.yaml. Run from project root.
-Requires: pip install beautifulsoup4 pyyaml
+Requires: pip install pyyaml (beautifulsoup4 for --legacy; lxml is used if installed)
+
+The page is read in one streaming pass: parser events (lxml's target
+parser when available, html.parser otherwise) drive PublicationStream,
+which tracks the year tabs and paper columns on a stack of open elements
+instead of building a DOM. --legacy runs the original BeautifulSoup walk;
+both produce the same records (scripts/bench_extract_publications.py
+checks that and compares their speed).
 """
+import argparse
 import re
 import sys
+from html.parser import HTMLParser
 from pathlib import Path
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("Run: pip install beautifulsoup4", file=sys.stderr)
-    sys.exit(1)
 try:
     import yaml
 except ImportError:
     print("Run: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+ROOT = Path(__file__).resolve().parent.parent
+MAIN_TABS_ID = 'wp-block-themeisle-blocks-tabs-ed27d658'
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+LINK_LABELS = ('PDF', 'CODE', 'DATASET')
+CHUNK_SIZE = 1 << 16
 
 # manualCategories from the existing script (title -> list of category slugs)
 MANUAL_CATEGORIES = {
@@ -214,7 +228,11 @@ def get_year_from_tab(tab_item):
     header = tab_item.find(class_='wp-block-themeisle-blocks-tabs-item__header')
     if not header:
         return ''
-    t = norm_title(header.get_text())
+    return year_from_header(header.get_text())
+
+
+def year_from_header(text):
+    t = norm_title(text)
     if re.match(r'^202\d$', t):
         return t
     if re.search(r'before\s*2020', t, re.I):
@@ -222,35 +240,50 @@ def get_year_from_tab(tab_item):
     return t
 
 
-def main():
-    root = Path(__file__).resolve().parent.parent
-    html_path = root / 'pages' / 'publications.html'
-    yaml_path = root / 'configs' / 'publications.yaml'
+def venue_from_divs(divs):
+    """(venue_text, is_journal, links) from (first <strong> text, links) per div, in document order."""
+    venue_text = ''
+    is_journal = False
+    links = {}
+    for text, div_links in divs:
+        if text is None:
+            continue
+        if JOURNAL_PATTERN.search(text):
+            is_journal = True
+        if re.match(r'^(20\d{2}|Before 2020|TPAMI|TITS|TKDE|KDD|ICML|NeurIPS|AAAI|WWW|ICDE|IJCAI|MM|SIGSPATIAL|NAACL|IJCNN|WCSP|TVCG|TRC|InfoFusion|ACM MM)', text, re.I) or len(text) < 30:
+            venue_text = norm_title(text)
+        links.update(div_links)
+    return venue_text, is_journal, links
+
 
+# --- legacy extractor (BeautifulSoup DOM walk) ---
+
+def legacy_extract(html_path):
+    """[(year, paper column fields)] via BeautifulSoup; the original implementation."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        print("Run: pip install beautifulsoup4", file=sys.stderr)
+        sys.exit(1)
     with open(html_path, 'r', encoding='utf-8') as f:
         soup = BeautifulSoup(f.read(), 'html.parser')
 
-    main_tabs = soup.find(id='wp-block-themeisle-blocks-tabs-ed27d658')
+    main_tabs = soup.find(id=MAIN_TABS_ID)
     if not main_tabs:
-        print('Main tabs not found', file=sys.stderr)
-        sys.exit(1)
+        raise ValueError('Main tabs not found')
     all_tab = main_tabs.find(attrs={'data-pub-filter': 'all'})
     if not all_tab:
-        print('All tab not found', file=sys.stderr)
-        sys.exit(1)
+        raise ValueError('All tab not found')
     all_content = all_tab.find(class_='wp-block-themeisle-blocks-tabs-item__content')
     if not all_content:
-        print('All content not found', file=sys.stderr)
-        sys.exit(1)
+        raise ValueError('All content not found')
     inner_tabs = all_content.find(class_=lambda c: c and 'wp-block-themeisle-blocks-tabs' in (c if isinstance(c, list) else [c]))
     if not inner_tabs:
-        print('Inner tabs not found', file=sys.stderr)
-        sys.exit(1)
+        raise ValueError('Inner tabs not found')
     inner_content = inner_tabs.find(class_=lambda c: c and 'wp-block-themeisle-blocks-tabs__content' in (c if isinstance(c, list) else [c]))
     year_tab_items = (inner_content or inner_tabs).find_all(class_=lambda c: c and 'wp-block-themeisle-blocks-tabs-item' in (c if isinstance(c, list) else [c]), recursive=False)
 
     out = []
-    seen_titles = set()
     for year_item in year_tab_items:
         year = get_year_from_tab(year_item)
         if not year:
@@ -259,30 +292,363 @@ def main():
         if not content:
             continue
         for col in find_paper_columns(content):
-            title = get_title(col)
-            if not title or title in seen_titles:
-                continue
-            seen_titles.add(title)
-            authors = get_author(col)
             venue_text, is_journal, pdf_link, code_link, dataset_link = get_venue_and_links(col)
-            image = get_image(col)
-            cats = list(MANUAL_CATEGORIES.get(title, ['others']))
-            if not cats:
-                cats = ['others']
-            entry = {
-                'title': title,
-                'authors': authors or '',
-                'venue': venue_text or '',
-                'year': int(year) if year.isdigit() else year,
-                'is_journal': is_journal,
-                'categories': cats,
-                'image': image or '',
-                'pdf_link': pdf_link or '',
-                'code_link': code_link or '',
-                'dataset_link': dataset_link or '',
-            }
-            out.append(entry)
+            out.append((year, {
+                'title': get_title(col), 'authors': get_author(col), 'venue': venue_text, 'is_journal': is_journal,
+                'image': get_image(col), 'pdf_link': pdf_link, 'code_link': code_link, 'dataset_link': dataset_link,
+            }))
+    return out
+
+
+# --- streaming extractor ---
+
+class _Frame:
+    __slots__ = ('tag', 'classes', 'attrs', 'order', 'text', 'block', 'col', 'div', 'role')
+
+    def __init__(self, tag, attrs, order):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = set((attrs.get('class') or '').split())
+        self.order = order  # start-tag index
+        self.text = None    # list of strings while the element's text is needed
+        self.block = None   # dict for .wp-block-themeisle-blocks-advanced-columns
+        self.col = None     # dict for .wp-block-themeisle-blocks-advanced-column
+        self.div = None     # [first <strong> text, {label: (order, href)}] for a <div> inside a column
+        self.role = None    # position in the tabs structure
+
+
+class PublicationStream:
+    """Single-pass counterpart of legacy_extract(), fed start/end/data events.
+
+    Paper blocks (advanced-columns holding a .title and a .wp-block-image
+    whose first nested block does not) and the fields of their enclosing
+    column are tracked on the stack of open elements, so each element is
+    looked at once instead of once per find_all/find_parent scan. Open
+    blocks, columns, divs and text captures are kept in their own lists so
+    an element only touches the ones it can affect. Once the year tabs are
+    closed nothing else on the page matters and done is set.
+    """
+
+    # Roles of the tabs structure, each the first match inside the previous one.
+    CHAIN = (
+        ('main', lambda f: f.attrs.get('id') == MAIN_TABS_ID),
+        ('all', lambda f: f.attrs.get('data-pub-filter') == 'all'),
+        ('all-content', lambda f: 'wp-block-themeisle-blocks-tabs-item__content' in f.classes),
+        ('inner', lambda f: 'wp-block-themeisle-blocks-tabs' in f.classes),
+        ('inner-content', lambda f: 'wp-block-themeisle-blocks-tabs__content' in f.classes),
+    )
+
+    def __init__(self):
+        self.stack = []
+        self.blocks = []       # open paper-block candidates
+        self.cols = []         # open columns
+        self.divs = []         # open divs inside columns
+        self.capturing = []    # open frames whose text is collected
+        self.open_roles = set()
+        self.found = 0         # how many CHAIN roles have been found
+        self.order = 0
+        self.items = []        # [year, [(order, fields)], content seen] per year tab
+        self.item = None
+        self.in_content = 0    # depth of open year-tab content elements
+        self.pub_entries = 0   # open .pub-entry elements
+        self.done = False
+
+    def _role(self, frame):
+        """Which part of the tabs structure frame is, mirroring legacy_extract()'s find() chain."""
+        if self.found < len(self.CHAIN):
+            role, test = self.CHAIN[self.found]
+            if (self.found == 0 or self.CHAIN[self.found - 1][0] in self.open_roles) and test(frame):
+                self.found += 1
+                return role
+        parent = self.stack[-1].role if self.stack else None
+        cls = frame.classes
+        if 'wp-block-themeisle-blocks-tabs-item' in cls and (parent == 'inner-content' or (parent == 'inner' and self.found < len(self.CHAIN))):
+            return 'year-item'
+        if self.item is not None:
+            if 'wp-block-themeisle-blocks-tabs-item__header' in cls and self.item[0] is None:
+                return 'year-header'
+            if 'wp-block-themeisle-blocks-tabs-item__content' in cls and not self.item[2]:
+                return 'year-content'
+        return None
+
+    def start(self, tag, attrs):
+        self.order += 1
+        frame = _Frame(tag, attrs, self.order)
+        cls = frame.classes
+        role = self._role(frame)
+        if role:
+            frame.role = role
+            self.open_roles.add(role)
+            if role == 'year-item':
+                self.item = [None, [], False]
+                self.items.append(self.item)
+            elif role == 'year-header':
+                self.item[0] = ''
+                self._capture(frame)
+            elif role == 'year-content':
+                self.item[2] = True
+                self.in_content += 1
+        if 'pub-entry' in cls:
+            self.pub_entries += 1
+        if self.blocks and ('title' in cls or 'wp-block-image' in cls):
+            key = 'title' if 'title' in cls else 'image'
+            for b in self.blocks:
+                b[key] = True
+        if 'wp-block-themeisle-blocks-advanced-columns' in cls:
+            frame.block = {'order': self.order, 'title': False, 'image': False, 'nested': None,
+                           'scoped': self.in_content > 0}
+            for b in self.blocks:
+                if b['nested'] is None:
+                    b['nested'] = frame.block
+            self.blocks.append(frame.block)
+        if self.cols:
+            self._column_start(frame, tag, attrs, cls)
+        if 'wp-block-themeisle-blocks-advanced-column' in cls:
+            frame.col = {'title_el': None, 'title_strong': None, 'title': None, 'author': None, 'image': None,
+                         'divs': [], 'paper': None, 'in_pub_entry': self.pub_entries > 0}
+            self.cols.append(frame.col)
+        self.stack.append(frame)
+        if tag in VOID_TAGS:
+            self.end(tag)
+
+    def _capture(self, frame):
+        frame.text = []
+        self.capturing.append(frame)
+
+    def _column_start(self, frame, tag, attrs, cls):
+        """Record what get_title/get_author/get_image/get_venue_and_links would find."""
+        if 'title' in cls:
+            for c in self.cols:
+                if c['title_el'] is None:
+                    c['title_el'] = frame
+        if 'author' in cls:
+            for c in self.cols:
+                if c['author'] is None:
+                    c['author'] = frame
+            self._capture(frame)
+        if tag == 'strong':
+            self._capture(frame)
+            for c in self.cols:
+                # The title element is still open iff its text is still being read.
+                if c['title_strong'] is None and c['title_el'] is not None and c['title'] is None and c['title_el'].role != 'closed':
+                    c['title_strong'] = frame
+            for d in self.divs:
+                if d[0] is None:
+                    d[0] = frame
+        elif tag == 'a' and 'href' in attrs:
+            self._capture(frame)
+        elif tag == 'img' and 'src' in attrs:
+            for c in self.cols:
+                if c['image'] is None:
+                    c['image'] = attrs['src']
+        elif tag == 'div':
+            frame.div = [None, {}]
+            for c in self.cols:
+                c['divs'].append(frame.div)
+            self.divs.append(frame.div)
+
+    def data(self, text):
+        for f in self.capturing:
+            f.text.append(text)
+
+    def end(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                break
+        else:
+            return
+        while len(self.stack) > i:
+            self._close(self.stack.pop())
+
+    def _close(self, frame):
+        text = None
+        if frame.text is not None:
+            text = ''.join(frame.text)
+            self.capturing.pop()
+        if frame.tag == 'strong' and text is not None:
+            for d in self.divs:
+                if d[0] is frame:
+                    d[0] = text
+            for c in self.cols:
+                if c['title_strong'] is frame:
+                    c['title'] = norm_title(text)
+        elif frame.tag == 'a' and text is not None:
+            label = norm_title(text)
+            if label in LINK_LABELS:
+                href = frame.attrs.get('href', '').strip()
+                # Nested links resolve in start-tag order, as find_all('a') visits them.
+                for d in self.divs:
+                    if frame.order > d[1].get(label, (0,))[0]:
+                        d[1][label] = (frame.order, href)
+        if frame.div is not None:
+            self.divs.pop()
+            if not isinstance(frame.div[0], str):
+                frame.div[0] = None
+        for c in self.cols:
+            if c['author'] is frame:
+                c['author'] = norm_title(text)
+        block = frame.block
+        if block is not None:
+            self.blocks.pop()
+            if block['scoped'] and block['title'] and block['image']:
+                nested = block['nested']
+                if not (nested and nested['title'] and nested['image']):
+                    self._mark_column(block['order'])
+        if frame.col is not None:
+            self.cols.pop()
+            if frame.col['paper'] is not None:
+                self._emit(frame.col)
+        if 'pub-entry' in frame.classes:
+            self.pub_entries -= 1
+        role = frame.role
+        if role:
+            self.open_roles.discard(role)
+            if role == 'year-header':
+                self.item[0] = year_from_header(text)
+            elif role == 'year-content':
+                self.in_content -= 1
+            elif role == 'year-item':
+                self.item = None
+            elif role == 'inner':
+                self.done = True
+        frame.role = 'closed'
+
+    def _mark_column(self, order):
+        """Flag the nearest open column (the block's find_parent) unless it sits in a .pub-entry."""
+        if self.cols:
+            col = self.cols[-1]
+            # A column is listed at its first paper block, like the find_all() order.
+            if not col['in_pub_entry'] and (col['paper'] is None or order < col['paper'][0]):
+                col['paper'] = (order, self.item)
+
+    def _emit(self, col):
+        order, item = col['paper']
+        if item is None:
+            return
+        venue_text, is_journal, links = venue_from_divs([(text, {k: v[1] for k, v in links.items()}) for text, links in col['divs']])
+        author = col['author']
+        item[1].append((order, {
+            'title': col['title'] or '',
+            'authors': author if isinstance(author, str) else '',
+            'venue': venue_text, 'is_journal': is_journal, 'image': col['image'] or '',
+            'pdf_link': links.get('PDF'), 'code_link': links.get('CODE'), 'dataset_link': links.get('DATASET'),
+        }))
+
+    def close(self):
+        while self.stack:
+            self._close(self.stack.pop())
+        for (role, _), what in zip(self.CHAIN, ('Main tabs', 'All tab', 'All content', 'Inner tabs')):
+            if self.found <= [r for r, _ in self.CHAIN].index(role):
+                raise ValueError(f'{what} not found')
+        return [(year, fields) for year, cols, _ in self.items if year for _, fields in sorted(cols, key=lambda c: c[0])]
+
+
+class _HTMLParserEvents(HTMLParser):
+    def __init__(self, stream):
+        super().__init__(convert_charrefs=True)
+        self.stream = stream
+
+    def handle_starttag(self, tag, attrs):
+        self.stream.start(tag, {k: v if v is not None else '' for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stream.end(tag)
+
+    def handle_endtag(self, tag):
+        self.stream.end(tag)
+
+    def handle_data(self, data):
+        self.stream.data(data)
+
+
+class _LxmlTarget:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def start(self, tag, attrib):
+        self.stream.start(tag, dict(attrib))
+
+    def end(self, tag):
+        if tag not in VOID_TAGS:
+            self.stream.end(tag)
+
+    def data(self, data):
+        self.stream.data(data)
+
+    def close(self):
+        return None
+
+
+def stream_extract(html_path, parser='auto'):
+    """[(year, paper column fields)] in one pass over html_path, read in chunks."""
+    stream = PublicationStream()
+    if parser == 'lxml' or (parser == 'auto' and etree is not None):
+        if etree is None:
+            raise ValueError('lxml is not installed')
+        feeder = etree.HTMLParser(target=_LxmlTarget(stream), encoding='utf-8')
+        mode = 'rb'
+    else:
+        feeder = _HTMLParserEvents(stream)
+        mode = 'r'
+    with open(html_path, mode, **({} if mode == 'rb' else {'encoding': 'utf-8'})) as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b'' if mode == 'rb' else ''):
+            feeder.feed(chunk)
+            if stream.done:
+                break
+    feeder.close()
+    return stream.close()
+
+
+def build_entries(columns):
+    """publications.yaml records from [(year, fields)], first occurrence of each title wins."""
+    out = []
+    seen_titles = set()
+    for year, col in columns:
+        title = col['title']
+        if not title or title in seen_titles:
+            continue
+        seen_titles.add(title)
+        cats = list(MANUAL_CATEGORIES.get(title, ['others']))
+        if not cats:
+            cats = ['others']
+        out.append({
+            'title': title,
+            'authors': col['authors'] or '',
+            'venue': col['venue'] or '',
+            'year': int(year) if year.isdigit() else year,
+            'is_journal': col['is_journal'],
+            'categories': cats,
+            'image': col['image'] or '',
+            'pdf_link': col['pdf_link'] or '',
+            'code_link': col['code_link'] or '',
+            'dataset_link': col['dataset_link'] or '',
+        })
+    return out
+
+
+def extract(html_path, parser='auto'):
+    columns = legacy_extract(html_path) if parser == 'legacy' else stream_extract(html_path, parser)
+    return build_entries(columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('html', nargs='?', type=Path, default=ROOT / 'pages' / 'publications.html')
+    parser.add_argument('-o', '--output', type=Path, default=ROOT / 'configs' / 'publications.yaml')
+    parser.add_argument('--parser', choices=['auto', 'html.parser', 'lxml', 'legacy'], default='auto',
+                        help='auto: lxml if installed, else html.parser; legacy: the BeautifulSoup walk')
+    parser.add_argument('--legacy', dest='parser', action='store_const', const='legacy', help='same as --parser legacy')
+    args = parser.parse_args()
+
+    try:
+        out = extract(args.html, args.parser)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
+    yaml_path = args.output
     yaml_path.parent.mkdir(parents=True, exist_ok=True)
     with open(yaml_path, 'w', encoding='utf-8') as f:
         f.write('# Publications list. Edit this file; page loads it and renders automatically.\n')
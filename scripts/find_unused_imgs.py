@@ -1,67 +1,85 @@
 #!/usr/bin/env python3
-"""Find and delete unused image/assets under imgs (excluding logo/)."""
-import os
-import re
-from pathlib import Path
+"""
+Find unused image/assets under imgs (excluding logo/) and broken imgs/
+references. Run from project root.
+
+Uses the reference index from asset_index.py, so the tree is walked once and
+unchanged files are not re-read. Nothing is deleted unless --delete is given:
+
+    python scripts/find_unused_imgs.py            # dry run: list unused and missing
+    python scripts/find_unused_imgs.py --delete   # delete the unused files
+
+Files a build manifest lists (the sources of fingerprinted copies) count as
+used. As a safeguard, nothing is deleted, and the exit status is 1, if any
+of them is still reported unused. Exits 1 as well if any page or config
+references an image that does not exist.
+"""
+import argparse
+import json
+import sys
+
+from asset_index import BUILD_MANIFESTS, ROOT, AssetIndex, manifest_paths, print_locations
+
+# Kept even when nothing references them.
+KEEP_DIRS = ('imgs/logo/', 'imgs/derived/')
+# Only delete image + css, not other assets
+EXT_DELETE = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".css")
+
+
+def manifest_listed():
+    """imgs/ paths listed by the build manifests, read directly rather than from the index."""
+    listed = set()
+    for rel in BUILD_MANIFESTS:
+        if (ROOT / rel).is_file():
+            with open(ROOT / rel, 'r', encoding='utf-8') as f:
+                listed |= manifest_paths(json.load(f))
+    return listed
 
-ROOT = Path(__file__).resolve().parent.parent
-IMGS = ROOT / "imgs"
-# Only consider these as "used" – image + CSS that are linked
-EXT_KEEP = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".css")
 
 def main():
-    # 1. Collect all referenced paths: subdir/filename (no query string)
-    refs = set()
-    # Match imgs/subdir/name (with optional leading / or ../)
-    pattern = re.compile(
-        r"imgs/(common|datasets|people|photos|publications)/([^\"'\s\)\?]+)"
-    )
-    for ext in ("*.html", "*.yaml", "*.yml", "*.css"):
-        for f in ROOT.rglob(ext):
-            if "node_modules" in str(f) or "wp-content/plugins" in str(f):
-                continue
-            try:
-                text = f.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
-            for m in pattern.finditer(text):
-                sub, name = m.group(1), m.group(2).split("?")[0].strip()
-                if name:
-                    refs.add(f"{sub}/{name}")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dry-run', dest='delete', action='store_false', default=False,
+                      help='only list what would be deleted (default)')
+    mode.add_argument('--delete', dest='delete', action='store_true', help='delete the unused files')
+    args = parser.parse_args()
 
-    # 2. List all files under imgs except logo/
-    all_files = []
-    for d in ("common", "datasets", "people", "photos", "publications"):
-        subdir = IMGS / d
-        if not subdir.is_dir():
-            continue
-        for f in subdir.rglob("*"):
-            if f.is_file():
-                rel = f.relative_to(IMGS)
-                all_files.append(str(rel))
+    index = AssetIndex.refresh()
+    unused = [rel for rel in index.unused()
+              if not rel.startswith(KEEP_DIRS) and rel.lower().endswith(EXT_DELETE)]
 
-    # 3. Determine unused (only delete image + css, not other assets)
-    unused = []
-    for rel in all_files:
-        if rel in refs:
-            continue
-        lower = rel.lower()
-        if any(lower.endswith(e) for e in EXT_KEEP):
-            unused.append(rel)
+    listed = sorted(set(unused) & manifest_listed())
+    if listed:
+        print("Build manifest files reported unused, nothing deleted:", file=sys.stderr)
+        for rel in listed:
+            print(f"  {rel}", file=sys.stderr)
+        sys.exit(1)
 
-    # 4. Delete unused
     deleted = []
-    for rel in sorted(unused):
-        p = IMGS / rel
-        if p.is_file():
-            try:
-                p.unlink()
-                deleted.append(rel)
-            except Exception as e:
-                print(f"Skip delete {rel}: {e}")
-    for r in deleted:
-        print("Deleted:", r)
-    print("Total deleted:", len(deleted))
+    for rel in unused:
+        if not args.delete:
+            print("Unused:", rel)
+            continue
+        try:
+            (ROOT / rel).unlink()
+            deleted.append(rel)
+            print("Deleted:", rel)
+        except OSError as e:
+            print(f"Skip delete {rel}: {e}")
+    if args.delete:
+        AssetIndex.refresh()
+        print("Total deleted:", len(deleted))
+    else:
+        print(f"Total unused: {len(unused)} (dry run, pass --delete to remove)")
+
+    missing = index.missing()
+    if missing:
+        print(f"\n{len(missing)} referenced file(s) missing:", file=sys.stderr)
+        for asset, locations in missing.items():
+            print(asset, file=sys.stderr)
+            print_locations(locations, file=sys.stderr)
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
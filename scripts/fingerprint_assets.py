@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Fingerprint the CSS, JS and font files the pages load so they can be cached for a year.
+Run from project root.
+
+Every local stylesheet and script referenced from index.html, pages/*.html
+and inc/*.html is copied next to itself as name.<hash>.ext (hash: the first
+10 hex digits of the sha256 of the copy) and the reference is rewritten to
+the copy, without the ?ver= query many caches ignore. Fonts used by an
+@font-face rule in one of those stylesheets get the same treatment and the
+stylesheet's copy points at them; its other url()s stay relative, which
+still works because copies sit next to their sources. Sources are kept, and
+asset-manifest.json maps each one to its copy:
+
+    {"version": 1, "assets": {"wp-content/themes/bloglo/style.css": "wp-content/themes/bloglo/style.0123456789.css", ...}}
+
+Every copy in the manifest can be served with
+"Cache-Control: public, max-age=31536000, immutable". After a source
+changes, rerun: the new copy is written, references move to it and the old
+copy is removed. Files loaded from JavaScript (inc/search.js, data/*.json)
+keep their names, and so do files already named after their own hash (the
+bundles scripts/build_css.py writes to css/).
+
+Scripts that only drive a block the page does not contain are removed from
+the page (SCRIPT_TRIGGERS), and so are the vendor libraries none of the
+remaining scripts depend on (SCRIPT_DEPS), e.g. React, ReactDOM and
+regenerator-runtime, which only the Essential Blocks slider needs.
+
+    python scripts/fingerprint_assets.py           # write copies, rewrite pages
+    python scripts/fingerprint_assets.py --check   # exit 1 if anything would change
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path, PurePosixPath
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST = ROOT / 'asset-manifest.json'
+VERSION = 1
+HASH_LEN = 10
+PAGE_GLOBS = ('index.html', 'pages/*.html', 'inc/*.html')
+FONT_EXTS = ('.woff2', '.woff', '.ttf', '.otf', '.eot', '.svg')
+ASSET_EXTS = ('.css', '.js') + FONT_EXTS
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{%d}(\.[^./]+)$' % HASH_LEN)
+
+# Script id -> classes of the blocks it drives; dropped from pages that have none of them.
+SCRIPT_TRIGGERS = {
+    'essential-blocks-slider-frontend-js': ('eb-slider-wrapper',),
+}
+# Script id -> ids of the scripts it needs, as WordPress registered them.
+SCRIPT_DEPS = {
+    'essential-blocks-slider-frontend-js': [
+        'essential-blocks-controls-frontend-js', 'essential-blocks-slickjs-js', 'essential-blocks-slick-lightbox-js-js',
+        'essential-blocks-vendor-bundle-js', 'essential-blocks-babel-bundle-js', 'wp-dom-ready-js', 'wp-element-js',
+    ],
+    'essential-blocks-controls-frontend-js': ['essential-blocks-vendor-bundle-js', 'wp-element-js', 'wp-polyfill-js'],
+    'essential-blocks-slick-lightbox-js-js': ['essential-blocks-slickjs-js'],
+    'wp-element-js': ['react-js', 'react-dom-js', 'wp-escape-html-js'],
+    'react-dom-js': ['react-js'],
+    'wp-polyfill-js': ['regenerator-runtime-js'],
+}
+# Anything listed as a dependency is only on a page for the scripts that need it.
+VENDOR_SCRIPTS = frozenset().union(*SCRIPT_DEPS.values())
+
+REF_TAG = re.compile(r'<(?:link|script)\b[^>]*>')
+REF_ATTR = re.compile(r'(\b(?:href|src)=")([^"]+)(")')
+TAG_ATTR = re.compile(r'\b([\w-]+)="([^"]*)"')
+SCRIPT = re.compile(r'[ \t]*<script\b([^>]*)>(.*?)</script>[ \t]*\n?', re.S)
+CLASS_ATTR = re.compile(r'\bclass="([^"]*)"')
+FONT_FACE = re.compile(r'@font-face\s*\{[^}]*\}', re.I)
+CSS_URL = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(path=MANIFEST):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('assets', {}) if data.get('version') == VERSION else {}
+
+
+def split_url(url):
+    """(path, suffix) where suffix is the ?query/#fragment part."""
+    m = re.search(r'[?#]', url)
+    return (url[:m.start()], url[m.start():]) if m else (url, '')
+
+
+def resolve(rel, url):
+    """Root-relative path a local reference from file rel points to, or None.
+
+    {{BASE}} (inc/head-common.html) stands for the root at any page depth.
+    """
+    path, _ = split_url(url)
+    if path.startswith('{{BASE}}'):
+        path = '/' + path[len('{{BASE}}'):]
+    if not path or '://' in path or path.startswith(('//', 'data:', 'mailto:')) or '{{' in path:
+        return None
+    target = ROOT / path.lstrip('/') if path.startswith('/') else (ROOT / rel).parent / path
+    target = target.resolve()
+    if ROOT not in target.parents:
+        return None
+    return target.relative_to(ROOT).as_posix()
+
+
+def repoint(url, dest):
+    """url with its file name replaced by dest's and the query dropped."""
+    path, _ = split_url(url)
+    return path[:path.rfind('/') + 1] + PurePosixPath(dest).name
+
+
+class Fingerprinter:
+    """Computes the fingerprinted copy of each source once; nothing is written until write()."""
+
+    def __init__(self, previous):
+        self.previous = previous
+        self.copies = {v: k for k, v in previous.items()}
+        self.assets = {}   # source -> copy
+        self.outputs = {}  # copy -> bytes
+        self.missing = {}  # referenced path -> referrers
+
+    def source_of(self, path):
+        """Source behind a referenced path, which may already be a copy."""
+        if path in self.copies:
+            return self.copies[path]
+        # A copy the manifest lost track of.
+        m = FINGERPRINTED.search(path)
+        if m and (ROOT / (path[:m.start()] + m.group(1))).is_file():
+            return path[:m.start()] + m.group(1)
+        return path
+
+    def self_named(self, path):
+        """True for a file that already carries its own hash and is not one of our copies."""
+        m = FINGERPRINTED.search(path)
+        if not m or path in self.copies or not (ROOT / path).is_file():
+            return False
+        return sha256_hex((ROOT / path).read_bytes())[:HASH_LEN] == path[m.start() + 1:m.start() + 1 + HASH_LEN]
+
+    def fingerprint(self, source):
+        """Root-relative path of source's copy (computed on first use)."""
+        if source in self.assets:
+            return self.assets[source]
+        data = (ROOT / source).read_bytes()
+        if source.endswith('.css'):
+            data = self.rewrite_css(source, data.decode('utf-8')).encode('utf-8')
+        p = PurePosixPath(source)
+        dest = str(p.with_name(f'{p.stem}.{sha256_hex(data)[:HASH_LEN]}{p.suffix}'))
+        self.assets[source] = dest
+        self.outputs[dest] = data
+        return dest
+
+    def rewrite_css(self, source, css):
+        """Point the url()s of @font-face rules at fingerprinted fonts."""
+        def font(m):
+            quote, url = m.group(1), m.group(2)
+            path = resolve(source, url)
+            if path is None or not path.lower().endswith(FONT_EXTS):
+                return m.group(0)
+            path = self.source_of(path)
+            if not (ROOT / path).is_file():
+                self.missing.setdefault(path, set()).add(source)
+                return m.group(0)
+            dest = self.fingerprint(path)
+            return f'url({quote}{repoint(url, dest)}{split_url(url)[1]}{quote})'
+
+        return FONT_FACE.sub(lambda block: CSS_URL.sub(font, block.group(0)), css)
+
+    def rewrite_html(self, rel, html):
+        """html with local CSS/JS/font references pointing at their copies."""
+        def attr(m):
+            url = m.group(2)
+            path = resolve(rel, url)
+            if path is None or not self.source_of(path).lower().endswith(ASSET_EXTS) or self.self_named(path):
+                return m.group(0)
+            source = self.source_of(path)
+            if not (ROOT / source).is_file():
+                self.missing.setdefault(source, set()).add(rel)
+                return m.group(0)
+            return m.group(1) + repoint(url, self.fingerprint(source)) + m.group(3)
+
+        return REF_TAG.sub(lambda tag: REF_ATTR.sub(attr, tag.group(0)), html)
+
+    def stale(self):
+        """Copies from the previous run that are no longer produced."""
+        return sorted(set(self.previous.values()) - set(self.outputs))
+
+
+def unused_scripts(html):
+    """Ids of the script tags a page can do without (see SCRIPT_TRIGGERS and SCRIPT_DEPS)."""
+    ids = {dict(TAG_ATTR.findall(m.group(1))).get('id') for m in SCRIPT.finditer(html) if ' src="' in f' {m.group(1)}'}
+    ids.discard(None)
+    classes = {c for value in CLASS_ATTR.findall(html) for c in value.split()}
+    needed = [i for i in ids if i not in VENDOR_SCRIPTS and
+              (i not in SCRIPT_TRIGGERS or classes & set(SCRIPT_TRIGGERS[i]))]
+    keep = set()
+    while needed:
+        i = needed.pop()
+        if i not in keep:
+            keep.add(i)
+            needed.extend(SCRIPT_DEPS.get(i, []))
+    return {i for i in ids if i in VENDOR_SCRIPTS or i in SCRIPT_TRIGGERS} - keep
+
+
+def drop_scripts(html, ids):
+    """html without the script tags with these ids, or their inline -extra/-before/-after data."""
+    owned = set(ids) | {f'{i}-{part}' for i in ids for part in ('extra', 'before', 'after')}
+    return SCRIPT.sub(lambda m: '' if dict(TAG_ATTR.findall(m.group(1))).get('id') in owned else m.group(0), html)
+
+
+def page_files():
+    seen = []
+    for pattern in PAGE_GLOBS:
+        for path in sorted(ROOT.glob(pattern)):
+            rel = path.relative_to(ROOT).as_posix()
+            if rel not in seen:
+                seen.append(rel)
+    return seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='exit 1 if any page, copy or the manifest is out of date, write nothing')
+    args = parser.parse_args()
+
+    fp = Fingerprinter(load_manifest())
+    pages = {}
+    dropped = {}
+    for rel in page_files():
+        with open(ROOT / rel, 'r', encoding='utf-8', newline='') as f:
+            old = f.read()
+        new = old
+        if not rel.startswith('inc/'):
+            unused = unused_scripts(new)
+            if unused:
+                dropped[rel] = sorted(unused)
+                new = drop_scripts(new, unused)
+        pages[rel] = (old, fp.rewrite_html(rel, new))
+
+    manifest = json.dumps({'version': VERSION, 'assets': dict(sorted(fp.assets.items()))}, indent=1) + '\n'
+    old_manifest = MANIFEST.read_text(encoding='utf-8') if MANIFEST.is_file() else None
+    copies = [dest for dest, data in sorted(fp.outputs.items())
+              if not (ROOT / dest).is_file() or (ROOT / dest).read_bytes() != data]
+    changed = [rel for rel, (old, new) in pages.items() if old != new]
+    stale = [dest for dest in fp.stale() if (ROOT / dest).is_file()]
+
+    for rel, ids in dropped.items():
+        print(f'{rel}: dropped {len(ids)} unused script(s): {", ".join(ids)}')
+    for path, referrers in sorted(fp.missing.items()):
+        print(f'Missing: {path} (referenced from {", ".join(sorted(referrers))})', file=sys.stderr)
+
+    if args.check:
+        for path in copies + changed + stale + ([MANIFEST.name] if old_manifest != manifest else []):
+            print(f'Out of date: {path}')
+        if copies or changed or stale or old_manifest != manifest:
+            sys.exit(1)
+        print(f'Up to date: {len(fp.assets)} fingerprinted assets')
+        return
+
+    for dest in copies:
+        (ROOT / dest).write_bytes(fp.outputs[dest])
+        print(f'Wrote {dest}')
+    for rel in changed:
+        with open(ROOT / rel, 'w', encoding='utf-8', newline='') as f:
+            f.write(pages[rel][1])
+        print(f'Rewrote {rel}')
+    for dest in stale:
+        (ROOT / dest).unlink()
+        print(f'Removed {dest}')
+    if old_manifest != manifest:
+        with open(MANIFEST, 'w', encoding='utf-8', newline='') as f:
+            f.write(manifest)
+        print(f'Wrote {MANIFEST.name}')
+    total = sum(len(data) for data in fp.outputs.values())
+    print(f'{len(fp.assets)} fingerprinted assets ({total / 1024:.0f} KB), {len(changed)} page(s) rewritten')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Recompress the images under imgs/ in place, strip their metadata and check
+per-directory size budgets. Run from project root.
+Requires: pip install pillow pyyaml
+
+Files keep their name and format, so no reference needs to change. Images
+wider than their directory's MAX_WIDTH are downscaled first. Under
+imgs/people only the avatars (the image: fields of configs/people.yaml,
+shown at 160-300px) get the people cap and budget; the rest of that
+directory (team.jpg, the People hero background, and the collaborators
+logo) is shown full width and is treated like imgs/common. A file is only
+replaced when the result is smaller.
+
+The sha256 of every file that has been optimized (or could not be improved)
+is kept in .imgopt-cache.json, so a rerun only opens new or edited files.
+Work is spread over a process pool (--jobs).
+
+After optimizing, every directory with a budget is checked; if any image is
+over its budget, or could not be optimized, the script exits 1 with the
+offenders ranked by size, e.g.
+
+    python scripts/optimize_imgs.py --budget people=80K --budget photos=400K
+    python scripts/optimize_imgs.py --check    # budgets only, rewrite nothing
+"""
+import argparse
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from build_cache import sha256_file
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    print("Run: pip install pillow", file=sys.stderr)
+    sys.exit(1)
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+IMGS = ROOT / 'imgs'
+CACHE_FILE = ROOT / '.imgopt-cache.json'
+EXTS = ('.jpg', '.jpeg', '.png')
+SKIP_DIRS = ('derived',)
+PEOPLE_CONFIG = ROOT / 'configs' / 'people.yaml'
+# Largest useful width per directory (about 3x the displayed width); 'people' is the avatars only.
+MAX_WIDTH = {'people': 480, 'publications': 1600, 'datasets': 1600, 'photos': 2048, 'common': 2048}
+# Default byte budget per image, per directory.
+BUDGETS = {'people': 80 * 1024, 'publications': 250 * 1024, 'datasets': 250 * 1024, 'photos': 400 * 1024}
+JPEG_OPTIONS = {'quality': 82, 'optimize': True, 'progressive': True}
+
+
+def parse_size(text):
+    text = text.strip().upper()
+    for suffix, mult in (('KB', 1024), ('K', 1024), ('MB', 1024 ** 2), ('M', 1024 ** 2), ('B', 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * mult)
+    return int(text)
+
+
+def fmt_size(n):
+    return f'{n / 1024:.1f} KB' if n < 1024 ** 2 else f'{n / 1024 ** 2:.2f} MB'
+
+
+def top_dir(rel):
+    parts = Path(rel).parts
+    return parts[1] if len(parts) > 2 else ''
+
+
+def avatars():
+    """imgs/... paths of the images configs/people.yaml shows as avatars."""
+    found = set()
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'image' and isinstance(value, str) and 'imgs/' in value:
+                    found.add('imgs/' + value.split('imgs/', 1)[1])
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    if PEOPLE_CONFIG.is_file():
+        with open(PEOPLE_CONFIG, 'r', encoding='utf-8') as f:
+            walk(yaml.safe_load(f))
+    return found
+
+
+def category(rel, avatar_paths):
+    """Key of rel in MAX_WIDTH/BUDGETS: its imgs/ subdirectory, except that only avatars count as 'people'."""
+    d = top_dir(rel)
+    return 'common' if d == 'people' and rel not in avatar_paths else d
+
+
+def optimize(rel, max_width):
+    """Recompress one image. Runs in a worker process; returns (rel, before, after)."""
+    path = ROOT / rel
+    before = path.stat().st_size
+    with Image.open(path) as im:
+        fmt = im.format
+        out = ImageOps.exif_transpose(im)
+        resized = max_width is not None and out.width > max_width
+        if resized:
+            out = out.resize((max_width, max(1, round(out.height * max_width / out.width))), Image.LANCZOS)
+        buf = io.BytesIO()
+        if fmt == 'JPEG':
+            out.convert('RGB').save(buf, format='JPEG', **JPEG_OPTIONS)
+        else:
+            # Saving without passing info drops text chunks, EXIF and ICC metadata.
+            out.save(buf, format='PNG', optimize=True)
+    data = buf.getvalue()
+    if len(data) >= before:
+        return rel, before, before
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return rel, before, len(data)
+
+
+def list_images(dirs):
+    for d in dirs:
+        for f in sorted((IMGS / d).rglob('*')):
+            if f.is_file() and f.suffix.lower() in EXTS:
+                yield f.relative_to(ROOT).as_posix()
+
+
+def load_cache():
+    if not CACHE_FILE.is_file():
+        return set()
+    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        return set(json.load(f).get('optimized', []))
+
+
+def save_cache(hashes):
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'optimized': sorted(hashes)}, f, indent=0)
+        f.write('\n')
+
+
+def budget_report(files, budgets, avatar_paths):
+    """Return the over-budget files as (size, rel, budget), largest first."""
+    over = []
+    for rel in files:
+        budget = budgets.get(category(rel, avatar_paths))
+        size = (ROOT / rel).stat().st_size
+        if budget is not None and size > budget:
+            over.append((size, rel, budget))
+    return sorted(over, reverse=True)
+
+
+def main():
+    default_dirs = sorted(p.name for p in IMGS.iterdir() if p.is_dir() and p.name not in SKIP_DIRS)
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dirs', nargs='*', default=default_dirs, help='subdirectories of imgs/ (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes (default: CPU count)')
+    parser.add_argument('--budget', action='append', default=[], metavar='DIR=SIZE',
+                        help='per-image budget for a directory (people: avatars only), e.g. people=80K (repeatable; overrides the defaults)')
+    parser.add_argument('--check', action='store_true', help='only check budgets, do not rewrite images')
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS)
+    for spec in args.budget:
+        d, _, size = spec.partition('=')
+        if not size:
+            parser.error(f'bad --budget {spec!r}, expected DIR=SIZE')
+        budgets[d] = parse_size(size)
+
+    files = list(list_images(args.dirs))
+    avatar_paths = avatars()
+    failed = []
+    if not args.check:
+        done = load_cache()
+        todo = []
+        for rel in files:
+            if sha256_file(ROOT / rel) not in done:
+                todo.append(rel)
+        saved = 0
+        if todo:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                futures = {pool.submit(optimize, rel, MAX_WIDTH.get(category(rel, avatar_paths))): rel for rel in todo}
+                for n, future in enumerate(as_completed(futures), 1):
+                    rel = futures[future]
+                    try:
+                        _, before, after = future.result()
+                    except Exception as e:
+                        print(f'Failed {rel}: {e}', file=sys.stderr)
+                        failed.append(rel)
+                        continue
+                    saved += before - after
+                    done.add(sha256_file(ROOT / rel))
+                    if after < before:
+                        print(f'[{n}/{len(todo)}] {rel}: {fmt_size(before)} -> {fmt_size(after)}')
+            save_cache(done)
+        print(f'{len(todo) - len(failed)} processed, {len(files) - len(todo)} cached, {len(failed)} failed, {fmt_size(saved)} saved')
+
+    over = budget_report(files, budgets, avatar_paths)
+    if over:
+        print(f'\n{len(over)} image(s) over budget:', file=sys.stderr)
+        for size, rel, budget in over:
+            print(f'  {fmt_size(size):>10}  {rel}  (budget {fmt_size(budget)}, +{fmt_size(size - budget)})', file=sys.stderr)
+    if over or failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
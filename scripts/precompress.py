@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Write Brotli and gzip siblings of the site's text files and a deploy manifest describing every file.
+Run from project root, last (after scripts/build_css.py).
+Requires: pip install brotli
+
+Every deployed file of a compressible type (COMPRESSIBLE) of at least
+MIN_SIZE bytes gets <name>.br (quality 11, 16 MB window) and <name>.gz
+(level 9, no timestamp, so reruns produce the same bytes) next to it, for
+hosts that serve precompressed variants (nginx gzip_static/brotli_static,
+Caddy precompressed, an object store with Content-Encoding metadata). A
+variant that is not smaller than the file is not written.
+
+build/deploy-manifest.json (outside the deployed tree, so the other tools do
+not take it for a page) lists each deployed file with its content type, size,
+sha256 and the sizes of its .br/.gz variants:
+
+    "pages/publications.html": {"type": "text/html; charset=utf-8", "size": 359424,
+                                "sha256": "...", "br": 31233, "gz": 42087}
+
+A file whose sha256 matches the previous manifest and whose variants are
+still there is not compressed again; hashes are memoised by size and mtime
+in .precompress-cache.json. Work is spread over a process pool (--jobs).
+With --changed, the paths to upload and delete relative to a manifest from
+the last deploy are printed, so a deploy only transfers changed objects.
+
+    python scripts/precompress.py                                # compress, write the manifest
+    python scripts/precompress.py --changed deployed.json        # ...and list what to upload/delete
+    python scripts/precompress.py --check                        # exit 1 if anything is out of date
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from build_cache import BuildCache
+
+try:
+    import brotli
+except ImportError:
+    print("Run: pip install brotli", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST = ROOT / 'build' / 'deploy-manifest.json'
+CACHE_FILE = ROOT / '.precompress-cache.json'
+VERSION = 1
+MIN_SIZE = 1024  # below this the headers cost more than compression saves
+ENCODINGS = ('br', 'gz')
+# Not deployed: tooling, caches (dotfiles) and the build's own bookkeeping.
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'scripts', 'build'}
+SKIP_FILES = {'perf-budget.json', 'perf-baseline.json', 'requests.jsonl'}
+# Extension -> content type; fixed here rather than taken from mimetypes, which depends on the machine.
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.htm': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+    '.json': 'application/json',
+    '.yaml': 'application/yaml; charset=utf-8',
+    '.yml': 'application/yaml; charset=utf-8',
+    '.md': 'text/markdown; charset=utf-8',
+    '.txt': 'text/plain; charset=utf-8',
+    '.xml': 'application/xml',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/vnd.microsoft.icon',
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+    '.eot': 'application/vnd.ms-fontobject',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+    '.pdf': 'application/pdf',
+}
+COMPRESSIBLE = ('.html', '.htm', '.css', '.js', '.json', '.yaml', '.yml', '.md', '.txt', '.xml', '.svg', '.ico', '.ttf', '.otf', '.eot')
+TEXT = ('.html', '.htm', '.css', '.js', '.json', '.yaml', '.yml', '.md', '.txt', '.xml', '.svg')
+
+
+def content_type(rel):
+    return CONTENT_TYPES.get(Path(rel).suffix.lower(), 'application/octet-stream')
+
+
+def compressible(rel, size):
+    return size >= MIN_SIZE and Path(rel).suffix.lower() in COMPRESSIBLE
+
+
+def deployed_files():
+    """Root-relative paths of the files a deploy uploads (not the .br/.gz siblings)."""
+    for dirpath, dirnames, filenames in os.walk(ROOT):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        names = set(filenames)
+        for name in sorted(filenames):
+            rel = (Path(dirpath) / name).relative_to(ROOT).as_posix()
+            if name.startswith('.') or rel in SKIP_FILES:
+                continue
+            stem, ext = os.path.splitext(name)
+            if ext[1:] in ENCODINGS and stem in names:
+                continue
+            yield rel
+
+
+def compress(rel):
+    """Write the variants of one file that are smaller than it. Runs in a worker process."""
+    path = ROOT / rel
+    data = path.read_bytes()
+    mode = brotli.MODE_TEXT if path.suffix.lower() in TEXT else brotli.MODE_GENERIC
+    variants = {
+        'br': brotli.compress(data, mode=mode, quality=11, lgwin=24),
+        'gz': gzip.compress(data, compresslevel=9, mtime=0),
+    }
+    sizes = {}
+    for enc, out in variants.items():
+        sibling = path.with_name(f'{path.name}.{enc}')
+        if len(out) < len(data):
+            tmp = sibling.with_name(sibling.name + '.tmp')
+            tmp.write_bytes(out)
+            tmp.replace(sibling)
+            sizes[enc] = len(out)
+        elif sibling.is_file():
+            sibling.unlink()
+    return sizes
+
+
+def is_current(old, digest, rel):
+    if not old or old.get('sha256') != digest:
+        return False
+    return all(not old.get(enc) or (ROOT / f'{rel}.{enc}').is_file() and (ROOT / f'{rel}.{enc}').stat().st_size == old[enc] for enc in ENCODINGS)
+
+
+def load_manifest(path):
+    if not Path(path).is_file():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('files', {}) if data.get('version') == VERSION else {}
+
+
+def objects(files):
+    """{uploaded object: sha256 of its source} for a manifest's files and their variants."""
+    out = {}
+    for rel, entry in files.items():
+        out[rel] = entry['sha256']
+        for enc in ENCODINGS:
+            if entry.get(enc):
+                out[f'{rel}.{enc}'] = entry['sha256']
+    return out
+
+
+def fmt_size(n):
+    return f'{n / 1024:.1f} KB' if n < 1024 ** 2 else f'{n / 1024 ** 2:.2f} MB'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='recompress every file')
+    parser.add_argument('--check', action='store_true', help='exit 1 if a variant or the manifest is out of date, write nothing')
+    parser.add_argument('--changed', metavar='MANIFEST', help='print the objects to upload and delete relative to this (deployed) manifest')
+    args = parser.parse_args()
+
+    hashes = BuildCache(CACHE_FILE, ROOT)
+    previous = load_manifest(MANIFEST)
+    files, todo, fresh = {}, [], 0
+    for rel in deployed_files():
+        size = (ROOT / rel).stat().st_size
+        files[rel] = {'type': content_type(rel), 'size': size, 'sha256': hashes.hash(rel)}
+        if not compressible(rel, size):
+            continue
+        old = previous.get(rel)
+        if not args.force and is_current(old, files[rel]['sha256'], rel):
+            files[rel].update({enc: old[enc] for enc in ENCODINGS if old.get(enc)})
+            fresh += 1
+        else:
+            todo.append(rel)
+
+    # Variants of files that are gone or no longer compressed.
+    orphans = sorted(f'{rel}.{enc}' for rel, old in previous.items() for enc in ENCODINGS
+                     if old.get(enc) and (rel not in files or not compressible(rel, files[rel]['size']))
+                     and (ROOT / f'{rel}.{enc}').is_file())
+    if args.check:
+        for path in todo + orphans:
+            print(f'Out of date: {path}')
+        if files != previous and not todo:
+            print(f'Out of date: {MANIFEST.name}')
+        if todo or orphans or files != previous:
+            sys.exit(1)
+        print(f'Up to date: {len(files)} file(s)')
+        return
+
+    failed = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(compress, rel): rel for rel in todo}
+            for n, future in enumerate(as_completed(futures), 1):
+                rel = futures[future]
+                try:
+                    sizes = future.result()
+                except Exception as e:
+                    print(f'Failed {rel}: {e}', file=sys.stderr)
+                    failed.append(rel)
+                    continue
+                files[rel].update(sizes)
+                saved = ', '.join(f'{enc} {fmt_size(sizes[enc])}' for enc in ENCODINGS if enc in sizes) or 'not smaller, skipped'
+                print(f'[{n}/{len(todo)}] {rel}: {fmt_size(files[rel]["size"])} -> {saved}')
+    for path in orphans:
+        (ROOT / path).unlink()
+        print(f'Removed {path}')
+
+    hashes.save()
+    MANIFEST.parent.mkdir(exist_ok=True)
+    with open(MANIFEST, 'w', encoding='utf-8', newline='') as f:
+        json.dump({'version': VERSION, 'files': dict(sorted(files.items()))}, f, indent=1, sort_keys=True)
+        f.write('\n')
+    compressed = [e for e in files.values() if e.get('br')]
+    print(f'{len(todo) - len(failed)} compressed, {fresh} up to date, {len(failed)} failed; '
+          f'{fmt_size(sum(e["size"] for e in compressed))} -> {fmt_size(sum(e["br"] for e in compressed))} br, '
+          f'{fmt_size(sum(e.get("gz", e["size"]) for e in compressed))} gz')
+
+    if args.changed:
+        deployed, current = objects(load_manifest(args.changed)), objects(files)
+        for path in sorted(current):
+            if deployed.get(path) != current[path]:
+                print(f'upload {path}')
+        for path in sorted(set(deployed) - set(current)):
+            print(f'delete {path}')
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
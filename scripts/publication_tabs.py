@@ -0,0 +1,17 @@
+"""
+The year and category tabs of pages/publications.html, shared by
+build_site.py (which renders and shards them), validate_configs.py (which
+checks publications.yaml against them) and build_search_index.py (which
+indexes the category labels). Kept free of build_site's
+dependencies so the config linter runs without markdown installed.
+"""
+
+YEAR_ORDER = ['2026', '2025', '2024', '2023', '2022', '2021', '2020', 'before2020']
+PUB_CATEGORIES = [
+    ('stm', 'Spatio-Temporal Data Mining'),
+    ('time-series', 'Time Series Analysis'),
+    ('multimodal', 'Multimodal Learning'),
+    ('graph', 'Graph Mining'),
+    ('survey', 'Survey Paper'),
+    ('others', 'Others'),
+]
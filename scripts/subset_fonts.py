@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Subset the icon fonts (Font Awesome, slick) to the glyphs the pages use and serve them as WOFF2.
+Run from project root, before scripts/fingerprint_assets.py and scripts/build_css.py.
+Requires: pip install fonttools brotli lxml
+
+The glyphs come from the content: values of the rules that can apply to a
+page, found the same way scripts/build_css.py prunes rules (so an fa-* class
+in a page or toggled by one of its scripts brings in its :before rule).
+Every @font-face in a stylesheet the pages load whose family and weight are
+listed in FONTS is then pointed at a subset of the local font, containing
+only the used codepoints that font has, written next to it as
+<name>.subset.woff2. The @font-face's other src formats (eot, woff, ttf,
+svg) are dropped. The stylesheet is rewritten in place; when a page loads a
+fingerprinted copy, its source is rewritten and fingerprint_assets.py makes
+the new copy.
+
+The theme's Font Awesome 5 (all.min.css) loaded its fonts from
+pro.fontawesome.com; its families are served from the Font Awesome 6 fonts
+Essential Blocks ships, which keep the free icons' codepoints. Subsets are
+built with a fixed timestamp so reruns produce the same bytes.
+
+    python scripts/subset_fonts.py           # write subsets, rewrite stylesheets
+    python scripts/subset_fonts.py --check   # exit 1 if anything would change
+"""
+import argparse
+import io
+import os
+import re
+import sys
+from pathlib import PurePosixPath
+
+from build_css import (
+    STYLESHEET, Elements, bundled_stylesheets, page_elements, prune, read_stylesheet, script_tokens, split_top, walk,
+)
+from build_site import PAGES, ROOT, read_text
+from fingerprint_assets import FONT_FACE, TAG_ATTR, Fingerprinter, load_manifest, resolve
+
+try:
+    from fontTools import subset
+except ImportError:
+    print("Run: pip install fonttools brotli", file=sys.stderr)
+    sys.exit(1)
+
+FA_FONTS = 'wp-content/plugins/essential-blocks/assets/fontawesome/webfonts'
+# (font-family, font-weight) of an @font-face -> the full font its subset is cut from
+FONTS = {
+    ('font awesome 5 free', '900'): f'{FA_FONTS}/fa-solid-900.ttf',
+    ('font awesome 5 free', '400'): f'{FA_FONTS}/fa-regular-400.ttf',
+    ('font awesome 5 brands', '400'): f'{FA_FONTS}/fa-brands-400.ttf',
+    ('slick', '400'): 'wp-content/plugins/essential-blocks/assets/fonts/slick.ttf',
+}
+WEIGHTS = {'normal': '400', 'bold': '700'}
+
+CONTENT = re.compile(r'(?<![\w-])content\s*:\s*([^;}]+)', re.I)
+CSS_STRING = re.compile(r'"((?:\\.|[^"\\])*)"|\'((?:\\.|[^\'\\])*)\'', re.S)
+CSS_ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6})\s?|\\(.)', re.S)
+
+
+def content_codepoints(body):
+    """Codepoints of the strings in a rule's content: declarations."""
+    out = set()
+    for m in CONTENT.finditer(body):
+        for s in CSS_STRING.finditer(m.group(1)):
+            text = CSS_ESCAPE.sub(lambda e: chr(int(e.group(1), 16)) if e.group(1) else e.group(2), s.group(1) or s.group(2) or '')
+            out |= {ord(ch) for ch in text}
+    return out
+
+
+def page_stylesheets(rel, page):
+    """Root-relative paths of the local stylesheets a page loads: the shared ones plus its own links."""
+    paths = [path for _, path in bundled_stylesheets()]
+    own = re.sub(r'<!-- build:layout-head -->\n.*?<!-- /build:layout-head -->', '', page, flags=re.S)
+    for tag in STYLESHEET.findall(own):
+        path = resolve(rel, dict(TAG_ATTR.findall(tag)).get('href', ''))
+        if path and path.endswith('.css') and (ROOT / path).is_file() and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def used_codepoints():
+    """({codepoints used by some page}, {stylesheet any page loads})."""
+    codepoints, stylesheets, parsed = set(), set(), {}
+    for rel in PAGES:
+        page = read_text(rel)
+        elements, _ = page_elements(page)
+        used = Elements(elements, script_tokens(rel, page))
+        for path in page_stylesheets(rel, page):
+            stylesheets.add(path)
+            if path not in parsed:
+                parsed[path] = read_stylesheet(path)[1]
+            for kind, _, body in walk(prune(parsed[path], used)):
+                if kind == 'rule':
+                    codepoints |= content_codepoints(body)
+    return codepoints, stylesheets
+
+
+def face_key(block):
+    """(family, weight) of an @font-face block, lowercased and normalised."""
+    family = re.search(r'font-family\s*:\s*([^;}]+)', block, re.I)
+    weight = re.search(r'font-weight\s*:\s*([^;}]+)', block, re.I)
+    family = family.group(1).strip().strip('\'"').lower() if family else ''
+    weight = weight.group(1).strip().lower() if weight else 'normal'
+    return family, WEIGHTS.get(weight, weight)
+
+
+def subset_path(font):
+    p = PurePosixPath(font)
+    return str(p.with_name(f'{p.stem}.subset.woff2'))
+
+
+def make_subset(font, codepoints):
+    """WOFF2 bytes of font cut down to the codepoints it has, and how many it kept."""
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.recalc_timestamp = False
+    ttf = subset.load_font(str(ROOT / font), options)
+    keep = sorted(set(codepoints) & set(ttf.getBestCmap()))
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=keep)
+    subsetter.subset(ttf)
+    out = io.BytesIO()
+    subset.save_font(ttf, out, options)
+    return out.getvalue(), len(keep)
+
+
+def rewrite_faces(source, css, fonts):
+    """css with the src of each @font-face listed in FONTS pointing at its subset only."""
+    def face(m):
+        font = FONTS.get(face_key(m.group(0)))
+        if font is None:
+            return m.group(0)
+        fonts.add(font)
+        url = os.path.relpath(ROOT / subset_path(font), (ROOT / source).parent).replace(os.sep, '/')
+        body = m.group(0)[m.group(0).index('{') + 1:-1]
+        decls = [d.strip() for d in split_top(body, ';') if d.strip() and not re.match(r'src\s*:', d.strip(), re.I)]
+        return '@font-face{' + ';'.join(decls + [f'src:url({url}) format("woff2")']) + '}'
+
+    return FONT_FACE.sub(face, css)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='exit 1 if a subset or stylesheet is out of date, write nothing')
+    args = parser.parse_args()
+
+    codepoints, stylesheets = used_codepoints()
+    fp = Fingerprinter(load_manifest())
+    rewritten, fonts = {}, set()
+    for path in sorted(stylesheets):
+        source = fp.source_of(path)
+        css = read_text(source)
+        new = rewrite_faces(source, css, fonts)
+        if new != css:
+            rewritten[source] = new
+    for font in sorted(set(FONTS.values()) - fonts):
+        print(f'{font}: no page loads an @font-face for it, skipped')
+
+    subsets = {}
+    for font in sorted(fonts):
+        data, kept = make_subset(font, codepoints)
+        subsets[subset_path(font)] = data
+        full = (ROOT / font).with_suffix('.woff2')
+        full = full if full.is_file() else ROOT / font
+        print(f'{font}: {kept} glyph(s), {full.stat().st_size / 1024:.1f} KB ({full.suffix[1:]}) -> {len(data) / 1024:.1f} KB woff2')
+
+    written = [path for path, data in subsets.items() if not (ROOT / path).is_file() or (ROOT / path).read_bytes() != data]
+    if args.check:
+        for path in written + sorted(rewritten):
+            print(f'Out of date: {path}')
+        if written or rewritten:
+            sys.exit(1)
+        print(f'Up to date: {len(subsets)} subset font(s)')
+        return
+    for path in written:
+        (ROOT / path).write_bytes(subsets[path])
+        print(f'Wrote {path}')
+    for source, css in sorted(rewritten.items()):
+        with open(ROOT / source, 'w', encoding='utf-8', newline='') as f:
+            f.write(css)
+        print(f'Rewrote {source}')
+
+
+if __name__ == '__main__':
+    main()
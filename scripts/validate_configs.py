@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Validate configs/*.yaml against the schemas the page renderers expect.
+Run from project root.
+Requires: pip install pyyaml
+
+Each config has a declared schema (SCHEMAS below): required fields and their
+types, allowed values (publication years and category slugs come from
+publication_tabs.py), date formats, unique titles/ids, and image paths that must
+exist on disk (resolved the way the page that renders them would). On top
+of the schemas:
+
+  - duplicate keys in a mapping (YAML silently keeps the last one)
+  - news.yaml entries must be double-quoted and newest-first; the fallback
+    parser in index.html drops anything else without a word
+  - datasets.yaml ids must have a page in dataset-pages.yaml
+  - imgs/ paths mentioned anywhere else (Markdown, HTML) must exist
+
+Unknown keys (usually a typo) and empty recommended fields (e.g. a
+publication's authors) are warnings; everything else is an error.
+
+    python scripts/validate_configs.py                      # all configs
+    python scripts/validate_configs.py configs/people.yaml  # only these
+    python scripts/validate_configs.py --cached             # skip unchanged files (pre-commit)
+
+--cached keeps each file's result in .config-lint-cache.json and only
+revalidates a config when it, a config it depends on, or this validator
+changed, or when an image it references disappeared.
+"""
+import argparse
+import datetime
+import json
+import re
+import sys
+from pathlib import Path
+
+from asset_index import REF, strip_unbalanced
+from build_cache import sha256_file
+from publication_tabs import PUB_CATEGORIES, YEAR_ORDER
+
+try:
+    import yaml
+except ImportError:
+    print("Run: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIGS = ROOT / 'configs'
+CACHE_FILE = ROOT / '.config-lint-cache.json'
+VERSION = 1
+# This script and the scripts/ modules it imports; a change to any of them invalidates --cached results.
+VALIDATOR_FILES = ('validate_configs.py', 'publication_tabs.py', 'asset_index.py', 'build_cache.py')
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+SLUG = r'[a-z0-9]+(?:-[a-z0-9]+)*'
+PUB_CATEGORY_SLUGS = [slug for slug, _ in PUB_CATEGORIES]
+
+# Field specs: {'type': ..., 'required': bool, ...}; see check_value() for the rules.
+TEXT = {'type': 'str'}
+REQUIRED_TEXT = {'type': 'str', 'required': True}
+# Renders without it, but looks broken: missing or empty is a warning.
+RECOMMENDED_TEXT = {'type': 'str', 'recommended': True}
+URL = {'type': 'url'}
+IMAGE = {'type': 'image'}
+REQUIRED_IMAGE = {'type': 'image', 'required': True}
+LINK = {'type': 'map', 'fields': {'text': REQUIRED_TEXT, 'href': {'type': 'url', 'required': True}}}
+
+
+def listing(item, **rules):
+    return dict({'type': 'list', 'items': item}, **rules)
+
+
+def record(fields, **rules):
+    return dict({'type': 'map', 'fields': fields}, **rules)
+
+
+PUBLICATION = record({
+    'title': REQUIRED_TEXT,
+    'authors': RECOMMENDED_TEXT,
+    'venue': RECOMMENDED_TEXT,
+    'year': {'type': 'choice', 'choices': YEAR_ORDER, 'required': True},
+    'is_journal': {'type': 'bool', 'required': True},
+    'categories': listing({'type': 'choice', 'choices': PUB_CATEGORY_SLUGS}, required=True, min=1, unique=True),
+    'image': REQUIRED_IMAGE,
+    'link': URL,
+    'pdf_link': URL,
+})
+
+PERSON = record({
+    'name': REQUIRED_TEXT, 'image': REQUIRED_IMAGE, 'link': URL,
+    'degree_from': TEXT, 'period': TEXT, 'research': TEXT,
+})
+ALUMNUS = record({
+    'name': REQUIRED_TEXT, 'link': URL, 'period': TEXT,
+    'degree_from': TEXT, 'affiliation': TEXT, 'note': TEXT,
+})
+COLLABORATOR = record({
+    'name': REQUIRED_TEXT, 'link': URL, 'affiliation': TEXT,
+    'co_supervisor': TEXT, 'co_supervisor_link': URL, 'period': TEXT,
+})
+PEOPLE = record({
+    'hero_title': TEXT,
+    'lab_director': record({
+        'name': REQUIRED_TEXT, 'image': REQUIRED_IMAGE, 'title': TEXT, 'description': TEXT,
+        'socials': listing(record({'label': REQUIRED_TEXT, 'url': {'type': 'url', 'required': True}})),
+    }),
+    'postdoc': listing(PERSON, unique_by=['name']),
+    'phd_students': listing(PERSON, unique_by=['name']),
+    'mphil_students': listing(PERSON, unique_by=['name']),
+    'research_assistant': listing(PERSON, unique_by=['name']),
+    'research_interns': listing(PERSON, unique_by=['name']),
+    'alumni': record({
+        'mphil_student': listing(ALUMNUS, unique_by=['name']),
+        'research_intern': listing(ALUMNUS, unique_by=['name']),
+        'research_assistant': listing(ALUMNUS, unique_by=['name']),
+    }),
+    'outside_collaborators': record({'intro': TEXT, 'list': listing(COLLABORATOR, unique_by=['name'])}),
+    'collaborators': record({'intro': TEXT, 'logo': IMAGE}),
+})
+
+PHOTOS = record({
+    'hero_title': TEXT,
+    'albums': listing(record({
+        'title': REQUIRED_TEXT,
+        'location': TEXT,
+        'images': listing(record({
+            'src': REQUIRED_IMAGE,
+            'width': {'type': 'int', 'min': 1},
+            'height': {'type': 'int', 'min': 1},
+            'thumb': IMAGE,
+            'lqip': {'type': 'str', 'pattern': r'data:image/(?:webp|jpeg|png);base64,[A-Za-z0-9+/]+=*'},
+        }), required=True, min=1, unique_by=['src']),
+    }), required=True, unique_by=['title']),
+})
+
+NEWS = listing(record({
+    'date': {'type': 'date', 'format': '%Y/%m/%d', 'required': True, 'quoted': True},
+    'content': {'type': 'str', 'required': True, 'quoted': True},
+}), order_by=('date', '%Y/%m/%d'))
+
+DATASETS = listing(record({
+    'id': {'type': 'str', 'pattern': SLUG, 'required': True},
+    'title': REQUIRED_TEXT,
+    'link': URL,
+    'image': REQUIRED_IMAGE,
+    'summary': TEXT,
+}), unique_by=['id', 'title'])
+
+DATASET_PAGES = listing(record({
+    'id': {'type': 'str', 'pattern': SLUG, 'required': True},
+    'title': REQUIRED_TEXT,
+    'date': {'type': 'date', 'format': '%Y-%m-%d'},
+    'lastUpdated': {'type': 'date', 'format': '%Y-%m-%d'},
+    'image': IMAGE,
+    'summary': TEXT,
+    'content': REQUIRED_TEXT,
+}), unique_by=['id', 'title'])
+
+OPENINGS = record({
+    'hero_title': TEXT,
+    'hero_background_image': IMAGE,
+    'intro': TEXT,
+    'video': record({'poster': IMAGE, 'src': {'type': 'url', 'required': True}}),
+    'scholarships': TEXT,
+    'scholarships_link': LINK,
+    'contact_heading': TEXT,
+    'contact_email': {'type': 'str', 'pattern': r'[^@\s]+@[^@\s]+\.[^@\s]+'},
+    'contact_apply': TEXT,
+    'contact_note': TEXT,
+    'phd_heading': TEXT,
+    'phd_heading_id': {'type': 'str', 'pattern': r'[A-Za-z][\w-]*'},
+    'mphil_link': LINK,
+    'phd_intro': TEXT,
+    'requirements_general': listing(REQUIRED_TEXT),
+    'requirements_priority_intro': TEXT,
+    'requirements_priority': listing(REQUIRED_TEXT),
+})
+
+
+def check_datasets(data, load):
+    """Every dataset card links to a page that exists."""
+    pages = load('dataset-pages.yaml')
+    ids = {p.get('id') for p in pages if isinstance(p, dict)} if isinstance(pages, list) else set()
+    for i, d in enumerate(data if isinstance(data, list) else []):
+        if isinstance(d, dict) and d.get('id') and d['id'] not in ids:
+            yield (i, 'id'), f'no dataset-pages.yaml entry with id "{d["id"]}"'
+
+
+# config -> schema, directory its relative paths resolve against (the page
+# that renders it), configs it is checked against, extra checks
+SCHEMAS = {
+    'publications.yaml': {'schema': listing(PUBLICATION, unique_by=['title']), 'base': 'pages'},
+    'people.yaml': {'schema': PEOPLE, 'base': 'pages'},
+    'photos.yaml': {'schema': PHOTOS, 'base': 'pages'},
+    'news.yaml': {'schema': NEWS, 'base': ''},
+    'datasets.yaml': {'schema': DATASETS, 'base': 'pages', 'depends': ['dataset-pages.yaml'], 'checks': [check_datasets]},
+    'dataset-pages.yaml': {'schema': DATASET_PAGES, 'base': 'pages'},
+    'openings.yaml': {'schema': OPENINGS, 'base': 'pages'},
+}
+
+
+def fmt_path(path):
+    out = ''
+    for part in path:
+        out += f'[{part}]' if isinstance(part, int) else (f'.{part}' if out else str(part))
+    return out or '(document)'
+
+
+class Validator:
+    """Collects (path, line, severity, message) issues for one config."""
+
+    def __init__(self, name):
+        self.name = name
+        self.base = ROOT / SCHEMAS[name]['base']
+        self.issues = []
+        self.images = set()  # local files the config references
+        self.lines = {}      # path -> line
+
+    def report(self, path, message, severity='error'):
+        self.issues.append((fmt_path(path), self.lines.get(tuple(path), 0), severity, message))
+
+    def local_file(self, path, value):
+        """Check that a local path exists (resolved against the rendering page) and remember it."""
+        url = value.split('?')[0].split('#')[0]
+        target = (ROOT / url.lstrip('/')) if url.startswith('/') else (self.base / url)
+        rel = target.resolve()
+        if ROOT in rel.parents:
+            rel = rel.relative_to(ROOT).as_posix()
+            self.images.add(rel)
+            if not (ROOT / rel).is_file():
+                self.report(path, f'file not found: {value} ({rel})')
+        else:
+            self.report(path, f'path outside the site: {value}')
+
+    def check_value(self, value, spec, path, node):
+        kind = spec['type']
+        if kind == 'map':
+            if not isinstance(value, dict):
+                return self.report(path, f'expected a mapping, got {type(value).__name__}')
+            fields = spec['fields']
+            for key in value:
+                if key not in fields:
+                    self.report(path + (key,), f'unknown key "{key}"', 'warning')
+            children = self.children(node)
+            for key, field in fields.items():
+                if value.get(key) is None:
+                    if field.get('required') or field.get('recommended'):
+                        self.report(path + (key,) if key in value else path, f'missing {"required" if field.get("required") else "recommended"} "{key}"',
+                                    'error' if field.get('required') else 'warning')
+                    continue
+                self.check_value(value[key], field, path + (key,), children.get(key))
+        elif kind == 'list':
+            if not isinstance(value, list):
+                return self.report(path, f'expected a list, got {type(value).__name__}')
+            if len(value) < spec.get('min', 0):
+                self.report(path, f'needs at least {spec["min"]} item(s)')
+            children = self.children(node)
+            for i, item in enumerate(value):
+                if item is None:
+                    self.report(path + (i,), 'empty item')
+                    continue
+                self.check_value(item, spec['items'], path + (i,), children.get(i))
+            if spec.get('unique'):
+                self.check_unique(path, [(i, v) for i, v in enumerate(value)], 'value')
+            for key in spec.get('unique_by', []):
+                self.check_unique(path, [((i, key), v.get(key)) for i, v in enumerate(value) if isinstance(v, dict)], key)
+            if spec.get('order_by'):
+                self.check_order(path, value, *spec['order_by'])
+        else:
+            self.check_scalar(value, spec, path, node)
+
+    def check_scalar(self, value, spec, path, node):
+        kind = spec['type']
+        if spec.get('quoted') and node is not None and getattr(node, 'style', None) != '"':
+            self.report(path, 'must be a double-quoted string (index.html\'s fallback parser skips the entry otherwise)')
+        if kind == 'bool':
+            if not isinstance(value, bool):
+                self.report(path, f'expected true or false, got {value!r}')
+            return
+        if kind == 'int':
+            if isinstance(value, bool) or not isinstance(value, int):
+                self.report(path, f'expected an integer, got {value!r}')
+            elif value < spec.get('min', value):
+                self.report(path, f'must be at least {spec["min"]}')
+            return
+        if kind == 'choice':
+            if str(value) not in spec['choices'] or isinstance(value, (bool, float)):
+                self.report(path, f'{value!r} is not one of: {", ".join(spec["choices"])}')
+            return
+        if isinstance(value, (dict, list)) or (not isinstance(value, str) and kind in ('url', 'image', 'date')):
+            return self.report(path, f'expected a string, got {type(value).__name__}')
+        text = str(value)
+        if kind == 'str':
+            if (spec.get('required') or spec.get('recommended')) and not text.strip():
+                self.report(path, 'must not be empty' if spec.get('required') else 'should not be empty', 'error' if spec.get('required') else 'warning')
+            if spec.get('pattern') and not re.fullmatch(spec['pattern'], text):
+                self.report(path, f'{text!r} does not match {spec["pattern"]}')
+            self.check_refs(path, text)
+        elif kind == 'date':
+            try:
+                datetime.datetime.strptime(text.strip(), spec['format'])
+            except ValueError:
+                self.report(path, f'{text!r} is not a {spec["format"].replace("%Y", "YYYY").replace("%m", "MM").replace("%d", "DD")} date')
+        elif kind in ('url', 'image'):
+            if not text.strip():
+                if kind == 'image' or spec.get('required'):
+                    self.report(path, 'must not be empty')
+            elif re.match(r'[a-z][a-z0-9+.-]*:|//', text):
+                if not re.match(r'(https?:|mailto:|//)', text):
+                    self.report(path, f'unsupported URL scheme: {text}')
+            elif kind == 'image' or text.startswith(('/imgs/', '../imgs/', 'imgs/')):
+                self.local_file(path, text)
+
+    def check_refs(self, path, text):
+        """imgs/ paths mentioned in free text (Markdown images, inline HTML) must exist."""
+        if 'imgs/' not in text:
+            return
+        for m in REF.finditer(text):
+            name = strip_unbalanced(m.group(1)).rstrip('.;:')
+            self.images.add(f'imgs/{name}')
+            if not (ROOT / 'imgs' / name).is_file():
+                self.report(path, f'file not found: imgs/{name}')
+
+    def check_unique(self, path, items, what):
+        seen = {}
+        for sub, v in items:
+            if v is None or isinstance(v, (dict, list)):
+                continue
+            key = ' '.join(str(v).split()).casefold()
+            sub = sub if isinstance(sub, tuple) else (sub,)
+            if key in seen:
+                self.report(path + sub, f'duplicate {what} {v!r} (first at {fmt_path(path + seen[key])})')
+            else:
+                seen[key] = sub
+
+    def check_order(self, path, items, key, fmt):
+        prev = None
+        for i, item in enumerate(items):
+            try:
+                d = datetime.datetime.strptime(str(item.get(key)).strip(), fmt)
+            except (AttributeError, ValueError):
+                continue
+            if prev is not None and d > prev:
+                self.report(path + (i, key), f'out of order: newer than the entry before it (list is newest first)')
+            prev = d
+
+    def children(self, node):
+        if isinstance(node, yaml.MappingNode):
+            return {k.value: v for k, v in node.value}
+        if isinstance(node, yaml.SequenceNode):
+            return dict(enumerate(node.value))
+        return {}
+
+    def index_lines(self, node, path=()):
+        """Record the line of every node and report duplicate mapping keys."""
+        self.lines[path] = node.start_mark.line + 1
+        if isinstance(node, yaml.MappingNode):
+            seen = set()
+            for k, v in node.value:
+                if k.value in seen:
+                    self.lines[path + (k.value,)] = k.start_mark.line + 1
+                    self.report(path + (k.value,), f'duplicate key "{k.value}" (only the last one is used)')
+                seen.add(k.value)
+                self.index_lines(v, path + (k.value,))
+        elif isinstance(node, yaml.SequenceNode):
+            for i, v in enumerate(node.value):
+                self.index_lines(v, path + (i,))
+
+
+def load_config(name):
+    with open(CONFIGS / name, 'r', encoding='utf-8') as f:
+        loader = Loader(f.read())
+    try:
+        node = loader.get_single_node()
+        return node, (loader.construct_document(node) if node is not None else None)
+    finally:
+        loader.dispose()
+
+
+def validate(name):
+    """Return (issues, referenced local files) for one config."""
+    v = Validator(name)
+    try:
+        node, data = load_config(name)
+    except yaml.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        return [('(document)', mark.line + 1 if mark else 0, 'error', f'invalid YAML: {getattr(e, "problem", None) or e}')], []
+    if node is None:
+        return [('(document)', 0, 'error', 'file is empty')], []
+    v.index_lines(node)
+    entry = SCHEMAS[name]
+    v.check_value(data, entry['schema'], (), node)
+    for check in entry.get('checks', []):
+        for path, message in check(data, lambda other: load_config(other)[1]):
+            v.report(path, message)
+    return sorted(v.issues, key=lambda issue: issue[1]), sorted(v.images)
+
+
+class LintCache:
+    """Per-config results, reused while the config, its dependencies and the validator are unchanged."""
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.validator = ':'.join(sha256_file(Path(__file__).with_name(name)) for name in VALIDATOR_FILES)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == VERSION and data.get('validator') == self.validator:
+            self.files = data.get('files', {})
+        self.stats = {}
+
+    def stat(self, name):
+        """[size, mtime_ns] of configs/name."""
+        if name not in self.stats:
+            st = (CONFIGS / name).stat()
+            self.stats[name] = [st.st_size, st.st_mtime_ns]
+        return self.stats[name]
+
+    def get(self, name):
+        entry = self.files.get(name)
+        if not entry:
+            return None
+        for dep in [name] + SCHEMAS[name].get('depends', []):
+            if entry['inputs'].get(dep) != self.stat(dep):
+                return None
+        if any(not (ROOT / rel).is_file() for rel in entry['images']):
+            return None
+        return entry['issues']
+
+    def put(self, name, issues, images):
+        self.files[name] = {
+            'inputs': {dep: self.stat(dep) for dep in [name] + SCHEMAS[name].get('depends', [])},
+            'images': images,
+            'issues': issues,
+        }
+
+    def save(self):
+        data = {'version': VERSION, 'validator': self.validator, 'files': dict(sorted(self.files.items()))}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        tmp.replace(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('configs', nargs='*', help='configs to check, e.g. configs/news.yaml (default: all)')
+    parser.add_argument('--cached', action='store_true', help=f'reuse results for unchanged files ({CACHE_FILE.name})')
+    parser.add_argument('--strict', action='store_true', help='treat warnings as errors')
+    args = parser.parse_args()
+
+    names = [Path(c).name for c in args.configs] or list(SCHEMAS)
+    unknown = [n for n in names if n not in SCHEMAS]
+    if unknown:
+        print(f'No schema for: {", ".join(unknown)}', file=sys.stderr)
+        sys.exit(2)
+
+    cache = LintCache(CACHE_FILE) if args.cached else None
+    errors = warnings = checked = 0
+    for name in names:
+        issues = cache.get(name) if cache else None
+        if issues is None:
+            issues, images = validate(name)
+            checked += 1
+            if cache:
+                cache.put(name, issues, images)
+        for path, line, severity, message in issues:
+            print(f'configs/{name}:{line}: {severity}: {path}: {message}')
+            if severity == 'error':
+                errors += 1
+            else:
+                warnings += 1
+    if cache:
+        cache.save()
+    skipped = f' ({len(names) - checked} unchanged)' if cache else ''
+    print(f'{len(names)} config(s){skipped}: {errors} error(s), {warnings} warning(s)')
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+(()=>{window.addEventListener("DOMContentLoaded",function(n){var o=".eb___animated";e(o).then(function(e){window.IntersectionObserver?t(o):c(o)})});var e=function(e){return new Promise(function(t){setTimeout(function(){var n=u();if(null!=n&&n.querySelector(e))return t(n.querySelector(e));var o=new MutationObserver(function(){n&&n.querySelector(e)&&(t(n.querySelector(e)),o.disconnect())});o.observe(document.body,{childList:!0,attributes:!0,subtree:!0})},500)})},t=function(e){var t=new IntersectionObserver(function(e){e.forEach(function(e){e.isIntersecting&&(n(e.target),t.unobserve(e.target))})},{threshold:.1,rootMargin:"0px 0px -50px 0px",root:r()});u().querySelectorAll(e).forEach(function(e){t.observe(e)}),o(t,e)},n=function(e){var t,n,o=[],r=[];e.classList.forEach(function(e){e.includes("eb___")&&(o.push(e),r.push(e.replace("eb___","eb__")))}),(t=e.classList).add.apply(t,r),(n=e.classList).remove.apply(n,o)},o=function(e,t){new MutationObserver(function(n){n.forEach(function(n){n.addedNodes.forEach(function(n){if(n.nodeType===Node.ELEMENT_NODE){n.matches&&n.matches(t)&&e.observe(n);var o=n.querySelectorAll&&n.querySelectorAll(t);o&&o.forEach(function(t){e.observe(t)})}})})}).observe(u(),{childList:!0,subtree:!0})},r=function(){var e;if(null===(e=eb_conditional_localize)||void 0===e||!e.editor_type)return null;var t=document.querySelector('[name="editor-canvas"]');return t?t.contentDocument?t.contentDocument.querySelector(".editor-styles-wrapper"):t.contentWindow.document.querySelector(".editor-styles-wrapper"):document.querySelector(".editor-styles-wrapper")},c=function(e){var t=u().querySelectorAll(e);i(t);var n=!1;window.addEventListener("scroll",function(){n||(requestAnimationFrame(function(){i(t),n=!1}),n=!0)},!0)},i=function(e){e.forEach(function(e){(function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.1,n=e.getBoundingClientRect(),o=window.innerHeight||document.documentElement.clientHeight,r=window.innerWidth||document.documentElement.clientWidth,c=n.bottom-n.top,i=n.right-n.left,u=Math.min(n.bottom,o)-Math.max(n.top,0),a=Math.min(n.right,r)-Math.max(n.left,0);return u=Math.max(0,u),a=Math.max(0,a),(c>0?u/c:0)>=t&&(i>0?a/i:0)>=t})(e)&&n(e)})},u=function(){var e;if(null===(e=eb_conditional_localize)||void 0===e||!e.editor_type)return document;var t=document.querySelector('[name="editor-canvas"]');return t?t.contentDocument?t.contentDocument.querySelector(".editor-styles-wrapper"):t.contentWindow.document.querySelector(".editor-styles-wrapper"):document.querySelector(".editor-styles-wrapper")}})();
\ No newline at end of file
@@ -0,0 +1 @@
+!function(){"use strict";const t={none:void 0,"o-typing-slower":.4,"o-typing-slow":.25,"o-typing-fast":.05,"o-typing-faster":.01};var e;e=()=>{const e={root:null,rootMargin:"0px",threshold:[.6]};let n="\n\t\t.o-anim-typing-caret::after {\n\t\t\tfont-weight: 100;\n\t\t\tcontent: '|';\n\t\t\tanimation: 1s blink step-end infinite;\n\t\t}\n\n\t\t@keyframes blink {\n\t\t\tfrom, to {\n\t\t\t  color: transparent;\n\t\t   }\n\t\t\t50% {\n\t\t\t  color: inherit;\n\t\t   }\n\t\t}\n\t";n=n.replace(/(\r\n|\n|\r|\t)/gm,"");let r=!1;setTimeout((()=>{document.querySelectorAll("o-anim-typing").forEach((i=>{if(!r){const t=document.createElement("style");t.innerText=n,document.head.appendChild(t),r=!0}const s=(e=>{const n=e?.innerHTML||"",r=(e=>{const n=e.parentElement;for(let e=0;e<3;++e)if(Array.from(n.classList).some((t=>t.includes("o-typing-")))){const e=Array.from(n.classList),r=e.filter((t=>t.includes("o-typing-delay-"))).pop(),i=parseInt(r?.split("-")?.[3]||"0"),s=r?.includes("ms"),o=Object.keys(t),a=e?.filter((t=>o.includes(t)))?.pop()||"fast";return{speed:t[a],delay:i*(s?0:1e3)}}})(e);n?.length||returnl;const i=n.length,s=(r?.speed||.1)*i,{start:o,steps:a,stop:c}=((t,e)=>{let n,r=0;const i=Math.ceil(t/e)+1||1,s=t=>{clearInterval(n),t?.()};return{steps:i,start:(t,o)=>{n=setInterval((()=>{r<i?(t?.(r),r+=1):s(o)}),1e3*e)},stop:s}})(s,r?.speed||.1),l=document.createElement("span");l.classList.add("o-anim-typing-caret"),l.style.whiteSpace="pre-wrap";const p=document.createElement("span");p.style.whiteSpace="pre-wrap",p.style.visibility="hidden";const d=e.innerHTML;return e.innerHTML="",e.appendChild(l),e.appendChild(p),l.innerHTML=n.slice(0,0),p.innerHTML=n.slice(0),()=>{setTimeout((()=>{o((t=>{l.innerHTML=n.slice(0,t),t<i&&(p.innerHTML=n.slice(t)),i>=a&&c()}),(()=>{e.innerHTML=d}))}),r?.delay||0)}})(i),o=new IntersectionObserver((t=>{t.forEach((t=>{t.isIntersecting&&0<t.intersectionRect.height&&(o.unobserve(i),s())}))}),e);o.observe(i)}))}),100)},"undefined"!=typeof document&&("complete"!==document.readyState&&"interactive"!==document.readyState?document.addEventListener("DOMContentLoaded",e):e())}();
\ No newline at end of file
@@ -0,0 +1 @@
+Element.prototype.matches||(Element.prototype.matches=Element.prototype.msMatchesSelector||Element.prototype.webkitMatchesSelector),Element.prototype.closest||(Element.prototype.closest=function(e){var t=this;do{if(t.matches(e))return t;t=t.parentElement||t.parentNode}while(null!==t&&1===t.nodeType);return null}),window.NodeList&&!NodeList.prototype.forEach&&(NodeList.prototype.forEach=Array.prototype.forEach),function(){var e=function(e){return e.replace(/^\s+|\s+$/g,"")},t=function(e){return new RegExp("(^|\\s+)"+e+"(\\s+|$)")},o=function(e,t,o){for(var n=0;n<e.length;n++)t.call(o,e[n])};function n(e){this.element=e}n.prototype={add:function(){o(arguments,(function(t){this.contains(t)||(this.element.className=e(this.element.className+" "+t))}),this)},remove:function(){o(arguments,(function(o){this.element.className=e(this.element.className.replace(t(o)," "))}),this)},toggle:function(e){return this.contains(e)?(this.remove(e),!1):(this.add(e),!0)},contains:function(e){return t(e).test(this.element.className)},item:function(e){return this.element.className.split(/\s+/)[e]||null},replace:function(e,t){this.remove(e),this.add(t)}},"classList"in Element.prototype||Object.defineProperty(Element.prototype,"classList",{get:function(){return new n(this)}}),window.DOMTokenList&&!DOMTokenList.prototype.replace&&(DOMTokenList.prototype.replace=n.prototype.replace)}();var blogloGetIndex=function(e){for(var t=0;e=e.previousElementSibling;)t++;return t},blogloSlideUp=(e,t=500)=>{e.style.transitionProperty="height, margin, padding",e.style.transitionDuration=t+"ms",e.style.boxSizing="border-box",e.style.height=e.offsetHeight+"px",e.offsetHeight,e.style.overflow="hidden",e.style.height=0,e.style.paddingTop=0,e.style.paddingBottom=0,e.style.marginTop=0,e.style.marginBottom=0,window.setTimeout((()=>{e.style.display=null,e.style.removeProperty("height"),e.style.removeProperty("padding-top"),e.style.removeProperty("padding-bottom"),e.style.removeProperty("margin-top"),e.style.removeProperty("margin-bottom"),e.style.removeProperty("overflow"),e.style.removeProperty("transition-duration"),e.style.removeProperty("transition-property")}),t)},blogloSlideDown=(e,t=500)=>{e.style.removeProperty("display");let o=window.getComputedStyle(e).display;"none"===o&&(o="block"),e.style.display=o;let n=e.offsetHeight;e.style.overflow="hidden",e.style.height=0,e.style.paddingTop=0,e.style.paddingBottom=0,e.style.marginTop=0,e.style.marginBottom=0,e.offsetHeight,e.style.boxSizing="border-box",e.style.transitionProperty="height, margin, padding",e.style.transitionDuration=t+"ms",e.style.height=n+"px",e.style.removeProperty("padding-top"),e.style.removeProperty("padding-bottom"),e.style.removeProperty("margin-top"),e.style.removeProperty("margin-bottom"),window.setTimeout((()=>{e.style.removeProperty("height"),e.style.removeProperty("overflow"),e.style.removeProperty("transition-duration"),e.style.removeProperty("transition-property")}),t)},blogloScrollTo=function(){var e={tolerance:0,duration:800,easing:"easeOutQuart",container:window,callback:function(){}};function t(e,t,o,n){return e/=n,-o*(--e*e*e*e-1)+t}function o(e,t){var o={};return Object.keys(e).forEach((function(t){o[t]=e[t]})),Object.keys(t).forEach((function(e){o[e]=t[e]})),o}function n(e){return e instanceof HTMLElement?e.scrollTop:e.pageYOffset}function l(){var n=0<arguments.length&&void 0!==arguments[0]?arguments[0]:{},l=1<arguments.length&&void 0!==arguments[1]?arguments[1]:{};this.options=o(e,n),this.easeFunctions=o({easeOutQuart:t},l)}return l.prototype.registerTrigger=function(e,t){var n=this;if(e){var l=e.getAttribute("href")||e.getAttribute("data-target"),i=l&&"#"!==l?document.getElementById(l.substring(1)):document.body,r=o(this.options,function(e,t){var o={};return Object.keys(t).forEach((function(t){var n=e.getAttribute("data-mt-".concat(t.replace(/([A-Z])/g,(function(e){return"-"+e.toLowerCase()}))));n&&(o[t]=isNaN(n)?n:parseInt(n,10))})),o}(e,this.options));"function"==typeof t&&(r.callback=t);var s=function(e){e.preventDefault(),n.move(i,r)};return e.addEventListener("click",s,!1),function(){return e.removeEventListener("click",s,!1)}}},l.prototype.move=function(e){var t=this,l=1<arguments.length&&void 0!==arguments[1]?arguments[1]:{};if(0===e||e){l=o(this.options,l);var i,r="number"==typeof e?e:e.getBoundingClientRect().top,s=n(l.container),c=null;r-=l.tolerance;window.requestAnimationFrame((function o(a){var d=n(t.options.container);c||(c=a-1);var u=a-c;if(i&&(0<r&&i>d||0>r&&i<d))return l.callback(e);i=d;var m=t.easeFunctions[l.easing](u,s,r,l.duration);l.container.scroll(0,m),u<l.duration?window.requestAnimationFrame(o):(l.container.scroll(0,r+s),l.callback(e))}))}},l.prototype.addEaseFunction=function(e,t){this.easeFunctions[e]=t},l}(),blogloGetParents=(e,t)=>{Element.prototype.matches||(Element.prototype.matches=Element.prototype.matchesSelector||Element.prototype.mozMatchesSelector||Element.prototype.msMatchesSelector||Element.prototype.oMatchesSelector||Element.prototype.webkitMatchesSelector||function(e){for(var t=(this.document||this.ownerDocument).querySelectorAll(e),o=t.length;0<=--o&&t.item(o)!==this;);return-1<o});for(var o=[];e&&e!==document;e=e.parentNode)t?e.matches(t)&&o.push(e):o.push(e);return o};!function(){if("function"==typeof window.CustomEvent)return!1;function e(e,t){t=t||{bubbles:!1,cancelable:!1,detail:void 0};var o=document.createEvent("CustomEvent");return o.initCustomEvent(e,t.bubbles,t.cancelable,t.detail),o}e.prototype=window.Event.prototype,window.CustomEvent=e}();var blogloTriggerEvent=function(e,t){var o=new CustomEvent(t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:{});e.dispatchEvent(o)};!function(){var e=document.querySelector("#bloglo-scroll-top"),t=document.getElementById("page"),o=()=>{var e,t,o;document.body.classList.contains("bloglo-is-mobile")||(o=window.innerWidth,document.querySelectorAll(".sub-menu").forEach((n=>{n.style.visibility="visible";const l=n.getBoundingClientRect();t=l.left+window.pageXOffset,e=t+l.width,n.removeAttribute("style"),e>o?n.closest("li").classList.add("opens-left"):0>t&&n.closest("li").classList.add("opens-right")})))},n=e=>{var t;return function(){var o=arguments;t&&window.cancelAnimationFrame(t),t=window.requestAnimationFrame((function(){e.apply(this,o)}))}},l=()=>{null!==e&&(450<window.pageYOffset||450<document.documentElement.scrollTop?e.classList.add("bloglo-visible"):e.classList.remove("bloglo-visible"))},i=()=>{if(bloglo_vars["sticky-header"].enabled){var e=document.getElementById("bloglo-header"),t=document.getElementById("bloglo-header-inner"),o=document.getElementById("wpadminbar");if((document.body.classList.contains("bloglo-header-layout-3")||document.body.classList.contains("bloglo-header-layout-4"))&&(e=document.querySelector("#bloglo-header .bloglo-nav-container"),t=document.querySelector("#bloglo-header .bloglo-nav-container .bloglo-container")),window.outerWidth<=bloglo_vars["responsive-breakpoint"])e=document.getElementById("bloglo-header"),t=document.getElementById("bloglo-header-inner");if(null!==e&&null!==t){var l,i,r=e.getBoundingClientRect().bottom,s=0>=r-l;l=null===o||600>=window.outerWidth?0:o.getBoundingClientRect().height;var c=function(){l=null===o||600>=window.outerWidth?0:o.getBoundingClientRect().height,r=e.getBoundingClientRect().bottom,s=0>=r-l,a()},a=function(){let o=bloglo_vars["sticky-header"].hide_on;o.includes("desktop")&&992<=window.innerWidth&&(s=!1),o.includes("tablet")&&481<=window.innerWidth&&992>window.innerWidth&&(s=!1),o.includes("mobile")&&481>window.innerWidth&&(s=!1),s?document.body.classList.contains("bloglo-sticky-header")||((i=document.createElement("div")).setAttribute("id","bloglo-sticky-placeholder"),i.style.height=t.getBoundingClientRect().height+"px",e.appendChild(i),document.body.classList.add("bloglo-sticky-header"),document.body.style.setProperty("--bloglo-sticky-h-offset",e.offsetHeight+20+"px")):(document.body.classList.contains("bloglo-sticky-header")&&(document.body.classList.remove("bloglo-sticky-header"),document.getElementById("bloglo-sticky-placeholder").remove()),document.body.style.removeProperty("--bloglo-sticky-h-offset"))};"true"!==e.getAttribute("data-scroll-listener")&&(window.addEventListener("scroll",(function(){n(c())})),e.setAttribute("data-scroll-listener","true")),"true"!==e.getAttribute("data-resize-listener")&&(window.addEventListener("resize",(function(){n(c())})),e.setAttribute("data-resize-listener","true")),blogloTriggerEvent(window,"scroll")}}};function r(){for(var e=this;!e.classList.contains("bloglo-nav");)"li"===e.tagName.toLowerCase()&&(e.classList.contains("hovered")?e.classList.remove("hovered"):e.classList.add("hovered")),e=e.parentElement}var s=()=>{document.body.style.setProperty("--bloglo-screen-width",document.body.clientWidth+"px")},c=(e=0)=>{if(null!==document.getElementById("bloglo-preloader")){var t=()=>{document.body.classList.contains("bloglo-loaded")||(document.body.classList.add("bloglo-loading"),setTimeout((function(){document.body.classList.replace("bloglo-loading","bloglo-loaded"),blogloTriggerEvent(document.body,"bloglo-preloader-done")}),250))};return 0<e?setTimeout((function(){t()}),e):t(),!1}},a=()=>{window.innerWidth<=bloglo_vars["responsive-breakpoint"]?document.body.classList.add("bloglo-is-mobile"):document.body.classList.contains("bloglo-is-mobile")&&(document.body.classList.remove("bloglo-is-mobile"),blogloTriggerEvent(document,"bloglo-close-mobile-menu"))};document.addEventListener("DOMContentLoaded",(function(){var e,n;c(5e3),document.body.classList.contains("bloglo-menu-accessibility")&&document.querySelectorAll(".bloglo-nav").forEach((e=>{e.querySelectorAll("ul").forEach((e=>{e.parentNode.setAttribute("aria-haspopup","true")})),e.querySelectorAll("a").forEach((e=>{e.addEventListener("focus",r,!0),e.addEventListener("blur",r,!0)}))})),document.body.addEventListener("keydown",(function(e){document.body.classList.add("using-keyboard")})),document.body.addEventListener("mousedown",(function(e){document.body.classList.remove("using-keyboard")})),l(),(()=>{const e=new blogloScrollTo({tolerance:null===document.getElementById("wpadminbar")?0:document.getElementById("wpadminbar").getBoundingClientRect().height}),t=document.getElementsByClassName("bloglo-smooth-scroll");for(var o=0;o<t.length;o++)e.registerTrigger(t[o])})(),e=null,document.querySelectorAll(".bloglo-nav .menu-item-has-children").forEach((e=>{e.addEventListener("mouseenter",(function(){document.querySelectorAll(".menu-item-has-children").forEach((e=>{e.classList.remove("hovered")}))}))})),document.querySelectorAll(".bloglo-nav .menu-item-has-children").forEach((t=>{t.addEventListener("mouseleave",(function(){t.classList.add("hovered"),null!==e&&(clearTimeout(e),e=null),e=setTimeout((()=>{t.classList.remove("hovered"),t.querySelectorAll(".menu-item-has-children").forEach((e=>{e.classList.remove("hovered")}))}),700)}))})),(()=>{if(document.body.classList.contains("bloglo-has-comments-toggle")&&null!=document.getElementById("bloglo-comments-toggle")){var e=e=>{void 0!==e&&e.preventDefault(),document.body.classList.contains("comments-visible")?(document.body.classList.remove("comments-visible"),document.getElementById("bloglo-comments-toggle").querySelector("span").innerHTML=bloglo_vars.strings.comments_toggle_show):(document.body.classList.add("comments-visible"),document.getElementById("bloglo-comments-toggle").querySelector("span").innerHTML=bloglo_vars.strings.comments_toggle_hide)};null===document.getElementById("bloglo-comments-toggle")||-1===location.href.indexOf("#comment")&&-1===location.href.indexOf("respond")||e(),document.getElementById("bloglo-comments-toggle").addEventListener("click",e)}})(),(()=>{var e=document.querySelectorAll(".bloglo-search");if(0!==e.length){e.forEach((e=>{e.addEventListener("click",(t=>{t.preventDefault(),e.classList.contains("bloglo-active")?n(e):o(e)}))})),document.querySelectorAll(".bloglo-search-close").forEach((e=>e.addEventListener("click",(function(t){t.preventDefault(),e.classList.contains("bloglo-active")||(n(document.querySelector(".bloglo-search")),document.querySelector(".bloglo-search").focus())}))));var o=function(e){document.querySelectorAll(".bloglo-search-form").forEach((function(e){if(!e)return!1;document.addEventListener("keydown",(function(t){var o,n,l,i,r;l=(n=e.querySelectorAll("input, a, button"))[n.length-1],o=n[0],i=9===t.keyCode,!(r=t.shiftKey)&&i&&l===document.activeElement&&(t.preventDefault(),o.focus()),r&&i&&o===document.activeElement&&(t.preventDefault(),l.focus())}))})),document.body.classList.add("bloglo-search-visible"),setTimeout((function(){e.classList.add("bloglo-active"),null!==e.nextElementSibling&&null!==e.nextElementSibling.querySelector("input")&&(e.nextElementSibling.querySelector("input").focus(),e.nextElementSibling.querySelector("input").select())}),100),document.addEventListener("keydown",l),t.addEventListener("click",i)},n=function(e){document.body.classList.remove("bloglo-search-visible"),e.classList.remove("bloglo-active"),document.removeEventListener("keydown",l),t.removeEventListener("click",i)},l=function(e){27==e.keyCode&&document.querySelectorAll(".bloglo-search").forEach((e=>{n(e)}))},i=function(e){null===e.target.closest(".bloglo-search-container")&&null===e.target.closest(".bloglo-search")&&document.querySelectorAll(".bloglo-search").forEach((e=>{n(e)}))}}})(),(()=>{var e=t,o=document.querySelector("#bloglo-header-inner .bloglo-nav");document.querySelectorAll(".bloglo-mobile-nav > button").forEach((e=>{e.addEventListener("click",(function(e){e.preventDefault(),document.body.parentNode.classList.contains("is-mobile-menu-active")?l():n()}),!1)})),document.addEventListener("keydown",(function(e){var t,o,n,l,i,r;o=document.querySelector(".bloglo-mobile-nav"),r=document.querySelector(".bloglo-hamburger-bloglo-primary-nav"),l=(n=o.querySelectorAll('button, [href], input, select, textarea, [tabindex]:not([tabindex="-1"])'))[n.length-1],t=r,e.keyCode,i=e.shiftKey;let s="Tab"===e.key||9===e.keyCode;if(document.body.parentNode.classList.contains("is-mobile-menu-active")){if(!s)return;i?document.activeElement===t&&(l.focus(),e.preventDefault()):document.activeElement===l&&(t.focus(),e.preventDefault())}}));var n=function(t){var n=document.querySelectorAll(".site-header");document.body.classList.contains("bloglo-is-mobile")&&n.forEach((function(e){if(!e)return!1})),document.body.parentNode.classList.add("is-mobile-menu-active"),document.addEventListener("keyup",r),null!==e&&e.addEventListener("click",i),document.querySelectorAll("#bloglo-header .bloglo-nav").forEach((e=>{e.addEventListener("click",s)})),blogloSlideDown(o,350)},l=function(t){document.body.parentNode.classList.remove("is-mobile-menu-active"),document.removeEventListener("keyup",r),null!==e&&e.removeEventListener("click",i),document.querySelectorAll("#bloglo-header .bloglo-nav > ul > .bloglo-open").forEach((e=>{c(e)})),o.querySelectorAll(".hovered").forEach((e=>{e.classList.remove("hovered")})),document.body.classList.contains("bloglo-is-mobile")?(document.querySelectorAll("#bloglo-header .bloglo-nav").forEach((e=>{e.removeEventListener("click",s)})),blogloSlideUp(o,250)):o.style.display=null},i=function(e){null===e.target.closest(".bloglo-hamburger")&&null===e.target.closest(".site-navigation")&&l()},r=function(e){27==e.keyCode&&l()},s=function(e){e.target.parentElement.querySelectorAll(".sub-menu").length&&(e.preventDefault(),"button"===e.target.type&&c(e.target.parentElement))},c=e=>{e.classList.contains("bloglo-open")?(e.classList.remove("bloglo-open"),e.querySelectorAll(".sub-menu").forEach((e=>{blogloSlideUp(e,350)})),e.querySelectorAll("li").forEach((e=>{e.classList.remove("bloglo-open"),e.querySelectorAll(".sub-menu").forEach((e=>{blogloSlideUp(e,350)}))}))):(e.querySelectorAll(".sub-menu").forEach((t=>{e===t.parentElement&&blogloSlideDown(t,350)})),e.classList.add("bloglo-open"))};document.addEventListener("bloglo-close-mobile-menu",l)})(),a(),o(),null!==(n=document.querySelector(".single .comments-link"))&&n.addEventListener("click",(function(e){document.body.classList.contains("bloglo-has-comments-toggle")&&!document.body.classList.contains("comments-visible")&&document.getElementById("bloglo-comments-toggle").click()})),(()=>{var e=null;document.querySelectorAll(".bloglo-header-widget__cart .bloglo-widget-wrapper").forEach((e=>{e.addEventListener("mouseenter",(function(){e.classList.remove("dropdown-visible")}))})),document.querySelectorAll(".bloglo-header-widget__cart .bloglo-widget-wrapper").forEach((t=>{t.addEventListener("mouseleave",(function(){t.classList.add("dropdown-visible"),null!==e&&(clearTimeout(e),e=null),e=setTimeout((()=>{t.classList.remove("dropdown-visible")}),700)}))}))})(),i(),s()})),window.addEventListener("load",(function(){c()})),window.addEventListener("scroll",(function(){n(l())})),window.addEventListener("resize",(function(){n(o()),n(a()),n(s())})),blogloTriggerEvent(document.body,"bloglo-ready"),window.bloglo=window.bloglo||{},window.bloglo.preloader=c,window.bloglo.stickyHeader=i,window.App={},App.config={headroom:{enabled:!0,options:{classes:{initial:"headroom",pinned:"is-pinned",unpinned:"is-unpinned",top:"is-top",notTop:"is-not-top",bottom:"is-bottom",notBottom:"is-not-bottom",frozen:"is-frozen"}}},ajax:{enabled:!0},cursorFollower:{enabled:!0,disableBreakpoint:"992"}},App.html=document.querySelector("html"),App.body=document.querySelector("body"),window.onload=function(){App.config.cursorFollower.enabled&&d.init()};const d=function(){const e=document.querySelector(".bloglo-js-cursor");let t,o,n,l,i,r,s,c,a;function d({target:t}){if(e.classList.add("is-active"),t.getAttribute("data-cursor-label")&&(App.body.classList.add("is-cursor-active"),e.classList.add("has-label"),o.innerHTML=t.getAttribute("data-cursor-label")),t.getAttribute("data-cursor-icon")){App.body.classList.add("is-cursor-active"),e.classList.add("has-icon");t.getAttribute("data-cursor-icon")}}function u({target:t}){App.body.classList.remove("is-cursor-active"),e.classList.remove("is-active"),e.classList.remove("has-label"),e.classList.remove("has-icon"),o.innerHTML="",n.innerHTML=""}function m(){e&&(c=document.querySelectorAll(["button","a","input","[data-cursor]","[data-cursor-label]","[data-cursor-icon]","textarea"]),c.forEach((e=>{e.addEventListener("mouseenter",d),e.addEventListener("mouseleave",u)})))}function g(){e&&c.forEach((e=>{e.removeEventListener("mouseenter",d),e.removeEventListener("mouseleave",u)}))}return{init:function(){if(!e)return;t=e.querySelector(".bloglo-js-follower"),o=e.querySelector(".bloglo-js-label"),n=e.querySelector(".bloglo-js-icon"),l=-100,i=-100,r=e.offsetWidth/2,s=e.offsetHeight/2,a=!1,a=!0,e.classList.add("is-enabled"),document.addEventListener("mousedown",(t=>{e.classList.add("is-mouse-down")})),document.addEventListener("mouseup",(t=>{e.classList.remove("is-mouse-down")})),document.addEventListener("mousemove",(e=>{l=e.clientX,i=e.clientY}));const c=()=>{e.style.transform=`translate(${l-r}px, ${i-s}px)`,requestAnimationFrame(c)};requestAnimationFrame(c),m(),function(){if(!a)return;if(!App.config.cursorFollower.disableBreakpoint)return;(0<window.innerWidth?window.innerWidth:screen.width)<App.config.cursorFollower.disableBreakpoint?(a=!1,e.classList.remove("is-enabled"),g()):(a=!0,e.classList.add("is-enabled"),m());window.addEventListener("resize",(()=>{(0<window.innerWidth?window.innerWidth:screen.width)<App.config.cursorFollower.disableBreakpoint?(a=!1,e.classList.remove("is-enabled"),g()):(a=!0,e.classList.add("is-enabled"),m())}))}()},update:m,clear:g,hide:function(){e&&e.classList.add("is-hidden")},show:function(){e&&e.classList.remove("is-hidden")}}}();if(document.body.classList.contains("is-parallax-footer")){var u=document.querySelector(".is-parallax-footer");function m(e,t){var o;!function(e){return window.innerHeight<e.offsetHeight}(t)?(t.style.top="",t.style.bottom="0"):(t.style.bottom="",t.style.top="0"),window.scrollY>(o=e).offsetTop+o.offsetHeight?(t.style.position="static",u.style.marginBottom="0"):(u.style.marginBottom=t.offsetHeight+"px",t.style.position="fixed")}g=document.getElementById("main"),(b=document.getElementById("colophon")).style.left="0",b.style.right="0",b.style.zIndex="-1",m(g,b),window.addEventListener("resize",(function(){m(g,b)})),window.addEventListener("scroll",(function(){m(g,b)}))}var g,b;document.addEventListener("DOMContentLoaded",(function(){const e=document.querySelector('.bloglo-darkmode input[type="checkbox"]');if(e){let o=bloglo_vars.dark_mode||"dark"===localStorage.getItem("darkmode");function t(t){t?(document.documentElement.setAttribute("data-theme","dark"),localStorage.setItem("darkmode","dark"),e.classList.add("active")):(document.documentElement.setAttribute("data-theme","light"),localStorage.setItem("darkmode","light"),e.classList.remove("active"))}t(o),e.addEventListener("change",(function(){o=!o,t(o)}))}}))}(),function(e){e(document).ready((function(){if(e("#bloglo-time").length){setInterval((function(){!function(){let e=new Date;document.getElementById("bloglo-time").innerHTML=e.toLocaleTimeString()}()}),1e3)}if(e("#bloglo-date").length){const e=new Date,t={weekday:"short",month:"short",day:"numeric",year:"numeric"};document.getElementById("bloglo-date").innerHTML=e.toLocaleString(document.documentElement.lang,t)}let t=e(".ticker-slider-items"),o="left";if(e("body").hasClass("rtl")&&(hrtl=!0,o="right"),t.length){let n=t.find(".ticker-slider-wrap").marquee({speed:50,duration:14e3,gap:0,delayBeforeStart:0,direction:o,duplicated:!0,startVisible:!0,pauseOnHover:!0});t.on("click",".ticker-slider-pause",(function(){e(this).find("i").toggleClass("fa-pause fa-play"),n.marquee("toggle")}))}e(".masonries").length&&setTimeout((()=>{e(".masonries").masonry({itemSelector:".masonries > *"})}),500)}))}(jQuery);
\ No newline at end of file